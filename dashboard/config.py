@@ -10,3 +10,15 @@ DEFAULT_METRICS_LIMIT = 1000
 DEFAULT_LOGS_LIMIT = 10
 CHART_HEIGHT = 400
 CHART_THEME = "plotly_white"
+YOUTUBE_PERIOD_KEYS = ["engagement_rate", "avg_views_per_video", "total_views"]
+PLATFORM_EXTRA_KEYS = {
+    "youtube": [
+        *[f"metrics_{period}.{key}" for period in ("7d", "30d", "90d") for key in YOUTUBE_PERIOD_KEYS],
+        "metrics_30d.avg_likes_per_video",
+        "metrics_30d.avg_comments_per_video",
+        "recent_videos",
+    ],
+    "tiktok": ["recent_videos"],
+    "telegram": ["avg_views"],
+    "vk": ["avg_likes_per_post", "avg_comments_per_post", "avg_shares_per_post"],
+}
@@ -1,9 +1,11 @@
 import httpx
-from typing import List, Optional, Dict, Any
+from collections import OrderedDict
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 from uuid import UUID
 import streamlit as st
 from dashboard.config import API_BASE_URL, DEFAULT_METRICS_LIMIT, DEFAULT_LOGS_LIMIT
+ETAG_CACHE_SIZE = 64
 class APIClient:
     def __init__(self, base_url: str = API_BASE_URL, timeout: float = 30.0):
         self.base_url = base_url
@@ -13,6 +15,24 @@ class APIClient:
             timeout=timeout,
             headers={"Content-Type": "application/json"}
         )
+        self.etags: "OrderedDict[str, Tuple[str, httpx.Response]]" = OrderedDict()
+    def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> httpx.Response:
+        request = self.client.build_request("GET", path, params=params)
+        key = str(request.url)
+        cached = self.etags.get(key)
+        if cached:
+            request.headers["If-None-Match"] = cached[0]
+        response = self.client.send(request)
+        if response.status_code == 304 and cached:
+            self.etags.move_to_end(key)
+            return cached[1]
+        etag = response.headers.get("ETag")
+        if response.is_success and etag:
+            self.etags[key] = (etag, response)
+            self.etags.move_to_end(key)
+            while len(self.etags) > ETAG_CACHE_SIZE:
+                self.etags.popitem(last=False)
+        return response
     def get_accounts(
         self,
         platform: Optional[str] = None,
@@ -23,7 +43,7 @@ class APIClient:
             params["platform"] = platform
         if is_active is not None:
             params["is_active"] = is_active
-        response = self.client.get("/accounts", params=params)
+        response = self._get("/accounts", params=params)
         response.raise_for_status()
         return response.json()
     def update_account_status(self, account_id: UUID, is_active: bool) -> Dict:
@@ -39,9 +59,15 @@ class APIClient:
         platform: Optional[str] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-        limit: int = DEFAULT_METRICS_LIMIT
+        limit: int = DEFAULT_METRICS_LIMIT,
+        fields: Optional[List[str]] = None,
+        extra_keys: Optional[List[str]] = None
     ) -> List[Dict]:
         params = {"limit": limit}
+        if fields is not None:
+            params["fields"] = ",".join(fields)
+        if extra_keys is not None:
+            params["extra_keys"] = ",".join(extra_keys)
         if account_id:
             params["account_id"] = str(account_id)
         if platform:
@@ -50,11 +76,83 @@ class APIClient:
             params["start_date"] = start_date.isoformat()
         if end_date:
             params["end_date"] = end_date.isoformat()
-        response = self.client.get("/metrics", params=params)
+        response = self._get("/metrics", params=params)
+        response.raise_for_status()
+        return response.json()
+    def get_metrics_arrow(
+        self,
+        account_id: Optional[UUID] = None,
+        platform: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = DEFAULT_METRICS_LIMIT,
+        fields: Optional[List[str]] = None,
+        extra_keys: Optional[List[str]] = None
+    ) -> bytes:
+        params = {"format": "arrow", "limit": limit}
+        if account_id:
+            params["account_id"] = str(account_id)
+        if platform:
+            params["platform"] = platform
+        if start_date:
+            params["start_date"] = start_date.isoformat()
+        if end_date:
+            params["end_date"] = end_date.isoformat()
+        if fields is not None:
+            params["fields"] = ",".join(fields)
+        if extra_keys is not None:
+            params["extra_keys"] = ",".join(extra_keys)
+        response = self._get("/metrics", params=params)
+        response.raise_for_status()
+        return response.content
+    def get_timeseries(
+        self,
+        account_ids: List[UUID],
+        metrics: List[str],
+        bucket: str = "day",
+        agg: str = "last",
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> Dict:
+        params: Dict[str, Any] = {
+            "account_id": [str(account_id) for account_id in account_ids],
+            "metrics": ",".join(metrics),
+            "bucket": bucket,
+            "agg": agg,
+        }
+        if start_date:
+            params["start_date"] = start_date.isoformat()
+        if end_date:
+            params["end_date"] = end_date.isoformat()
+        response = self._get("/timeseries", params=params)
+        response.raise_for_status()
+        return response.json()
+    def get_overview(self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> Dict:
+        params = {}
+        if start_date:
+            params["start"] = start_date.isoformat()
+        if end_date:
+            params["end"] = end_date.isoformat()
+        response = self._get("/overview", params=params)
+        response.raise_for_status()
+        return response.json()
+    def get_growth(
+        self,
+        period: str = "7d",
+        compare: str = "previous",
+        platform: Optional[str] = None,
+        end_date: Optional[datetime] = None
+    ) -> Dict:
+        params = {"period": period, "compare": compare}
+        if platform:
+            params["platform"] = platform
+        if end_date:
+            params["end"] = end_date.isoformat()
+        response = self._get("/growth", params=params)
         response.raise_for_status()
         return response.json()
     def get_collection_logs(self, limit: int = DEFAULT_LOGS_LIMIT) -> List[Dict]:
-        response = self.client.get("/logs", params={"limit": limit})
+        response = self._get("/logs", params={"limit": limit})
         response.raise_for_status()
         return response.json()
     def trigger_collection(self, platform: Optional[str] = None) -> Dict:
@@ -1,8 +1,10 @@
+import importlib.util
 import streamlit as st
 import pandas as pd
 from typing import List, Dict, Optional
 from datetime import datetime
-from dashboard.config import CACHE_TTL, LOGS_CACHE_TTL
+from dashboard.config import CACHE_TTL, LOGS_CACHE_TTL, PLATFORM_EXTRA_KEYS
+ARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
 @st.cache_data(ttl=CACHE_TTL)
 def fetch_accounts_cached(platform: Optional[str] = None, is_active: bool = True) -> List[Dict]:
     from dashboard.services.api_client import get_api_client
@@ -18,14 +20,30 @@ def fetch_metrics_cached(
     from dashboard.services.api_client import get_api_client
     from dashboard.services.data_processor import MetricsProcessor
     client = get_api_client()
+    processor = MetricsProcessor()
+    extra_keys = PLATFORM_EXTRA_KEYS.get(platform, [])
+    if ARROW_AVAILABLE:
+        payload = client.get_metrics_arrow(
+            platform=platform,
+            start_date=start_date,
+            end_date=end_date,
+            account_id=account_id,
+            extra_keys=extra_keys
+        )
+        return processor.from_arrow(payload)
     metrics = client.get_metrics(
         platform=platform,
         start_date=start_date,
         end_date=end_date,
-        account_id=account_id
+        account_id=account_id,
+        extra_keys=extra_keys
     )
-    processor = MetricsProcessor()
     return processor.to_dataframe(metrics)
+@st.cache_data(ttl=CACHE_TTL)
+def fetch_overview_cached(start_date: datetime, end_date: datetime) -> Dict:
+    from dashboard.services.api_client import get_api_client
+    client = get_api_client()
+    return client.get_overview(start_date=start_date, end_date=end_date)
 @st.cache_data(ttl=LOGS_CACHE_TTL)
 def fetch_collection_logs_cached(limit: int = 10) -> pd.DataFrame:
     from dashboard.services.api_client import get_api_client
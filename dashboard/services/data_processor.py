@@ -1,3 +1,4 @@
+import json
 import pandas as pd
 from typing import List, Dict, Optional
 from datetime import datetime
@@ -14,6 +15,19 @@ class MetricsProcessor:
             df = pd.concat([df.drop('extra_data', axis=1), extra_df], axis=1)
         return df
     @staticmethod
+    def from_arrow(payload: bytes) -> pd.DataFrame:
+        import pyarrow as pa
+        table = pa.ipc.open_stream(payload).read_all()
+        if table.num_rows == 0:
+            return pd.DataFrame()
+        df = table.to_pandas()
+        df = df.sort_values('collected_at').reset_index(drop=True)
+        for field in table.schema:
+            if field.metadata == {b'encoding': b'json'}:
+                df[field.name] = [json.loads(value) if isinstance(value, str) else None for value in df[field.name]]
+        empty = [field.name for field in table.schema if field.metadata and df[field.name].isna().all()]
+        return df.drop(columns=empty)
+    @staticmethod
     def calculate_growth(df: pd.DataFrame, metric: str) -> pd.DataFrame:
         if df.empty or metric not in df.columns:
             return df
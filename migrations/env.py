@@ -9,9 +9,20 @@ from alembic import context
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.config.settings import get_settings
 from src.models.account import Account
+from src.models.account_latest_metric import AccountLatestMetric
+from src.models.account_profile_attribute import AccountProfileAttribute
 from src.models.base import Base
+from src.models.circuit_breaker import CircuitBreaker
+from src.models.collection_account_result import CollectionAccountResult
 from src.models.collection_log import CollectionLog
+from src.models.content_item import ContentItem
+from src.models.content_item_stat import ContentItemStat
+from src.models.extra_data_blob import ExtraDataBlob
 from src.models.metric import Metric
+from src.models.metric_rollup import MetricRollupDay, MetricRollupHour, MetricRollupWeek
+from src.models.raw_payload import RawPayload
+from src.models.recompute_job import RecomputeJob
+from src.models.retention_watermark import RetentionWatermark
 config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
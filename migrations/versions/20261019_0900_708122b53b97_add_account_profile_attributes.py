@@ -0,0 +1,23 @@
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+revision: str = '708122b53b97'
+down_revision: Union[str, None] = '98b36e533eb9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+def upgrade() -> None:
+    op.create_table(
+        'account_profile_attributes',
+        sa.Column('account_id', postgresql.UUID(as_uuid=True), nullable=False, comment='Reference to account'),
+        sa.Column('field', sa.String(length=100), nullable=False, comment='Profile field name (bio_description, avatar_url, etc.)'),
+        sa.Column('refresh_group', sa.String(length=20), nullable=False, comment='Refresh cadence group (profile, audience)'),
+        sa.Column('value', postgresql.JSONB(astext_type=sa.Text()), nullable=True, comment='Cached field value'),
+        sa.Column('refreshed_at', sa.DateTime(timezone=True), nullable=False, comment='When the field was last fetched from the platform'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['account_id'], ['accounts.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('account_id', 'field')
+    )
+def downgrade() -> None:
+    op.drop_table('account_profile_attributes')
@@ -0,0 +1,30 @@
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+revision: str = '4ead498b9318'
+down_revision: Union[str, None] = '708122b53b97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+def upgrade() -> None:
+    op.create_table(
+        'circuit_breakers',
+        sa.Column('key', sa.String(length=300), nullable=False, comment='Breaker key (platform:credential)'),
+        sa.Column('platform', sa.String(length=50), nullable=False, comment='Platform name'),
+        sa.Column('credential', sa.String(length=255), nullable=False, comment="Credential scope (account UUID for OAuth platforms, 'default' for shared keys)"),
+        sa.Column('state', sa.String(length=20), nullable=False, comment='State: closed, open, half_open'),
+        sa.Column('failure_count', sa.Integer(), nullable=False, comment='Consecutive failures since last success'),
+        sa.Column('opened_at', sa.DateTime(timezone=True), nullable=True, comment='When the breaker last opened or started a half-open trial'),
+        sa.Column('last_failure_at', sa.DateTime(timezone=True), nullable=True, comment='Last failure timestamp'),
+        sa.Column('last_error', sa.Text(), nullable=True, comment='Last failure message'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('key')
+    )
+    op.create_index(op.f('ix_circuit_breakers_platform'), 'circuit_breakers', ['platform'], unique=False)
+    op.add_column(
+        'collection_logs',
+        sa.Column('accounts_skipped', sa.Integer(), server_default='0', nullable=False, comment='Number of accounts skipped (open circuit or platform unavailable)')
+    )
+def downgrade() -> None:
+    op.drop_column('collection_logs', 'accounts_skipped')
+    op.drop_index(op.f('ix_circuit_breakers_platform'), table_name='circuit_breakers')
+    op.drop_table('circuit_breakers')
@@ -0,0 +1,14 @@
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+revision: str = 'e0dc1a0094a4'
+down_revision: Union[str, None] = '4ead498b9318'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+def upgrade() -> None:
+    op.add_column(
+        'collection_logs',
+        sa.Column('accounts_timed_out', sa.Integer(), server_default='0', nullable=False, comment='Number of accounts that exceeded their collection time budget')
+    )
+def downgrade() -> None:
+    op.drop_column('collection_logs', 'accounts_timed_out')
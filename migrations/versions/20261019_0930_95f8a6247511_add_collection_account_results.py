@@ -0,0 +1,28 @@
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+revision: str = '95f8a6247511'
+down_revision: Union[str, None] = 'e0dc1a0094a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+def upgrade() -> None:
+    op.create_table(
+        'collection_account_results',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('log_id', postgresql.UUID(as_uuid=True), nullable=False, comment='Reference to collection run'),
+        sa.Column('account_id', postgresql.UUID(as_uuid=True), nullable=False, comment='Reference to account'),
+        sa.Column('status', sa.String(length=20), nullable=False, comment='Outcome: success, failed, timed_out, skipped'),
+        sa.Column('error', sa.Text(), nullable=True, comment='Error or skip reason'),
+        sa.Column('attempts', sa.Integer(), nullable=False, comment='Number of attempts within this run'),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=False, comment='Start of the latest attempt'),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=False, comment='End of the latest attempt'),
+        sa.ForeignKeyConstraint(['log_id'], ['collection_logs.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['account_id'], ['accounts.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('log_id', 'account_id', name='uq_collection_account_results_log_account')
+    )
+    op.create_index(op.f('ix_collection_account_results_log_id'), 'collection_account_results', ['log_id'], unique=False)
+def downgrade() -> None:
+    op.drop_index(op.f('ix_collection_account_results_log_id'), table_name='collection_account_results')
+    op.drop_table('collection_account_results')
@@ -0,0 +1,60 @@
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+revision: str = '2b85e648bc45'
+down_revision: Union[str, None] = '95f8a6247511'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+def upgrade() -> None:
+    op.create_table(
+        'content_items',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('account_id', postgresql.UUID(as_uuid=True), nullable=False, comment='Reference to account'),
+        sa.Column('platform', sa.String(length=50), nullable=False, comment='Platform name'),
+        sa.Column('external_id', sa.String(length=255), nullable=False, comment='Platform-specific post/video ID'),
+        sa.Column('content_type', sa.String(length=50), nullable=False, comment='Content type (video, image, carousel_album, pin, post)'),
+        sa.Column('caption', sa.Text(), nullable=True, comment='Title or caption'),
+        sa.Column('url', sa.String(length=1000), nullable=True, comment='Permalink'),
+        sa.Column('published_at', sa.DateTime(timezone=True), nullable=True, comment='When the item was published'),
+        sa.Column('last_collected_at', sa.DateTime(timezone=True), nullable=False, comment='Timestamp of the latest stats snapshot'),
+        sa.Column('views', sa.Integer(), nullable=True, comment='Latest View count'),
+        sa.Column('likes', sa.Integer(), nullable=True, comment='Latest Like count'),
+        sa.Column('comments', sa.Integer(), nullable=True, comment='Latest Comment count'),
+        sa.Column('shares', sa.Integer(), nullable=True, comment='Latest Share/forward count'),
+        sa.Column('saves', sa.Integer(), nullable=True, comment='Latest Save count'),
+        sa.Column('impressions', sa.Integer(), nullable=True, comment='Latest Impressions'),
+        sa.Column('reach', sa.Integer(), nullable=True, comment='Latest Unique reach'),
+        sa.Column('engagement_rate', sa.Float(), nullable=True, comment='Latest Engagement rate percentage'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['account_id'], ['accounts.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('account_id', 'external_id', name='uq_content_items_account_external')
+    )
+    op.create_index('ix_content_items_platform_published', 'content_items', ['platform', 'published_at'], unique=False)
+    op.create_index('ix_content_items_platform_views', 'content_items', ['platform', 'views'], unique=False)
+    op.create_index('ix_content_items_account_published', 'content_items', ['account_id', 'published_at'], unique=False)
+    op.create_table(
+        'content_item_stats',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('content_item_id', postgresql.UUID(as_uuid=True), nullable=False, comment='Reference to content item'),
+        sa.Column('collected_at', sa.DateTime(timezone=True), nullable=False, comment='Timestamp when the snapshot was collected'),
+        sa.Column('views', sa.Integer(), nullable=True, comment='View count'),
+        sa.Column('likes', sa.Integer(), nullable=True, comment='Like count'),
+        sa.Column('comments', sa.Integer(), nullable=True, comment='Comment count'),
+        sa.Column('shares', sa.Integer(), nullable=True, comment='Share/forward count'),
+        sa.Column('saves', sa.Integer(), nullable=True, comment='Save count'),
+        sa.Column('impressions', sa.Integer(), nullable=True, comment='Impressions'),
+        sa.Column('reach', sa.Integer(), nullable=True, comment='Unique reach'),
+        sa.Column('engagement_rate', sa.Float(), nullable=True, comment='Engagement rate percentage'),
+        sa.ForeignKeyConstraint(['content_item_id'], ['content_items.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('content_item_id', 'collected_at', name='uq_content_item_stats_item_collected')
+    )
+def downgrade() -> None:
+    op.drop_table('content_item_stats')
+    op.drop_index('ix_content_items_account_published', table_name='content_items')
+    op.drop_index('ix_content_items_platform_views', table_name='content_items')
+    op.drop_index('ix_content_items_platform_published', table_name='content_items')
+    op.drop_table('content_items')
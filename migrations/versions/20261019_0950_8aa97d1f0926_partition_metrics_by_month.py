@@ -0,0 +1,74 @@
+from typing import Sequence, Union
+from alembic import op
+from sqlalchemy import text
+revision: str = '8aa97d1f0926'
+down_revision: Union[str, None] = '2b85e648bc45'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+METRIC_INDEXES = """
+    CREATE INDEX IF NOT EXISTS ix_metrics_account_id ON metrics(account_id);
+    CREATE INDEX IF NOT EXISTS ix_metrics_collected_at ON metrics(collected_at);
+    CREATE INDEX IF NOT EXISTS ix_metrics_account_collected_desc ON metrics(account_id, collected_at DESC);
+    CREATE INDEX IF NOT EXISTS ix_metrics_extra_data_gin ON metrics USING gin(extra_data);
+"""
+def _detach_old_table(new_name: str) -> None:
+    op.execute(text(f"ALTER TABLE metrics RENAME TO {new_name}"))
+    op.execute(text(f"ALTER TABLE {new_name} RENAME CONSTRAINT metrics_pkey TO {new_name}_pkey"))
+    op.execute(text("DROP INDEX IF EXISTS ix_metrics_account_id"))
+    op.execute(text("DROP INDEX IF EXISTS ix_metrics_collected_at"))
+    op.execute(text("DROP INDEX IF EXISTS ix_metrics_account_collected_desc"))
+    op.execute(text("DROP INDEX IF EXISTS ix_metrics_extra_data_gin"))
+def upgrade() -> None:
+    _detach_old_table("metrics_unpartitioned")
+    op.execute(
+        text("""
+            CREATE TABLE metrics (
+                LIKE metrics_unpartitioned INCLUDING DEFAULTS INCLUDING COMMENTS,
+                CONSTRAINT metrics_pkey PRIMARY KEY (id, collected_at),
+                CONSTRAINT metrics_account_id_fkey FOREIGN KEY (account_id)
+                    REFERENCES accounts(id) ON DELETE CASCADE
+            ) PARTITION BY RANGE (collected_at)
+        """)
+    )
+    op.execute(
+        text("""
+            DO $$
+            DECLARE
+                month_start date;
+                last_month date;
+            BEGIN
+                SELECT
+                    date_trunc('month', COALESCE(min(collected_at), now()) AT TIME ZONE 'UTC')::date,
+                    date_trunc('month', GREATEST(COALESCE(max(collected_at), now()), now() + interval '3 months') AT TIME ZONE 'UTC')::date
+                INTO month_start, last_month
+                FROM metrics_unpartitioned;
+                WHILE month_start <= last_month LOOP
+                    EXECUTE format(
+                        'CREATE TABLE IF NOT EXISTS %I PARTITION OF metrics FOR VALUES FROM (%L) TO (%L)',
+                        'metrics_' || to_char(month_start, '"y"YYYY"m"MM'),
+                        to_char(month_start, 'YYYY-MM-DD') || ' 00:00:00+00',
+                        to_char(month_start + interval '1 month', 'YYYY-MM-DD') || ' 00:00:00+00'
+                    );
+                    month_start := (month_start + interval '1 month')::date;
+                END LOOP;
+            END $$;
+        """)
+    )
+    op.execute(text("INSERT INTO metrics SELECT * FROM metrics_unpartitioned"))
+    op.execute(text("DROP TABLE metrics_unpartitioned"))
+    op.execute(text(METRIC_INDEXES))
+def downgrade() -> None:
+    _detach_old_table("metrics_partitioned")
+    op.execute(
+        text("""
+            CREATE TABLE metrics (
+                LIKE metrics_partitioned INCLUDING DEFAULTS INCLUDING COMMENTS,
+                CONSTRAINT metrics_pkey PRIMARY KEY (id),
+                CONSTRAINT metrics_account_id_fkey FOREIGN KEY (account_id)
+                    REFERENCES accounts(id) ON DELETE CASCADE
+            )
+        """)
+    )
+    op.execute(text("INSERT INTO metrics SELECT * FROM metrics_partitioned"))
+    op.execute(text("DROP TABLE metrics_partitioned CASCADE"))
+    op.execute(text(METRIC_INDEXES))
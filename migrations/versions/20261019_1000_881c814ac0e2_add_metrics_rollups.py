@@ -0,0 +1,52 @@
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from src.services.rollup_service import RollupService
+revision: str = '881c814ac0e2'
+down_revision: Union[str, None] = '8aa97d1f0926'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+ROLLUP_TABLES = ('metrics_rollup_hour', 'metrics_rollup_day', 'metrics_rollup_week')
+ROLLUP_UNITS = {'metrics_rollup_hour': 'hour', 'metrics_rollup_day': 'day', 'metrics_rollup_week': 'week'}
+def upgrade() -> None:
+    for table in ROLLUP_TABLES:
+        op.create_table(
+            table,
+            sa.Column('account_id', postgresql.UUID(as_uuid=True), nullable=False, comment='Reference to account'),
+            sa.Column('bucket_start', sa.DateTime(timezone=True), nullable=False, comment='Start of the aggregation bucket (UTC)'),
+            sa.Column('samples', sa.Integer(), nullable=False, comment='Number of snapshots aggregated into the bucket'),
+            sa.Column('last_collected_at', sa.DateTime(timezone=True), nullable=False, comment='Timestamp of the latest snapshot in the bucket'),
+            sa.Column('followers_last', sa.Integer(), nullable=True, comment='Last followers/subscribers in bucket'),
+            sa.Column('followers_min', sa.Integer(), nullable=True, comment='Minimum followers/subscribers in bucket'),
+            sa.Column('followers_max', sa.Integer(), nullable=True, comment='Maximum followers/subscribers in bucket'),
+            sa.Column('followers_sum', sa.BigInteger(), nullable=True, comment='Sum of followers/subscribers samples'),
+            sa.Column('followers_count', sa.Integer(), nullable=False, comment='Number of non-null followers/subscribers samples'),
+            sa.Column('posts_count_last', sa.Integer(), nullable=True, comment='Last posts/videos count in bucket'),
+            sa.Column('posts_count_min', sa.Integer(), nullable=True, comment='Minimum posts/videos count in bucket'),
+            sa.Column('posts_count_max', sa.Integer(), nullable=True, comment='Maximum posts/videos count in bucket'),
+            sa.Column('posts_count_sum', sa.BigInteger(), nullable=True, comment='Sum of posts/videos count samples'),
+            sa.Column('posts_count_count', sa.Integer(), nullable=False, comment='Number of non-null posts/videos count samples'),
+            sa.Column('total_views_last', sa.Integer(), nullable=True, comment='Last total views in bucket'),
+            sa.Column('total_views_min', sa.Integer(), nullable=True, comment='Minimum total views in bucket'),
+            sa.Column('total_views_max', sa.Integer(), nullable=True, comment='Maximum total views in bucket'),
+            sa.Column('total_views_sum', sa.BigInteger(), nullable=True, comment='Sum of total views samples'),
+            sa.Column('total_views_count', sa.Integer(), nullable=False, comment='Number of non-null total views samples'),
+            sa.Column('total_likes_last', sa.Integer(), nullable=True, comment='Last total likes in bucket'),
+            sa.Column('total_likes_min', sa.Integer(), nullable=True, comment='Minimum total likes in bucket'),
+            sa.Column('total_likes_max', sa.Integer(), nullable=True, comment='Maximum total likes in bucket'),
+            sa.Column('total_likes_sum', sa.BigInteger(), nullable=True, comment='Sum of total likes samples'),
+            sa.Column('total_likes_count', sa.Integer(), nullable=False, comment='Number of non-null total likes samples'),
+            sa.Column('engagement_rate_last', sa.Float(), nullable=True, comment='Last engagement rate in bucket'),
+            sa.Column('engagement_rate_min', sa.Float(), nullable=True, comment='Minimum engagement rate in bucket'),
+            sa.Column('engagement_rate_max', sa.Float(), nullable=True, comment='Maximum engagement rate in bucket'),
+            sa.Column('engagement_rate_sum', sa.Float(), nullable=True, comment='Sum of engagement rate samples'),
+            sa.Column('engagement_rate_count', sa.Integer(), nullable=False, comment='Number of non-null engagement rate samples'),
+            sa.ForeignKeyConstraint(['account_id'], ['accounts.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('account_id', 'bucket_start')
+        )
+        op.execute(text(RollupService._rebuild_sql(table, [])).bindparams(unit=ROLLUP_UNITS[table]))
+def downgrade() -> None:
+    for table in reversed(ROLLUP_TABLES):
+        op.drop_table(table)
@@ -0,0 +1,17 @@
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+revision: str = 'f6553a226254'
+down_revision: Union[str, None] = '881c814ac0e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+def upgrade() -> None:
+    op.create_table(
+        'retention_watermarks',
+        sa.Column('key', sa.String(length=100), nullable=False, comment='Retention step key (step:platform)'),
+        sa.Column('processed_until', sa.DateTime(timezone=True), nullable=False, comment='Data before this timestamp has been processed by the step'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('key')
+    )
+def downgrade() -> None:
+    op.drop_table('retention_watermarks')
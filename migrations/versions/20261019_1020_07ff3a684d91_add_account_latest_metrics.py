@@ -0,0 +1,42 @@
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+revision: str = '07ff3a684d91'
+down_revision: Union[str, None] = 'f6553a226254'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+def upgrade() -> None:
+    op.create_table(
+        'account_latest_metrics',
+        sa.Column('account_id', postgresql.UUID(as_uuid=True), nullable=False, comment='Reference to account'),
+        sa.Column('metric_id', postgresql.UUID(as_uuid=True), nullable=False, comment='ID of the metrics row this snapshot was copied from'),
+        sa.Column('collected_at', sa.DateTime(timezone=True), nullable=False, comment='Timestamp when data was collected'),
+        sa.Column('followers', sa.Integer(), nullable=True, comment='Number of followers/subscribers'),
+        sa.Column('posts_count', sa.Integer(), nullable=True, comment='Total number of posts/videos'),
+        sa.Column('total_likes', sa.Integer(), nullable=True, comment='Total likes across recent posts'),
+        sa.Column('total_comments', sa.Integer(), nullable=True, comment='Total comments across recent posts'),
+        sa.Column('total_views', sa.Integer(), nullable=True, comment='Total views (for video platforms)'),
+        sa.Column('total_shares', sa.Integer(), nullable=True, comment='Total shares/reposts'),
+        sa.Column('engagement_rate', sa.Float(), nullable=True, comment='Engagement rate percentage'),
+        sa.Column('extra_data', postgresql.JSONB(astext_type=sa.Text()), nullable=True, comment='Additional platform-specific metrics'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['account_id'], ['accounts.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('account_id')
+    )
+    op.execute(
+        text("""
+            INSERT INTO account_latest_metrics (
+                account_id, metric_id, collected_at, followers, posts_count, total_likes,
+                total_comments, total_views, total_shares, engagement_rate, extra_data
+            )
+            SELECT DISTINCT ON (account_id)
+                account_id, id, collected_at, followers, posts_count, total_likes,
+                total_comments, total_views, total_shares, engagement_rate, extra_data
+            FROM metrics
+            ORDER BY account_id, collected_at DESC
+        """)
+    )
+def downgrade() -> None:
+    op.drop_table('account_latest_metrics')
@@ -0,0 +1,54 @@
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+revision: str = '3c9e51d7a2b4'
+down_revision: Union[str, None] = '07ff3a684d91'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+def upgrade() -> None:
+    op.create_table(
+        'extra_data_blobs',
+        sa.Column('hash', sa.String(length=64), nullable=False, comment='SHA-256 of the canonical JSON encoding of value'),
+        sa.Column('value', postgresql.JSONB(astext_type=sa.Text()), nullable=False, comment='Shared extra_data sub-document'),
+        sa.Column('size_bytes', sa.Integer(), nullable=False, comment='Size of the canonical JSON encoding'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('hash')
+    )
+    op.execute(
+        text("""
+            CREATE OR REPLACE FUNCTION resolve_extra_data(doc jsonb) RETURNS jsonb
+            LANGUAGE sql STABLE AS $$
+                SELECT CASE
+                    WHEN doc IS NULL OR jsonb_typeof(doc) <> 'object' THEN doc
+                    ELSE COALESCE((
+                        SELECT jsonb_object_agg(
+                            e.key,
+                            CASE WHEN b.hash IS NOT NULL THEN b.value ELSE e.value END
+                        )
+                        FROM jsonb_each(doc) AS e
+                        LEFT JOIN extra_data_blobs b
+                            ON jsonb_typeof(e.value) = 'object'
+                           AND e.value ? '$blob'
+                           AND (SELECT count(*) FROM jsonb_object_keys(e.value)) = 1
+                           AND b.hash = e.value ->> '$blob'
+                    ), '{}'::jsonb)
+                END
+            $$
+        """)
+    )
+    op.execute(
+        text("""
+            CREATE OR REPLACE VIEW metrics_resolved AS
+            SELECT
+                id, account_id, collected_at, followers, posts_count, total_likes,
+                total_comments, total_views, total_shares, engagement_rate,
+                resolve_extra_data(extra_data) AS extra_data
+            FROM metrics
+        """)
+    )
+def downgrade() -> None:
+    op.execute(text("DROP VIEW IF EXISTS metrics_resolved"))
+    op.execute(text("DROP FUNCTION IF EXISTS resolve_extra_data(jsonb)"))
+    op.drop_table('extra_data_blobs')
@@ -0,0 +1,36 @@
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+revision: str = 'b81f4d0c6e27'
+down_revision: Union[str, None] = '3c9e51d7a2b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+def upgrade() -> None:
+    op.create_table(
+        'raw_payloads',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('account_id', postgresql.UUID(as_uuid=True), nullable=False, comment='Reference to account'),
+        sa.Column('log_id', postgresql.UUID(as_uuid=True), nullable=True, comment='Collection run that fetched the payload'),
+        sa.Column('metric_id', postgresql.UUID(as_uuid=True), nullable=False, comment='Metrics snapshot extracted from the payload'),
+        sa.Column('collected_at', sa.DateTime(timezone=True), nullable=False, comment='Timestamp of the metrics snapshot'),
+        sa.Column('kind', sa.String(length=50), nullable=False, comment='Parser-defined payload kind, e.g. channel_html'),
+        sa.Column('content_type', sa.String(length=100), nullable=False, comment='MIME type of the uncompressed payload'),
+        sa.Column('sha256', sa.String(length=64), nullable=False, comment='SHA-256 of the uncompressed payload'),
+        sa.Column('size_bytes', sa.Integer(), nullable=False, comment='Uncompressed payload size'),
+        sa.Column('payload', sa.LargeBinary(), nullable=False, comment='zlib-compressed payload'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['account_id'], ['accounts.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['log_id'], ['collection_logs.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('metric_id', 'kind', name='uq_raw_payloads_metric_kind')
+    )
+    op.create_index('ix_raw_payloads_account_collected', 'raw_payloads', ['account_id', 'collected_at'], unique=False)
+    op.create_index(op.f('ix_raw_payloads_log_id'), 'raw_payloads', ['log_id'], unique=False)
+    op.create_index(op.f('ix_raw_payloads_sha256'), 'raw_payloads', ['sha256'], unique=False)
+    op.execute("ALTER TABLE raw_payloads ALTER COLUMN payload SET STORAGE EXTERNAL")
+def downgrade() -> None:
+    op.drop_index(op.f('ix_raw_payloads_sha256'), table_name='raw_payloads')
+    op.drop_index(op.f('ix_raw_payloads_log_id'), table_name='raw_payloads')
+    op.drop_index('ix_raw_payloads_account_collected', table_name='raw_payloads')
+    op.drop_table('raw_payloads')
@@ -0,0 +1,32 @@
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+revision: str = '5d2a7c913e08'
+down_revision: Union[str, None] = 'b81f4d0c6e27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+def upgrade() -> None:
+    op.add_column('metrics', sa.Column('formula_version', sa.SmallInteger(), nullable=True, comment='Version of the engagement formula behind engagement_rate (NULL if computed by a legacy parser)'))
+    op.create_table(
+        'recompute_jobs',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('platform', sa.String(length=50), nullable=False, comment='Platform whose metrics are recomputed'),
+        sa.Column('formula_version', sa.Integer(), nullable=False, comment='Target engagement formula version'),
+        sa.Column('status', sa.String(length=20), nullable=False, comment='Status: pending, running, completed, failed'),
+        sa.Column('since', sa.DateTime(timezone=True), nullable=True, comment='Only recompute snapshots collected from this time'),
+        sa.Column('cursor_collected_at', sa.DateTime(timezone=True), nullable=True, comment='collected_at of the last snapshot written (resume point)'),
+        sa.Column('cursor_metric_id', postgresql.UUID(as_uuid=True), nullable=True, comment='ID of the last snapshot written (resume point)'),
+        sa.Column('rows_processed', sa.Integer(), nullable=False, comment='Snapshots recomputed so far'),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True, comment='Time the job last started or resumed'),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True, comment='Completion time'),
+        sa.Column('error_message', sa.Text(), nullable=True, comment='Error details if the job failed'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_recompute_jobs_platform'), 'recompute_jobs', ['platform'], unique=False)
+def downgrade() -> None:
+    op.drop_index(op.f('ix_recompute_jobs_platform'), table_name='recompute_jobs')
+    op.drop_table('recompute_jobs')
+    op.drop_column('metrics', 'formula_version')
@@ -0,0 +1,27 @@
+from typing import Sequence, Union
+from alembic import op
+from sqlalchemy import text
+from src.models.promoted_field import PROMOTED_FIELDS, add_promoted_field, drop_promoted_field
+revision: str = 'e4a19b7f3c52'
+down_revision: Union[str, None] = '5d2a7c913e08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+COLUMNS = (
+    'telegram_err_views',
+    'telegram_avg_views',
+    'tiktok_avg_engagement_rate',
+    'pinterest_impressions_30d',
+    'pinterest_saves_30d',
+    'youtube_avg_views_30d',
+    'youtube_avg_likes_30d',
+    'youtube_engagement_rate_30d',
+)
+FIELDS = {field.column_name: field for field in PROMOTED_FIELDS}
+def upgrade() -> None:
+    for column in COLUMNS:
+        add_promoted_field(op, FIELDS[column])
+    op.execute(text("DROP INDEX IF EXISTS ix_metrics_extra_data_gin"))
+def downgrade() -> None:
+    op.execute(text("CREATE INDEX IF NOT EXISTS ix_metrics_extra_data_gin ON metrics USING gin(extra_data)"))
+    for column in reversed(COLUMNS):
+        drop_promoted_field(op, FIELDS[column])
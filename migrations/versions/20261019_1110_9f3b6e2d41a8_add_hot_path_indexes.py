@@ -0,0 +1,67 @@
+from typing import Sequence, Union
+from alembic import op
+from sqlalchemy import text
+revision: str = '9f3b6e2d41a8'
+down_revision: Union[str, None] = 'e4a19b7f3c52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+def upgrade() -> None:
+    op.execute(
+        text("""
+            CREATE INDEX IF NOT EXISTS ix_accounts_platform_active_name
+            ON accounts(platform, is_active, display_name)
+        """)
+    )
+    op.execute(text("DROP INDEX IF EXISTS ix_accounts_tiktok_platform"))
+    op.execute(text("DROP INDEX IF EXISTS ix_accounts_platform"))
+    op.execute(
+        text("""
+            CREATE INDEX IF NOT EXISTS idx_story_snapshots_account_story_collected
+            ON instagram_story_snapshots(account_id, story_id, collected_at)
+        """)
+    )
+    op.execute(text("DROP INDEX IF EXISTS idx_instagram_story_snapshots_account_id"))
+    op.execute(text("DROP INDEX IF EXISTS idx_instagram_story_snapshots_story_id"))
+    op.execute(text("DROP INDEX IF EXISTS idx_instagram_story_snapshots_collected_at"))
+    op.execute(
+        text("""
+            CREATE INDEX IF NOT EXISTS brin_story_snapshots_collected_at
+            ON instagram_story_snapshots USING brin(collected_at)
+        """)
+    )
+    op.execute(
+        text("""
+            CREATE INDEX IF NOT EXISTS brin_content_item_stats_collected_at
+            ON content_item_stats USING brin(collected_at)
+        """)
+    )
+    op.execute(
+        text("""
+            CREATE INDEX IF NOT EXISTS brin_raw_payloads_collected_at
+            ON raw_payloads USING brin(collected_at)
+        """)
+    )
+    op.execute(
+        text("""
+            CREATE INDEX IF NOT EXISTS ix_collection_account_results_account_id
+            ON collection_account_results(account_id)
+        """)
+    )
+def downgrade() -> None:
+    op.execute(text("DROP INDEX IF EXISTS ix_collection_account_results_account_id"))
+    op.execute(text("DROP INDEX IF EXISTS brin_raw_payloads_collected_at"))
+    op.execute(text("DROP INDEX IF EXISTS brin_content_item_stats_collected_at"))
+    op.execute(text("DROP INDEX IF EXISTS brin_story_snapshots_collected_at"))
+    op.execute(text("CREATE INDEX IF NOT EXISTS idx_instagram_story_snapshots_collected_at ON instagram_story_snapshots(collected_at)"))
+    op.execute(text("CREATE INDEX IF NOT EXISTS idx_instagram_story_snapshots_story_id ON instagram_story_snapshots(story_id)"))
+    op.execute(text("CREATE INDEX IF NOT EXISTS idx_instagram_story_snapshots_account_id ON instagram_story_snapshots(account_id)"))
+    op.execute(text("DROP INDEX IF EXISTS idx_story_snapshots_account_story_collected"))
+    op.execute(text("CREATE INDEX IF NOT EXISTS ix_accounts_platform ON accounts(platform)"))
+    op.execute(
+        text("""
+            CREATE INDEX IF NOT EXISTS ix_accounts_tiktok_platform
+            ON accounts(platform, is_active, display_name)
+            WHERE platform = 'tiktok'
+        """)
+    )
+    op.execute(text("DROP INDEX IF EXISTS ix_accounts_platform_active_name"))
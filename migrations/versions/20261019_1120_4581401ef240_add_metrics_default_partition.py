@@ -0,0 +1,12 @@
+from typing import Sequence, Union
+from alembic import op
+from sqlalchemy import text
+revision: str = '4581401ef240'
+down_revision: Union[str, None] = '9f3b6e2d41a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+def upgrade() -> None:
+    op.execute(text("CREATE TABLE IF NOT EXISTS metrics_default PARTITION OF metrics DEFAULT"))
+def downgrade() -> None:
+    op.execute(text("ALTER TABLE metrics DETACH PARTITION metrics_default"))
+    op.execute(text("ALTER TABLE metrics_default RENAME TO metrics_default_detached"))
@@ -0,0 +1,17 @@
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+revision: str = 'f08a83adbd6b'
+down_revision: Union[str, None] = '4581401ef240'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+def upgrade() -> None:
+    op.create_table(
+        'data_versions',
+        sa.Column('scope', sa.String(length=100), nullable=False, comment='Account UUID, or * for changes that touch every account'),
+        sa.Column('version', sa.BigInteger(), nullable=False, comment='Incremented whenever stored data in the scope is rewritten in place'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('scope')
+    )
+def downgrade() -> None:
+    op.drop_table('data_versions')
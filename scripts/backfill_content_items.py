@@ -0,0 +1,18 @@
+import asyncio
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from src.config.settings import get_settings
+from src.services.content_item_service import ContentItemService
+settings = get_settings()
+async def backfill_content_items() -> None:
+    engine = create_async_engine(str(settings.database_url))
+    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with async_session() as session:
+        print("📦 Backfilling content items from metric snapshots...")
+        total = await ContentItemService(session).backfill()
+        print(f"\n✨ Stored {total} content item snapshots")
+    await engine.dispose()
+if __name__ == "__main__":
+    asyncio.run(backfill_content_items())
@@ -0,0 +1,59 @@
+import argparse
+import statistics
+import time
+import httpx
+DEFAULT_PATHS = [
+    "/api/v1/metrics?limit=1000",
+    "/api/v1/metrics?limit=10000",
+    "/api/v1/content?limit=200",
+    "/api/v1/overview",
+    "/api/v1/growth?period=30d",
+]
+ENCODINGS = ["identity", "gzip", "br"]
+def percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+def benchmark(client: httpx.Client, path: str, encoding: str, repeat: int, warmup: int) -> dict:
+    headers = {"Accept-Encoding": encoding}
+    timings = []
+    wire_bytes = 0
+    for attempt in range(warmup + repeat):
+        started = time.perf_counter()
+        with client.stream("GET", path, headers=headers) as response:
+            response.raise_for_status()
+            raw = b"".join(response.iter_raw())
+            served = response.headers.get("content-encoding", "identity")
+        elapsed = time.perf_counter() - started
+        if attempt >= warmup:
+            timings.append(elapsed * 1000)
+            wire_bytes = len(raw)
+    return {
+        "served": served,
+        "p50": statistics.median(timings),
+        "p95": percentile(timings, 0.95),
+        "wire_kib": wire_bytes / 1024,
+    }
+def main(base_url: str, paths: list[str], encodings: list[str], repeat: int, warmup: int) -> None:
+    print(f"⏱️  Benchmarking {base_url} ({repeat} runs after {warmup} warmup)")
+    print(f"{'path':<36} {'encoding':<9} {'p50 ms':>8} {'p95 ms':>8} {'wire KiB':>10}")
+    with httpx.Client(base_url=base_url, timeout=120.0) as client:
+        for path in paths:
+            for encoding in encodings:
+                try:
+                    result = benchmark(client, path, encoding, repeat, warmup)
+                except httpx.HTTPError as e:
+                    print(f"{path:<36} {encoding:<9} ❌ {e}")
+                    continue
+                print(
+                    f"{path:<36} {result['served']:<9} {result['p50']:>8.1f} {result['p95']:>8.1f} "
+                    f"{result['wire_kib']:>10.1f}"
+                )
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure latency and payload size of large API reads per content encoding")
+    parser.add_argument("--base-url", default="http://localhost:8000", help="API base URL")
+    parser.add_argument("--path", action="append", dest="paths", default=None, help="Request path (repeatable)")
+    parser.add_argument("--encoding", action="append", dest="encodings", default=None, choices=ENCODINGS, help="Accept-Encoding to request (repeatable)")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed requests per path and encoding")
+    parser.add_argument("--warmup", type=int, default=3, help="Untimed requests before measuring")
+    args = parser.parse_args()
+    main(args.base_url, args.paths or DEFAULT_PATHS, args.encodings or ENCODINGS, args.repeat, args.warmup)
@@ -0,0 +1,197 @@
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+from src.config.settings import get_settings
+settings = get_settings()
+PLATFORMS = ["telegram", "youtube", "tiktok", "instagram", "pinterest", "dzen", "wibes", "vk"]
+HOT_QUERIES: List[Dict[str, Any]] = [
+    {
+        "name": "accounts by platform",
+        "sql": "SELECT * FROM accounts WHERE platform = 'telegram' AND is_active ORDER BY display_name",
+        "no_seq_scan": ["accounts"],
+    },
+    {
+        "name": "platform account list with latest metric",
+        "sql": """
+            SELECT a.*, l.* FROM accounts a
+            LEFT JOIN account_latest_metrics l ON l.account_id = a.id
+            WHERE a.platform = 'pinterest' ORDER BY a.display_name
+        """,
+        "no_seq_scan": ["accounts"],
+    },
+    {
+        "name": "latest metric lookup",
+        "sql": "SELECT * FROM account_latest_metrics WHERE account_id = (SELECT id FROM accounts LIMIT 1)",
+        "no_seq_scan": ["account_latest_metrics"],
+    },
+    {
+        "name": "account metric history",
+        "sql": """
+            SELECT * FROM metrics
+            WHERE account_id = (SELECT id FROM accounts LIMIT 1)
+              AND collected_at >= now() - interval '30 days'
+            ORDER BY collected_at DESC LIMIT 1000
+        """,
+        "no_seq_scan": ["metrics"],
+    },
+    {
+        "name": "/metrics filtered by platform",
+        "sql": """
+            SELECT m.* FROM metrics m JOIN accounts a ON a.id = m.account_id
+            WHERE a.platform = 'youtube'
+            ORDER BY m.collected_at DESC LIMIT 1000
+        """,
+        "no_seq_scan": ["metrics"],
+    },
+    {
+        "name": "top telegram channels by ERR",
+        "sql": """
+            SELECT account_id, telegram_err_views FROM metrics
+            WHERE telegram_err_views IS NOT NULL AND collected_at >= now() - interval '7 days'
+            ORDER BY telegram_err_views DESC LIMIT 20
+        """,
+        "no_seq_scan": ["metrics"],
+    },
+    {
+        "name": "story dedup check",
+        "sql": """
+            SELECT EXISTS (
+                SELECT 1 FROM instagram_story_snapshots
+                WHERE story_id = 'story_1' AND collected_at >= now() - interval '1 hour'
+            )
+        """,
+        "no_seq_scan": ["instagram_story_snapshots"],
+    },
+    {
+        "name": "account stories",
+        "sql": """
+            SELECT * FROM instagram_story_snapshots
+            WHERE account_id = (SELECT id FROM accounts WHERE platform = 'instagram' LIMIT 1)
+              AND collected_at >= now() - interval '24 hours'
+            ORDER BY story_id, collected_at DESC
+        """,
+        "no_seq_scan": ["instagram_story_snapshots"],
+    },
+    {
+        "name": "content listing by views",
+        "sql": "SELECT * FROM content_items WHERE platform = 'youtube' ORDER BY views DESC LIMIT 50",
+        "no_seq_scan": ["content_items"],
+    },
+    {
+        "name": "collection logs",
+        "sql": "SELECT * FROM collection_logs ORDER BY started_at DESC LIMIT 10",
+        "no_seq_scan": ["collection_logs"],
+    },
+]
+PARTITIONS_SQL = """
+    DO $$
+    DECLARE
+        month_start date := date_trunc('month', now() - make_interval(days => {days}))::date;
+    BEGIN
+        WHILE month_start <= date_trunc('month', now())::date LOOP
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF metrics FOR VALUES FROM (%L) TO (%L)',
+                'metrics_' || to_char(month_start, '"y"YYYY"m"MM'),
+                to_char(month_start, 'YYYY-MM-DD') || ' 00:00:00+00',
+                to_char(month_start + interval '1 month', 'YYYY-MM-DD') || ' 00:00:00+00'
+            );
+            month_start := (month_start + interval '1 month')::date;
+        END LOOP;
+    END $$
+    """
+SEED_SQL = [
+    """
+    INSERT INTO accounts (id, platform, account_id, account_url, display_name, is_active)
+    SELECT gen_random_uuid(), p.platform, p.platform || '_plan_' || n,
+           'https://example.com/' || p.platform || '/' || n, p.platform || ' account ' || n, n % 10 <> 0
+    FROM unnest(CAST(:platforms AS text[])) AS p(platform), generate_series(1, :accounts) AS n
+    """,
+    """
+    INSERT INTO metrics (id, account_id, collected_at, followers, posts_count, total_views, total_likes, engagement_rate, extra_data)
+    SELECT gen_random_uuid(), a.id, ts, (random() * 100000)::int, (random() * 500)::int,
+           (random() * 1000000)::int, (random() * 50000)::int, random() * 10,
+           jsonb_build_object('err_views', random() * 50, 'avg_views', random() * 10000)
+    FROM accounts a, generate_series(now() - make_interval(days => :days), now(), interval '6 hours') AS ts
+    WHERE a.account_id LIKE '%\\_plan\\_%'
+    """,
+    """
+    INSERT INTO account_latest_metrics (account_id, metric_id, collected_at, followers, engagement_rate)
+    SELECT DISTINCT ON (account_id) account_id, id, collected_at, followers, engagement_rate
+    FROM metrics ORDER BY account_id, collected_at DESC
+    ON CONFLICT (account_id) DO NOTHING
+    """,
+    """
+    INSERT INTO instagram_story_snapshots (id, account_id, story_id, collected_at, posted_at, retention_expires_at, media_type)
+    SELECT gen_random_uuid(), a.id, 'story_' || a.id || '_' || (extract(epoch FROM ts)::bigint / 86400), ts,
+           date_trunc('day', ts), date_trunc('day', ts) + interval '24 hours', 'IMAGE'
+    FROM accounts a, generate_series(now() - make_interval(days => :days), now(), interval '1 hour') AS ts
+    WHERE a.platform = 'instagram' AND a.account_id LIKE '%\\_plan\\_%'
+    """,
+    """
+    INSERT INTO content_items (id, account_id, platform, external_id, content_type, views, last_collected_at)
+    SELECT gen_random_uuid(), a.id, a.platform, a.account_id || '_item_' || n, 'post', (random() * 100000)::int, now()
+    FROM accounts a, generate_series(1, 200) AS n
+    WHERE a.account_id LIKE '%\\_plan\\_%'
+    """,
+]
+def walk(node: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield node
+    for child in node.get("Plans", []):
+        yield from walk(child)
+def seq_scanned(plan: Dict[str, Any], tables: List[str]) -> List[str]:
+    hits = []
+    for node in walk(plan):
+        if node.get("Node Type") != "Seq Scan":
+            continue
+        relation = node.get("Relation Name", "")
+        for table in tables:
+            if relation == table or relation.startswith(f"{table}_y"):
+                hits.append(relation)
+    return hits
+async def seed(conn: AsyncConnection, accounts: int, days: int) -> None:
+    params = {"platforms": PLATFORMS, "accounts": accounts, "days": days}
+    await conn.execute(text(PARTITIONS_SQL.format(days=int(days))))
+    for statement in SEED_SQL:
+        await conn.execute(text(statement), params)
+    await conn.execute(text("ANALYZE"))
+async def check_query_plans(args: argparse.Namespace) -> int:
+    engine = create_async_engine(args.database_url or str(settings.database_url))
+    failures = 0
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            if args.seed:
+                print(f"🧪 Seeding {args.accounts} accounts per platform with {args.days} days of history (rolled back afterwards)...")
+                await seed(conn, args.accounts, args.days)
+            for query in HOT_QUERIES:
+                result = await conn.execute(text(f"EXPLAIN (FORMAT JSON) {query['sql']}"))
+                raw = result.scalar()
+                plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+                hits = seq_scanned(plan, query["no_seq_scan"])
+                if hits:
+                    failures += 1
+                    print(f"  ❌ {query['name']}: sequential scan on {', '.join(sorted(set(hits)))}")
+                    if args.verbose:
+                        print(json.dumps(plan, indent=2))
+                else:
+                    print(f"  ✅ {query['name']} (cost {plan['Total Cost']:.0f})")
+        finally:
+            await transaction.rollback()
+    await engine.dispose()
+    print(f"{'❌' if failures else '✅'} {len(HOT_QUERIES) - failures}/{len(HOT_QUERIES)} hot queries use indexed plans")
+    return 1 if failures else 0
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="EXPLAIN every hot query path and fail on sequential scans of large tables")
+    parser.add_argument("--database-url", default=None, help="Database to check (defaults to DATABASE_URL)")
+    parser.add_argument("--seed", action="store_true", help="Load a synthetic dataset inside the check transaction")
+    parser.add_argument("--accounts", type=int, default=200, help="Synthetic accounts per platform")
+    parser.add_argument("--days", type=int, default=180, help="Days of synthetic history")
+    parser.add_argument("--verbose", action="store_true", help="Print the plan of failing queries")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(check_query_plans(args)))
@@ -0,0 +1,34 @@
+import argparse
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+from uuid import UUID
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from src.config.settings import get_settings
+from src.services.parquet_export_service import ExportFilters, ParquetExportService
+settings = get_settings()
+async def export_parquet(filters: ExportFilters, output: Path, row_group_size: int | None) -> None:
+    engine = create_async_engine(str(settings.database_url))
+    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with async_session() as session:
+        print(f"📤 Exporting metrics to {output}...")
+        written = 0
+        with output.open("wb") as handle:
+            async for chunk in ParquetExportService(session, row_group_size=row_group_size).iter_parquet(filters):
+                handle.write(chunk)
+                written += len(chunk)
+        print(f"  ✅ Wrote {written / 1024 / 1024:.1f} MiB")
+    await engine.dispose()
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export metrics with flattened extra_data columns to a Parquet file")
+    parser.add_argument("output", type=Path, help="Destination .parquet file")
+    parser.add_argument("--platform", default=None, help="Only export this platform")
+    parser.add_argument("--account-id", type=UUID, default=None, help="Only export this account")
+    parser.add_argument("--start", type=datetime.fromisoformat, default=None, help="Start date (ISO 8601)")
+    parser.add_argument("--end", type=datetime.fromisoformat, default=None, help="End date (ISO 8601)")
+    parser.add_argument("--row-group-size", type=int, default=None, help="Override export_row_group_size")
+    args = parser.parse_args()
+    filters = ExportFilters(platform=args.platform, account_id=args.account_id, start_date=args.start, end_date=args.end)
+    asyncio.run(export_parquet(filters, args.output, args.row_group_size))
@@ -0,0 +1,23 @@
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from src.config.settings import get_settings
+from src.services.extra_data_service import ExtraDataService
+settings = get_settings()
+async def pack_extra_data(batch_size: int, min_bytes: int | None) -> None:
+    engine = create_async_engine(str(settings.database_url))
+    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with async_session() as session:
+        print("📦 Moving large extra_data sub-documents to extra_data_blobs...")
+        packed = await ExtraDataService(session).pack_existing(batch_size=batch_size, min_bytes=min_bytes)
+        print(f"  ✅ Rewrote {packed} snapshots")
+    await engine.dispose()
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rewrite existing metrics.extra_data into content-addressed blobs")
+    parser.add_argument("--batch-size", type=int, default=500, help="Snapshots processed per transaction")
+    parser.add_argument("--min-bytes", type=int, default=None, help="Override metrics_blob_min_bytes")
+    args = parser.parse_args()
+    asyncio.run(pack_extra_data(args.batch_size, args.min_bytes))
@@ -0,0 +1,24 @@
+import argparse
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from src.config.settings import get_settings
+from src.services.rollup_service import RollupService
+settings = get_settings()
+async def rebuild_rollups(since: datetime | None) -> None:
+    engine = create_async_engine(str(settings.database_url))
+    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with async_session() as session:
+        print("📊 Rebuilding metric rollups...")
+        rebuilt = await RollupService(session).rebuild(since=since)
+        for granularity, count in rebuilt.items():
+            print(f"  ✅ {granularity}: {count} buckets")
+    await engine.dispose()
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild hourly/daily/weekly metric rollups from raw snapshots")
+    parser.add_argument("--since", type=datetime.fromisoformat, default=None, help="Only rebuild buckets from this date (ISO 8601)")
+    args = parser.parse_args()
+    asyncio.run(rebuild_rollups(args.since))
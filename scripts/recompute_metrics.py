@@ -0,0 +1,37 @@
+import argparse
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+from uuid import UUID
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from src.config.settings import get_settings
+from src.services.recompute_service import RecomputeService
+settings = get_settings()
+async def recompute_metrics(args: argparse.Namespace) -> None:
+    engine = create_async_engine(str(settings.database_url))
+    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with async_session() as session:
+        service = RecomputeService(session)
+        if args.resume:
+            job_id = args.resume
+            print(f"🔁 Resuming recompute job {job_id}...")
+        else:
+            job = await service.create_job(args.platform, version=args.version, since=args.since)
+            job_id = job.id
+            print(f"🧮 Recomputing {job.platform} engagement with formula v{job.formula_version} (job {job_id})...")
+        job = await service.run(job_id, workers=args.workers, chunk_size=args.chunk_size)
+        print(f"  ✅ {job.status}: {job.rows_processed} snapshots recomputed")
+    await engine.dispose()
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Recompute engagement_rate over historical metrics with a versioned formula")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--platform", help="Platform to recompute, e.g. youtube")
+    target.add_argument("--resume", type=UUID, help="Resume an interrupted recompute job by ID")
+    parser.add_argument("--version", type=int, default=None, help="Formula version (defaults to the latest registered)")
+    parser.add_argument("--since", type=datetime.fromisoformat, default=None, help="Only snapshots collected from this date (ISO 8601)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (defaults to recompute_workers)")
+    parser.add_argument("--chunk-size", type=int, default=None, help="Snapshots per chunk (defaults to recompute_chunk_size)")
+    args = parser.parse_args()
+    asyncio.run(recompute_metrics(args))
@@ -0,0 +1,38 @@
+import argparse
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from src.config.settings import get_settings
+from src.services.reparse_service import ReparseService
+settings = get_settings()
+async def reparse_payloads(args: argparse.Namespace) -> None:
+    engine = create_async_engine(str(settings.database_url))
+    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with async_session() as session:
+        mode = " (dry run)" if args.dry_run else ""
+        print(f"🔁 Re-parsing archived {args.platform} payloads{mode}...")
+        stats = await ReparseService(session).run(
+            args.platform,
+            since=args.since,
+            until=args.until,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            dry_run=args.dry_run
+        )
+        print(f"  ✅ Re-parsed {stats['reparsed']}/{stats['snapshots']} snapshots")
+        if stats["failed"]:
+            print(f"  ⚠️  {stats['failed']} snapshots could not be re-parsed")
+    await engine.dispose()
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-run parser extraction over archived raw payloads and rewrite metrics")
+    parser.add_argument("platform", help="Platform to re-parse, e.g. dzen or wibes")
+    parser.add_argument("--since", type=datetime.fromisoformat, default=None, help="Only snapshots collected from this date (ISO 8601)")
+    parser.add_argument("--until", type=datetime.fromisoformat, default=None, help="Only snapshots collected before this date (ISO 8601)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (defaults to reparse_workers)")
+    parser.add_argument("--batch-size", type=int, default=50, help="Snapshots handed to a worker at a time")
+    parser.add_argument("--dry-run", action="store_true", help="Parse without writing metrics")
+    args = parser.parse_args()
+    asyncio.run(reparse_payloads(args))
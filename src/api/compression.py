@@ -0,0 +1,136 @@
+import importlib.util
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/vnd.apache.arrow.stream",
+    "text/",
+)
+def brotli_available() -> bool:
+    return importlib.util.find_spec("brotli") is not None
+def parse_accept_encoding(value: str) -> Dict[str, float]:
+    weights: Dict[str, float] = {}
+    for part in value.split(","):
+        coding, _, params = part.strip().partition(";")
+        if not coding:
+            continue
+        weight = 1.0
+        for param in params.split(";"):
+            name, _, number = param.strip().partition("=")
+            if name == "q":
+                try:
+                    weight = float(number)
+                except ValueError:
+                    weight = 0.0
+        weights[coding.strip().lower()] = weight
+    return weights
+def negotiate_encoding(accept_encoding: Optional[str], brotli: bool) -> Optional[str]:
+    if not accept_encoding:
+        return None
+    weights = parse_accept_encoding(accept_encoding)
+    wildcard = weights.get("*", 0.0)
+    candidates: List[Tuple[float, int, str]] = []
+    for preference, coding in enumerate(("br", "gzip")):
+        if coding == "br" and not brotli:
+            continue
+        weight = weights.get(coding, wildcard)
+        if weight > 0:
+            candidates.append((weight, -preference, coding))
+    return max(candidates)[2] if candidates else None
+def is_compressible(content_type: str) -> bool:
+    return any(content_type.startswith(prefix) for prefix in COMPRESSIBLE_TYPES)
+class GzipCompressor:
+    def __init__(self, level: int):
+        self.compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    def compress(self, data: bytes, final: bool) -> bytes:
+        return self.compressor.compress(data) + self.compressor.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+class BrotliCompressor:
+    def __init__(self, quality: int):
+        import brotli
+        self.compressor = brotli.Compressor(quality=quality)
+    def compress(self, data: bytes, final: bool) -> bytes:
+        return self.compressor.process(data) + (self.compressor.finish() if final else self.compressor.flush())
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.brotli = brotli_available()
+    def compressor(self, encoding: str) -> Any:
+        if encoding == "br":
+            return BrotliCompressor(self.brotli_quality)
+        return GzipCompressor(self.gzip_level)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"), self.brotli)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await CompressionResponder(self, encoding)(scope, receive, send)
+class CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.start: Optional[Message] = None
+        self.compressor: Optional[Any] = None
+        self.passthrough = False
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.middleware.app(scope, receive, self.send_compressed)
+    def should_compress(self, headers: MutableHeaders) -> bool:
+        if self.start["status"] < 200 or self.start["status"] in (204, 304):
+            return False
+        if "content-encoding" in headers:
+            return False
+        return is_compressible(headers.get("content-type", ""))
+    def mark_encoded(self, headers: MutableHeaders) -> None:
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+    async def send_compressed(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.compressor is None:
+            headers = MutableHeaders(raw=self.start["headers"])
+            if not self.should_compress(headers) or (not more_body and len(body) < self.middleware.minimum_size):
+                self.passthrough = True
+                await self.send(self.start)
+                await self.send(message)
+                return
+            self.compressor = self.middleware.compressor(self.encoding)
+            self.mark_encoded(headers)
+            if more_body:
+                del headers["Content-Length"]
+                await self.send(self.start)
+                await self.send({"type": "http.response.body", "body": self.compressor.compress(body, False), "more_body": True})
+                return
+            compressed = self.compressor.compress(body, True)
+            headers["Content-Length"] = str(len(compressed))
+            await self.send(self.start)
+            await self.send({"type": "http.response.body", "body": compressed})
+            return
+        await self.send({
+            "type": "http.response.body",
+            "body": self.compressor.compress(body, not more_body),
+            "more_body": more_body,
+        })
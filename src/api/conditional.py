@@ -0,0 +1,52 @@
+import hashlib
+from typing import List, Optional
+from uuid import UUID
+import logging
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.config.settings import get_settings
+from src.db.database import get_db
+from src.services.data_version_service import DataVersionService
+from src.services.response_cache import EPOCH_SCOPE, get_response_cache
+logger = logging.getLogger(__name__)
+settings = get_settings()
+ETAG_HEADER = "ETag"
+def parse_if_none_match(value: Optional[str]) -> List[str]:
+    if not value:
+        return []
+    return [tag.strip().removeprefix("W/") for tag in value.split(",") if tag.strip()]
+def request_account_id(request: Request) -> Optional[UUID]:
+    candidates = [request.path_params.get("account_id"), *request.query_params.getlist("account_id")[:2]]
+    values = [value for value in candidates if value]
+    if len(values) != 1:
+        return None
+    try:
+        return UUID(str(values[0]))
+    except ValueError:
+        return None
+def build_etag(request: Request, version: str) -> str:
+    query = "&".join(sorted(f"{key}={value}" for key, value in request.query_params.multi_items()))
+    digest = hashlib.sha256(f"{request.url.path}?{query}|{version}".encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+def cache_control() -> str:
+    return f"private, max-age={settings.http_cache_max_age_seconds}, must-revalidate"
+async def conditional_get(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db)
+) -> None:
+    if request.method not in ("GET", "HEAD"):
+        return
+    version = await DataVersionService(db).version(request_account_id(request))
+    cache = get_response_cache()
+    if cache.enabled:
+        try:
+            version = f"{version}|{await cache.backend.version(EPOCH_SCOPE)}"
+        except Exception as e:
+            logger.warning(f"Response cache epoch unavailable for ETag: {e}")
+    etag = build_etag(request, version)
+    headers = {ETAG_HEADER: etag, "Cache-Control": cache_control()}
+    tags = parse_if_none_match(request.headers.get("if-none-match"))
+    if etag in tags or "*" in tags:
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
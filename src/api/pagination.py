@@ -0,0 +1,38 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Sequence
+from uuid import UUID
+from fastapi import HTTPException, Response, status
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+def encode_cursor(*values: Any) -> str:
+    payload = json.dumps([v.isoformat() if isinstance(v, datetime) else v for v in values], default=str)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+def decode_cursor(cursor: str, *parsers: Callable[[Any], Any]) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(parsers):
+            raise ValueError("cursor has the wrong shape")
+        return [None if value is None else parse(value) for parse, value in zip(parsers, values)]
+    except (ValueError, TypeError, binascii.Error, UnicodeError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid cursor: {str(e)}"
+        )
+def reject_offset_with_cursor(cursor: Optional[str], offset: int) -> None:
+    if cursor and offset:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="offset cannot be combined with cursor"
+        )
+def parse_datetime(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+def parse_uuid(value: str) -> UUID:
+    return UUID(value)
+def paginate(response: Response, rows: Sequence[Any], limit: int, key: Callable[[Any], Sequence[Any]]) -> List[Any]:
+    page = list(rows[:limit])
+    if len(rows) > limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(*key(page[-1]))
+    return page
@@ -0,0 +1,29 @@
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence, Type
+import orjson
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+SKIPPED_HEADERS = (b"content-length", b"content-type")
+def orjson_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=orjson_default, option=ORJSON_OPTIONS)
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+def orm_dicts(rows: Sequence[Any], model: Type[BaseModel]) -> List[Dict[str, Any]]:
+    names = list(model.model_fields)
+    return [{name: getattr(row, name) for name in names} for row in rows]
+def trusted_json(content: Any, response: Optional[Response] = None, status_code: int = 200) -> FastJSONResponse:
+    fast = FastJSONResponse(content, status_code=status_code)
+    if response is not None:
+        fast.headers.raw.extend((key, value) for key, value in response.headers.raw if key not in SKIPPED_HEADERS)
+    return fast
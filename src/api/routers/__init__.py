@@ -9,6 +9,8 @@ from src.api.routers import (
     instagram_insights,
     tiktok,
     telegram,
+    pinterest,
+    content,
 )
 __all__ = [
     "collection",
@@ -21,4 +23,6 @@ __all__ = [
     "instagram_insights",
     "tiktok",
     "telegram",
+    "pinterest",
+    "content",
 ]
@@ -2,10 +2,15 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from src.api.conditional import conditional_get
+from src.api.pagination import decode_cursor, paginate, parse_datetime, parse_uuid
+from src.api.responses import trusted_json
 from src.db.database import get_db
+from src.db.keyset import after_desc
 from src.db.repository import BaseRepository
 from src.models.account import Account
 from src.models.metric import Metric
@@ -14,10 +19,15 @@ from src.models.schemas import (
     AccountResponse,
     AccountUpdate,
     MetricResponse,
-    CollectionLogResponse
+    CollectionLogResponse,
+    AccountProfileResponse
 )
+from src.services.metric_projection_service import MetricProjectionService
+from src.services.metric_stream_service import STREAM_MEDIA_TYPES, MetricStreamService, arrow_available
+from src.services.profile_cache_service import ProfileCacheService
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/api/v1", tags=["accounts"])
+router = APIRouter(prefix="/api/v1", tags=["accounts"], dependencies=[Depends(conditional_get)])
+DEFAULT_METRICS_LIMIT = 1000
 @router.get("/accounts", response_model=List[AccountResponse], status_code=status.HTTP_200_OK)
 async def get_accounts(
     platform: Optional[str] = Query(None, description="Filter by platform (telegram, youtube, vk)"),
@@ -68,17 +78,64 @@ async def update_account(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to update account: {str(e)}"
         )
-@router.get("/metrics", response_model=List[MetricResponse], status_code=status.HTTP_200_OK)
+@router.get("/accounts/{account_id}/profile", response_model=AccountProfileResponse, status_code=status.HTTP_200_OK)
+async def get_account_profile(
+    account_id: UUID,
+    db: AsyncSession = Depends(get_db)
+) -> AccountProfileResponse:
+    try:
+        account = await BaseRepository(Account, db).get(account_id)
+        if not account:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Account with id {account_id} not found"
+            )
+        attributes = await ProfileCacheService(db).get_profile(account_id)
+        logger.info(f"Retrieved {len(attributes)} profile attributes for account {account_id}")
+        return AccountProfileResponse(account_id=account_id, attributes=attributes)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to retrieve profile for account {account_id}: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve account profile: {str(e)}"
+        )
+@router.get(
+    "/metrics",
+    response_model=List[MetricResponse],
+    response_model_exclude_unset=True,
+    status_code=status.HTTP_200_OK
+)
 async def get_metrics(
+    response: Response,
     account_id: Optional[UUID] = Query(None, description="Filter by account ID"),
     platform: Optional[str] = Query(None, description="Filter by platform"),
     start_date: Optional[datetime] = Query(None, description="Start date (ISO 8601)"),
     end_date: Optional[datetime] = Query(None, description="End date (ISO 8601)"),
-    limit: int = Query(1000, ge=1, le=10000, description="Maximum number of metrics to return"),
+    limit: Optional[int] = Query(None, ge=1, le=10000, description="Maximum number of metrics to return (default 1000; ndjson and arrow stream every matching row unless set)"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
+    fields: Optional[str] = Query(None, description="Comma-separated metric columns to return (id, account_id and collected_at are always included)"),
+    extra_keys: Optional[str] = Query(None, description="Comma-separated extra_data keys (dotted paths allowed) to return instead of the whole document"),
+    format: str = Query("json", regex="^(json|ndjson|arrow)$", description="Response format; ndjson and arrow stream rows from a server-side cursor"),
     db: AsyncSession = Depends(get_db)
 ) -> List[MetricResponse]:
     try:
-        query = select(Metric)
+        if format == "arrow" and not arrow_available():
+            raise HTTPException(
+                status_code=status.HTTP_501_NOT_IMPLEMENTED,
+                detail="Arrow output requires the optional pyarrow dependency"
+            )
+        projection = MetricProjectionService(db)
+        extra_key_list = projection.parse_list(extra_keys)
+        try:
+            field_list = projection.select_fields(projection.parse_list(fields), extra_key_list)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        query = select(*projection.columns(field_list, extra_key_list))
         if account_id:
             query = query.where(Metric.account_id == account_id)
         if platform:
@@ -87,16 +144,30 @@ async def get_metrics(
             query = query.where(Metric.collected_at >= start_date)
         if end_date:
             query = query.where(Metric.collected_at <= end_date)
-        query = query.order_by(Metric.collected_at.desc())
-        query = query.limit(limit)
+        if cursor:
+            last = decode_cursor(cursor, parse_datetime, parse_uuid)
+            query = query.where(after_desc([Metric.collected_at, Metric.id], last))
+        query = query.order_by(Metric.collected_at.desc(), Metric.id.desc())
+        if format in STREAM_MEDIA_TYPES:
+            if limit:
+                query = query.limit(limit)
+            return StreamingResponse(
+                MetricStreamService().stream(format, query, field_list, extra_key_list),
+                media_type=STREAM_MEDIA_TYPES[format]
+            )
+        limit = limit or DEFAULT_METRICS_LIMIT
+        query = query.limit(limit + 1)
         result = await db.execute(query)
-        metrics = list(result.scalars().all())
+        rows = paginate(response, result.all(), limit, lambda m: (m.collected_at, m.id))
+        metrics = await projection.serialize(rows, field_list, extra_key_list)
         logger.info(
             f"Retrieved {len(metrics)} metrics "
             f"(account_id={account_id}, platform={platform}, "
-            f"start={start_date}, end={end_date}, limit={limit})"
+            f"start={start_date}, end={end_date}, limit={limit}, fields={fields}, extra_keys={extra_keys})"
         )
-        return metrics
+        return trusted_json(metrics, response)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to retrieve metrics: {e}", exc_info=True)
         raise HTTPException(
@@ -105,19 +176,23 @@ async def get_metrics(
         )
 @router.get("/logs", response_model=List[CollectionLogResponse], status_code=status.HTTP_200_OK)
 async def get_collection_logs(
+    response: Response,
     limit: int = Query(10, ge=1, le=100, description="Number of logs to return"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
     db: AsyncSession = Depends(get_db)
 ) -> List[CollectionLogResponse]:
     try:
-        query = (
-            select(CollectionLog)
-            .order_by(CollectionLog.started_at.desc())
-            .limit(limit)
-        )
+        query = select(CollectionLog)
+        if cursor:
+            last = decode_cursor(cursor, parse_datetime, parse_uuid)
+            query = query.where(after_desc([CollectionLog.started_at, CollectionLog.id], last))
+        query = query.order_by(CollectionLog.started_at.desc(), CollectionLog.id.desc()).limit(limit + 1)
         result = await db.execute(query)
-        logs = list(result.scalars().all())
+        logs = paginate(response, result.scalars().all(), limit, lambda log: (log.started_at, log.id))
         logger.info(f"Retrieved {len(logs)} collection logs (limit={limit})")
         return logs
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to retrieve collection logs: {e}", exc_info=True)
         raise HTTPException(
@@ -1,10 +1,19 @@
-from typing import Optional
+from typing import List, Optional
+from uuid import UUID
 import logging
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.db.database import get_db
 from src.services.collector_service import CollectorService
-from src.models.schemas import CollectionTriggerRequest, CollectionTriggerResponse
+from src.services.platform_health_service import platform_health
+from src.services.circuit_breaker_service import CircuitBreakerService
+from src.models.schemas import (
+    CollectionTriggerRequest,
+    CollectionTriggerResponse,
+    PlatformHealthResponse,
+    CircuitBreakerResponse,
+    CollectionAccountResultResponse,
+)
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1", tags=["collection"])
 @router.post("/collect", response_model=CollectionTriggerResponse, status_code=status.HTTP_200_OK)
@@ -27,8 +36,11 @@ async def trigger_collection(
             finished_at=result.finished_at,
             accounts_processed=result.accounts_processed,
             accounts_failed=result.accounts_failed,
+            accounts_skipped=result.accounts_skipped,
+            accounts_timed_out=result.accounts_timed_out,
             success_details=result.success_details,
-            error_details=result.error_details
+            error_details=result.error_details,
+            skipped_details=result.skipped_details
         )
     except Exception as e:
         logger.error(f"Collection failed: {e}", exc_info=True)
@@ -36,3 +48,54 @@ async def trigger_collection(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Collection failed: {str(e)}"
         )
+@router.post("/collect/{log_id}/retry-failed", response_model=CollectionTriggerResponse, status_code=status.HTTP_200_OK)
+async def retry_failed_collection(
+    log_id: UUID,
+    db: AsyncSession = Depends(get_db)
+) -> CollectionTriggerResponse:
+    try:
+        logger.info(f"Retry of failed accounts triggered via API for run {log_id}")
+        service = CollectorService(db)
+        result = await service.retry_failed(log_id)
+        return CollectionTriggerResponse(
+            log_id=result.log_id,
+            status=result.status,
+            started_at=result.started_at,
+            finished_at=result.finished_at,
+            accounts_processed=result.accounts_processed,
+            accounts_failed=result.accounts_failed,
+            accounts_skipped=result.accounts_skipped,
+            accounts_timed_out=result.accounts_timed_out,
+            success_details=result.success_details,
+            error_details=result.error_details,
+            skipped_details=result.skipped_details
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except Exception as e:
+        logger.error(f"Retry failed: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Retry failed: {str(e)}"
+        )
+@router.get("/collect/{log_id}/accounts", response_model=List[CollectionAccountResultResponse], status_code=status.HTTP_200_OK)
+async def get_collection_account_results(
+    log_id: UUID,
+    db: AsyncSession = Depends(get_db)
+) -> List[CollectionAccountResultResponse]:
+    try:
+        return await CollectorService(db).get_account_results(log_id)
+    except Exception as e:
+        logger.error(f"Failed to retrieve account results: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve account results: {str(e)}"
+        )
+@router.get("/platforms/health", response_model=List[PlatformHealthResponse], status_code=status.HTTP_200_OK)
+async def get_platform_health() -> List[PlatformHealthResponse]:
+    return platform_health.get_all()
+@router.get("/platforms/circuits", response_model=List[CircuitBreakerResponse], status_code=status.HTTP_200_OK)
+async def get_circuit_breakers(db: AsyncSession = Depends(get_db)) -> List[CircuitBreakerResponse]:
+    return await CircuitBreakerService(db).get_all()
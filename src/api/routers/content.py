@@ -0,0 +1,60 @@
+from typing import List, Optional
+from uuid import UUID
+import logging
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.api.conditional import conditional_get
+from src.api.pagination import decode_cursor, paginate, parse_uuid, reject_offset_with_cursor
+from src.api.responses import orm_dicts, trusted_json
+from src.db.database import get_db
+from src.models.schemas import ContentItemResponse, ContentItemStatResponse
+from src.services.content_item_service import SORT_COLUMNS, SORT_PARSERS, ContentItemService
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/api/v1/content", tags=["content"], dependencies=[Depends(conditional_get)])
+@router.get("", response_model=List[ContentItemResponse], status_code=status.HTTP_200_OK)
+async def get_content_items(
+    response: Response,
+    platform: Optional[str] = Query(None, description="Filter by platform"),
+    account_id: Optional[str] = Query(None, description="Filter by account ID"),
+    sort_by: str = Query("date", regex="^(views|likes|comments|engagement|date)$", description="Sort field"),
+    order: str = Query("desc", regex="^(asc|desc)$", description="Sort order"),
+    limit: int = Query(20, ge=1, le=200, description="Number of items per page"),
+    offset: int = Query(0, ge=0, description="Offset for pagination (not allowed together with cursor)"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
+    db: AsyncSession = Depends(get_db)
+) -> List[ContentItemResponse]:
+    try:
+        reject_offset_with_cursor(cursor, offset)
+        after = tuple(decode_cursor(cursor, SORT_PARSERS[sort_by], parse_uuid)) if cursor else None
+        items = await ContentItemService(db).list_items(
+            platform=platform,
+            account_id=account_id,
+            sort_by=sort_by,
+            order=order,
+            limit=limit + 1,
+            offset=offset,
+            after=after
+        )
+        page = paginate(response, items, limit, lambda i: (getattr(i, SORT_COLUMNS[sort_by].key), i.id))
+        return trusted_json(orm_dicts(page, ContentItemResponse), response)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to retrieve content items: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve content items: {str(e)}"
+        )
+@router.get("/{item_id}/stats", response_model=List[ContentItemStatResponse], status_code=status.HTTP_200_OK)
+async def get_content_item_stats(
+    item_id: UUID,
+    db: AsyncSession = Depends(get_db)
+) -> List[ContentItemStatResponse]:
+    try:
+        return await ContentItemService(db).get_stats(item_id)
+    except Exception as e:
+        logger.error(f"Failed to retrieve content item stats: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve content item stats: {str(e)}"
+        )
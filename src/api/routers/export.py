@@ -0,0 +1,44 @@
+from datetime import datetime
+from typing import AsyncIterator, Optional
+from uuid import UUID
+import logging
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from src.db.database import async_session_factory
+from src.services.metric_stream_service import arrow_available
+from src.services.parquet_export_service import ExportFilters, ParquetExportService
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/api/v1/export", tags=["export"])
+async def _stream_parquet(filters: ExportFilters) -> AsyncIterator[bytes]:
+    async with async_session_factory() as session:
+        async for chunk in ParquetExportService(session).iter_parquet(filters):
+            yield chunk
+@router.get("/metrics.parquet", status_code=status.HTTP_200_OK)
+async def export_metrics_parquet(
+    platform: Optional[str] = Query(None, description="Filter by platform"),
+    account_id: Optional[UUID] = Query(None, description="Filter by account ID"),
+    start_date: Optional[datetime] = Query(None, description="Start date (ISO 8601)"),
+    end_date: Optional[datetime] = Query(None, description="End date (ISO 8601)")
+) -> StreamingResponse:
+    try:
+        if not arrow_available():
+            raise HTTPException(
+                status_code=status.HTTP_501_NOT_IMPLEMENTED,
+                detail="Parquet export requires the optional pyarrow dependency"
+            )
+        filters = ExportFilters(platform=platform, account_id=account_id, start_date=start_date, end_date=end_date)
+        filename = f"metrics_{platform or 'all'}_{datetime.utcnow():%Y%m%d_%H%M%S}.parquet"
+        logger.info(f"Starting Parquet export ({filters})")
+        return StreamingResponse(
+            _stream_parquet(filters),
+            media_type="application/vnd.apache.parquet",
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to export metrics: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to export metrics: {str(e)}"
+        )
@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import Optional
+import logging
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.api.conditional import conditional_get
+from src.db.database import get_db
+from src.models.schemas import GrowthResponse
+from src.services.growth_service import GrowthService
+from src.services.response_cache import cached_response
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/api/v1/growth", tags=["growth"], dependencies=[Depends(conditional_get)])
+@router.get("", response_model=GrowthResponse, status_code=status.HTTP_200_OK)
+@cached_response()
+async def get_growth(
+    period: str = Query("7d", regex="^(7d|30d|90d)$", description="Period length"),
+    compare: str = Query("previous", regex="^(previous|start)$", description="Compare with the previous period or the start of this one"),
+    rank_by: str = Query("followers", regex="^(followers|posts_count|total_views|total_likes)$", description="Counter used for the leaderboard"),
+    platform: Optional[str] = Query(None, description="Filter by platform"),
+    end: Optional[datetime] = Query(None, description="End of the period (ISO 8601), defaults to now"),
+    limit: int = Query(10, ge=1, le=100, description="Leaderboard size"),
+    db: AsyncSession = Depends(get_db)
+) -> GrowthResponse:
+    try:
+        return await GrowthService(db).get_growth(
+            period=period,
+            compare=compare,
+            rank_by=rank_by,
+            platform=platform,
+            end=end,
+            limit=limit
+        )
+    except Exception as e:
+        logger.error(f"Failed to compute growth: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to compute growth: {str(e)}"
+        )
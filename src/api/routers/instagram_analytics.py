@@ -2,12 +2,11 @@ import logging
 from typing import Dict, List, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.db.database import get_db
 from src.db.repository import BaseRepository
 from src.models.account import Account
-from src.models.metric import Metric
+from src.services.latest_metric_service import LatestMetricService
 from src.models.schemas import (
     InstagramContentAnalysisResponse,
     InstagramDemographicsResponse,
@@ -52,15 +51,7 @@ async def analyze_instagram_content(
         logger.info(
             f"Starting content analysis for Instagram account {account_id} (@{account.display_name})"
         )
-        metric_repo = BaseRepository(Metric, db)
-        query = (
-            select(Metric)
-            .where(Metric.account_id == account_id)
-            .order_by(Metric.collected_at.desc())
-            .limit(1)
-        )
-        result = await db.execute(query)
-        latest_metric = result.scalar_one_or_none()
+        latest_metric = await LatestMetricService(db).get(account_id)
         if not latest_metric:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -151,15 +142,7 @@ async def get_instagram_demographics(
         logger.info(
             f"Fetching demographics for Instagram account {account_id} (@{account.display_name})"
         )
-        metric_repo = BaseRepository(Metric, db)
-        query = (
-            select(Metric)
-            .where(Metric.account_id == account_id)
-            .order_by(Metric.collected_at.desc())
-            .limit(1)
-        )
-        result = await db.execute(query)
-        latest_metric = result.scalar_one_or_none()
+        latest_metric = await LatestMetricService(db).get(account_id)
         if not latest_metric:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -0,0 +1,27 @@
+from datetime import datetime
+from typing import Optional
+import logging
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.api.conditional import conditional_get
+from src.db.database import get_db
+from src.models.schemas import OverviewResponse
+from src.services.overview_service import OverviewService
+from src.services.response_cache import cached_response
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/api/v1/overview", tags=["overview"], dependencies=[Depends(conditional_get)])
+@router.get("", response_model=OverviewResponse, status_code=status.HTTP_200_OK)
+@cached_response()
+async def get_overview(
+    start: Optional[datetime] = Query(None, description="Start date (ISO 8601); omit both dates for the current state"),
+    end: Optional[datetime] = Query(None, description="End date (ISO 8601)"),
+    db: AsyncSession = Depends(get_db)
+) -> OverviewResponse:
+    try:
+        return await OverviewService(db).get_overview(start, end)
+    except Exception as e:
+        logger.error(f"Failed to build overview: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to build overview: {str(e)}"
+        )
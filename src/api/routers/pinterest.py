@@ -4,10 +4,11 @@ from typing import List, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, Query, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from src.api.conditional import conditional_get
 from src.db.database import get_db
-from src.models.metric import Metric
-from src.models.account import Account
+from src.services.latest_metric_service import LatestMetricService
+from src.services.timeseries_service import TimeseriesService
+from src.services.response_cache import cached_response
 from src.models.schemas import (
     PinterestAccountResponse,
     PinterestMetricsResponse,
@@ -17,29 +18,17 @@ from src.models.schemas import (
     PinterestHistoryDataPoint,
 )
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/api/v1/pinterest", tags=["Pinterest"])
+router = APIRouter(prefix="/api/v1/pinterest", tags=["Pinterest"], dependencies=[Depends(conditional_get)])
 @router.get("/accounts", response_model=List[PinterestAccountResponse])
 async def get_pinterest_accounts(
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     db: AsyncSession = Depends(get_db)
 ) -> List[PinterestAccountResponse]:
     try:
-        query = select(Account).where(Account.platform == 'pinterest')
-        if is_active is not None:
-            query = query.where(Account.is_active == is_active)
-        query = query.order_by(Account.display_name)
+        query = LatestMetricService.accounts_with_latest(platform='pinterest', is_active=is_active)
         result = await db.execute(query)
-        accounts = result.scalars().all()
         response = []
-        for account in accounts:
-            metric_query = (
-                select(Metric)
-                .where(Metric.account_id == account.id)
-                .order_by(Metric.collected_at.desc())
-                .limit(1)
-            )
-            metric_result = await db.execute(metric_query)
-            latest_metric = metric_result.scalar_one_or_none()
+        for account, latest_metric in result.all():
             account_data = {
                 'id': account.id,
                 'account_id': account.account_id,
@@ -67,25 +56,13 @@ async def get_pinterest_accounts(
             detail=f"Failed to retrieve Pinterest accounts: {str(e)}"
         )
 @router.get("/accounts/{account_id}/metrics", response_model=PinterestMetricsResponse)
+@cached_response()
 async def get_pinterest_metrics(
     account_id: UUID,
     db: AsyncSession = Depends(get_db)
 ) -> PinterestMetricsResponse:
     try:
-        query = (
-            select(Metric)
-            .join(Account)
-            .where(
-                and_(
-                    Account.platform == 'pinterest',
-                    Metric.account_id == account_id
-                )
-            )
-            .order_by(Metric.collected_at.desc())
-            .limit(1)
-        )
-        result = await db.execute(query)
-        metric = result.scalar_one_or_none()
+        metric = await LatestMetricService(db).get(account_id, platform='pinterest')
         if not metric:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -135,42 +112,37 @@ async def get_pinterest_metrics(
             detail=f"Failed to retrieve metrics: {str(e)}"
         )
 @router.get("/accounts/{account_id}/metrics/history", response_model=PinterestHistoryResponse)
+@cached_response()
 async def get_pinterest_history(
     account_id: UUID,
     start_date: Optional[datetime] = Query(None, description="Start date (ISO 8601)"),
     end_date: Optional[datetime] = Query(None, description="End date (ISO 8601)"),
+    bucket: str = Query("day", regex="^(hour|day|week|month)$", description="Bucket size"),
     limit: int = Query(100, ge=1, le=365, description="Maximum data points"),
     db: AsyncSession = Depends(get_db)
 ) -> PinterestHistoryResponse:
     try:
-        query = (
-            select(Metric)
-            .join(Account)
-            .where(
-                and_(
-                    Account.platform == 'pinterest',
-                    Metric.account_id == account_id
-                )
-            )
+        series = await TimeseriesService(db).get_series(
+            [account_id],
+            ["followers", "posts_count", "total_views", "engagement_rate"],
+            bucket=bucket,
+            start=start_date,
+            end=end_date,
+            platform='pinterest'
         )
-        if start_date:
-            query = query.where(Metric.collected_at >= start_date)
-        if end_date:
-            query = query.where(Metric.collected_at <= end_date)
-        query = query.order_by(Metric.collected_at.asc()).limit(limit)
-        result = await db.execute(query)
-        metrics = result.scalars().all()
-        if not metrics:
+        points = series[account_id][:limit]
+        if not points:
             logger.warning(f"No metrics found for Pinterest account {account_id}")
             return PinterestHistoryResponse(account_id=account_id, data=[])
         data_points = []
-        for m in metrics:
+        for point in points:
+            values = point['values']
             data_points.append(PinterestHistoryDataPoint(
-                timestamp=m.collected_at,
-                followers=m.followers or 0,
-                pins=m.posts_count or 0,
-                monthly_views=m.total_views or 0,
-                engagement_rate=m.engagement_rate or 0.0
+                timestamp=point['bucket_start'],
+                followers=values['followers'] or 0,
+                pins=values['posts_count'] or 0,
+                monthly_views=values['total_views'] or 0,
+                engagement_rate=values['engagement_rate'] or 0.0
             ))
         logger.info(f"Retrieved {len(data_points)} historical data points for Pinterest account {account_id}")
         return PinterestHistoryResponse(account_id=account_id, data=data_points)
@@ -181,6 +153,7 @@ async def get_pinterest_history(
             detail=f"Failed to retrieve history: {str(e)}"
         )
 @router.get("/accounts/{account_id}/top-pins", response_model=PinterestTopPinsResponse)
+@cached_response()
 async def get_pinterest_top_pins(
     account_id: UUID,
     sort_by: str = Query("impressions", description="Sort field: impressions, saves, pin_clicks, outbound_clicks"),
@@ -194,20 +167,7 @@ async def get_pinterest_top_pins(
             detail=f"Invalid sort_by field. Must be one of: {', '.join(valid_sort_fields)}"
         )
     try:
-        query = (
-            select(Metric)
-            .join(Account)
-            .where(
-                and_(
-                    Account.platform == 'pinterest',
-                    Metric.account_id == account_id
-                )
-            )
-            .order_by(Metric.collected_at.desc())
-            .limit(1)
-        )
-        result = await db.execute(query)
-        metric = result.scalar_one_or_none()
+        metric = await LatestMetricService(db).get(account_id, platform='pinterest')
         if not metric:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -4,10 +4,10 @@ from typing import List, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, Query, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
+from src.api.conditional import conditional_get
 from src.db.database import get_db
-from src.models.metric import Metric
-from src.models.account import Account
+from src.services.latest_metric_service import LatestMetricService
+from src.services.response_cache import cached_response
 from src.models.schemas import (
     TelegramAccountResponse,
     TelegramMetricsResponse,
@@ -16,29 +16,17 @@ from src.models.schemas import (
     TelegramTemporalMetricsResponse,
 )
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/api/v1/telegram", tags=["Telegram"])
+router = APIRouter(prefix="/api/v1/telegram", tags=["Telegram"], dependencies=[Depends(conditional_get)])
 @router.get("/accounts", response_model=List[TelegramAccountResponse])
 async def get_telegram_accounts(
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     db: AsyncSession = Depends(get_db)
 ) -> List[TelegramAccountResponse]:
     try:
-        query = select(Account).where(Account.platform == 'telegram')
-        if is_active is not None:
-            query = query.where(Account.is_active == is_active)
-        query = query.order_by(Account.display_name)
+        query = LatestMetricService.accounts_with_latest(platform='telegram', is_active=is_active)
         result = await db.execute(query)
-        accounts = result.scalars().all()
         response = []
-        for account in accounts:
-            metric_query = (
-                select(Metric)
-                .where(Metric.account_id == account.id)
-                .order_by(Metric.collected_at.desc())
-                .limit(1)
-            )
-            metric_result = await db.execute(metric_query)
-            latest_metric = metric_result.scalar_one_or_none()
+        for account, latest_metric in result.all():
             account_data = {
                 'id': account.id,
                 'account_id': account.account_id,
@@ -65,25 +53,13 @@ async def get_telegram_accounts(
             detail=f"Failed to retrieve Telegram accounts: {str(e)}"
         )
 @router.get("/accounts/{account_id}/metrics", response_model=TelegramMetricsResponse)
+@cached_response()
 async def get_telegram_metrics(
     account_id: UUID,
     db: AsyncSession = Depends(get_db)
 ) -> TelegramMetricsResponse:
     try:
-        query = (
-            select(Metric)
-            .join(Account)
-            .where(
-                and_(
-                    Account.platform == 'telegram',
-                    Metric.account_id == account_id
-                )
-            )
-            .order_by(Metric.collected_at.desc())
-            .limit(1)
-        )
-        result = await db.execute(query)
-        metric = result.scalar_one_or_none()
+        metric = await LatestMetricService(db).get(account_id, platform='telegram')
         if not metric:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -125,6 +101,7 @@ async def get_telegram_metrics(
             detail=f"Failed to retrieve metrics: {str(e)}"
         )
 @router.get("/accounts/{account_id}/top-posts", response_model=TelegramTopPostsResponse)
+@cached_response()
 async def get_telegram_top_posts(
     account_id: UUID,
     sort_by: str = Query("views", regex="^(views|reactions|forwards)$", description="Sort by views, reactions, or forwards"),
@@ -132,20 +109,7 @@ async def get_telegram_top_posts(
     db: AsyncSession = Depends(get_db)
 ) -> TelegramTopPostsResponse:
     try:
-        query = (
-            select(Metric)
-            .join(Account)
-            .where(
-                and_(
-                    Account.platform == 'telegram',
-                    Metric.account_id == account_id
-                )
-            )
-            .order_by(Metric.collected_at.desc())
-            .limit(1)
-        )
-        result = await db.execute(query)
-        metric = result.scalar_one_or_none()
+        metric = await LatestMetricService(db).get(account_id, platform='telegram')
         if not metric:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -176,25 +140,13 @@ async def get_telegram_top_posts(
             detail=f"Failed to retrieve top posts: {str(e)}"
         )
 @router.get("/accounts/{account_id}/reactions", response_model=TelegramReactionsResponse)
+@cached_response()
 async def get_telegram_reactions(
     account_id: UUID,
     db: AsyncSession = Depends(get_db)
 ) -> TelegramReactionsResponse:
     try:
-        query = (
-            select(Metric)
-            .join(Account)
-            .where(
-                and_(
-                    Account.platform == 'telegram',
-                    Metric.account_id == account_id
-                )
-            )
-            .order_by(Metric.collected_at.desc())
-            .limit(1)
-        )
-        result = await db.execute(query)
-        metric = result.scalar_one_or_none()
+        metric = await LatestMetricService(db).get(account_id, platform='telegram')
         if not metric:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -226,25 +178,13 @@ async def get_telegram_reactions(
             detail=f"Failed to retrieve reactions: {str(e)}"
         )
 @router.get("/accounts/{account_id}/temporal-metrics", response_model=TelegramTemporalMetricsResponse)
+@cached_response()
 async def get_telegram_temporal_metrics(
     account_id: UUID,
     db: AsyncSession = Depends(get_db)
 ) -> TelegramTemporalMetricsResponse:
     try:
-        query = (
-            select(Metric)
-            .join(Account)
-            .where(
-                and_(
-                    Account.platform == 'telegram',
-                    Metric.account_id == account_id
-                )
-            )
-            .order_by(Metric.collected_at.desc())
-            .limit(1)
-        )
-        result = await db.execute(query)
-        metric = result.scalar_one_or_none()
+        metric = await LatestMetricService(db).get(account_id, platform='telegram')
         if not metric:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -4,10 +4,10 @@ from typing import List, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, Query, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from src.api.conditional import conditional_get
 from src.db.database import get_db
-from src.models.metric import Metric
-from src.models.account import Account
+from src.services.latest_metric_service import LatestMetricService
+from src.services.timeseries_service import TimeseriesService
 from src.models.schemas import (
     TikTokAccountResponse,
     TikTokMetricsResponse,
@@ -17,30 +17,19 @@ from src.models.schemas import (
     TikTokHistoryDataPoint,
 )
 from src.services.tiktok.content_analyzer import TikTokContentAnalyzer
+from src.services.response_cache import cached_response
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/api/v1/tiktok", tags=["TikTok"])
+router = APIRouter(prefix="/api/v1/tiktok", tags=["TikTok"], dependencies=[Depends(conditional_get)])
 @router.get("/accounts", response_model=List[TikTokAccountResponse])
 async def get_tiktok_accounts(
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     db: AsyncSession = Depends(get_db)
 ) -> List[TikTokAccountResponse]:
     try:
-        query = select(Account).where(Account.platform == 'tiktok')
-        if is_active is not None:
-            query = query.where(Account.is_active == is_active)
-        query = query.order_by(Account.display_name)
+        query = LatestMetricService.accounts_with_latest(platform='tiktok', is_active=is_active)
         result = await db.execute(query)
-        accounts = result.scalars().all()
         response = []
-        for account in accounts:
-            metric_query = (
-                select(Metric)
-                .where(Metric.account_id == account.id)
-                .order_by(Metric.collected_at.desc())
-                .limit(1)
-            )
-            metric_result = await db.execute(metric_query)
-            latest_metric = metric_result.scalar_one_or_none()
+        for account, latest_metric in result.all():
             account_data = {
                 'id': account.id,
                 'account_id': account.account_id,
@@ -67,25 +56,13 @@ async def get_tiktok_accounts(
             detail=f"Failed to retrieve TikTok accounts: {str(e)}"
         )
 @router.get("/accounts/{account_id}/metrics", response_model=TikTokMetricsResponse)
+@cached_response()
 async def get_tiktok_metrics(
     account_id: UUID,
     db: AsyncSession = Depends(get_db)
 ) -> TikTokMetricsResponse:
     try:
-        query = (
-            select(Metric)
-            .join(Account)
-            .where(
-                and_(
-                    Account.platform == 'tiktok',
-                    Metric.account_id == account_id
-                )
-            )
-            .order_by(Metric.collected_at.desc())
-            .limit(1)
-        )
-        result = await db.execute(query)
-        metric = result.scalar_one_or_none()
+        metric = await LatestMetricService(db).get(account_id, platform='tiktok')
         if not metric:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -129,43 +106,38 @@ async def get_tiktok_metrics(
             detail=f"Failed to retrieve metrics: {str(e)}"
         )
 @router.get("/accounts/{account_id}/metrics/history", response_model=TikTokHistoryResponse)
+@cached_response()
 async def get_tiktok_history(
     account_id: UUID,
     start_date: Optional[datetime] = Query(None, description="Start date (ISO 8601)"),
     end_date: Optional[datetime] = Query(None, description="End date (ISO 8601)"),
+    bucket: str = Query("day", regex="^(hour|day|week|month)$", description="Bucket size"),
     limit: int = Query(100, ge=1, le=365, description="Maximum data points"),
     db: AsyncSession = Depends(get_db)
 ) -> TikTokHistoryResponse:
     try:
-        query = (
-            select(Metric)
-            .join(Account)
-            .where(
-                and_(
-                    Account.platform == 'tiktok',
-                    Metric.account_id == account_id
-                )
-            )
+        series = await TimeseriesService(db).get_series(
+            [account_id],
+            ["followers", "posts_count", "total_views", "total_likes", "engagement_rate"],
+            bucket=bucket,
+            start=start_date,
+            end=end_date,
+            platform='tiktok'
         )
-        if start_date:
-            query = query.where(Metric.collected_at >= start_date)
-        if end_date:
-            query = query.where(Metric.collected_at <= end_date)
-        query = query.order_by(Metric.collected_at.asc()).limit(limit)
-        result = await db.execute(query)
-        metrics = result.scalars().all()
-        if not metrics:
+        points = series[account_id][:limit]
+        if not points:
             logger.warning(f"No metrics found for TikTok account {account_id}")
             return TikTokHistoryResponse(account_id=account_id, data=[])
         data_points = []
-        for m in metrics:
+        for point in points:
+            values = point['values']
             data_points.append({
-                'timestamp': m.collected_at,
-                'followers': m.followers or 0,
-                'videos': m.posts_count or 0,
-                'total_views': m.total_views or 0,
-                'total_likes': m.total_likes or 0,
-                'engagement_rate': m.engagement_rate or 0.0
+                'timestamp': point['bucket_start'],
+                'followers': values['followers'] or 0,
+                'videos': values['posts_count'] or 0,
+                'total_views': values['total_views'] or 0,
+                'total_likes': values['total_likes'] or 0,
+                'engagement_rate': values['engagement_rate'] or 0.0
             })
         logger.info(f"Retrieved {len(data_points)} historical data points for TikTok account {account_id}")
         return TikTokHistoryResponse(account_id=account_id, data=data_points)
@@ -176,26 +148,14 @@ async def get_tiktok_history(
             detail=f"Failed to retrieve history: {str(e)}"
         )
 @router.get("/accounts/{account_id}/analytics/content", response_model=TikTokContentAnalyticsResponse)
+@cached_response()
 async def get_content_analytics(
     account_id: UUID,
     viral_threshold: float = Query(3.0, ge=1.5, le=5.0, description="Viral threshold multiplier"),
     db: AsyncSession = Depends(get_db)
 ) -> TikTokContentAnalyticsResponse:
     try:
-        query = (
-            select(Metric)
-            .join(Account)
-            .where(
-                and_(
-                    Account.platform == 'tiktok',
-                    Metric.account_id == account_id
-                )
-            )
-            .order_by(Metric.collected_at.desc())
-            .limit(1)
-        )
-        result = await db.execute(query)
-        metric = result.scalar_one_or_none()
+        metric = await LatestMetricService(db).get(account_id, platform='tiktok')
         if not metric:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
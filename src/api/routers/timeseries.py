@@ -0,0 +1,55 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+import logging
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.api.conditional import conditional_get
+from src.db.database import get_db
+from src.models.schemas import TimeseriesResponse
+from src.services.timeseries_service import TimeseriesService
+from src.services.response_cache import cached_response
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/api/v1/timeseries", tags=["timeseries"], dependencies=[Depends(conditional_get)])
+@router.get("", response_model=TimeseriesResponse, status_code=status.HTTP_200_OK)
+@cached_response()
+async def get_timeseries(
+    account_id: List[UUID] = Query(..., description="Account UUID (repeat for several accounts)"),
+    metrics: str = Query("followers", description="Comma-separated metrics to aggregate"),
+    bucket: str = Query("day", regex="^(hour|day|week|month)$", description="Bucket size"),
+    agg: str = Query("last", regex="^(last|avg|max)$", description="Aggregate within each bucket"),
+    start_date: Optional[datetime] = Query(None, description="Start date (ISO 8601)"),
+    end_date: Optional[datetime] = Query(None, description="End date (ISO 8601)"),
+    db: AsyncSession = Depends(get_db)
+) -> TimeseriesResponse:
+    try:
+        metric_list = [metric.strip() for metric in metrics.split(",") if metric.strip()]
+        try:
+            series = await TimeseriesService(db).get_series(
+                account_id,
+                metric_list,
+                bucket=bucket,
+                agg=agg,
+                start=start_date,
+                end=end_date
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        logger.info(f"Retrieved {bucket} time series for {len(account_id)} accounts ({agg} of {metrics})")
+        return TimeseriesResponse(
+            bucket=bucket,
+            agg=agg,
+            metrics=metric_list,
+            series=[{"account_id": key, "points": points} for key, points in series.items()]
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to retrieve time series: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve time series: {str(e)}"
+        )
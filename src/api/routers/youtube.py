@@ -1,69 +1,60 @@
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Optional
-from fastapi import APIRouter, Depends, Query, HTTPException, status
+from uuid import UUID
+from fastapi import APIRouter, Depends, Query, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from src.api.conditional import conditional_get
+from src.api.pagination import decode_cursor, paginate, parse_uuid, reject_offset_with_cursor
+from src.api.responses import trusted_json
 from src.db.database import get_db
-from src.models.metric import Metric
-from src.models.account import Account
+from src.models.content_item import ContentItem
+from src.services.content_item_service import SORT_COLUMNS, SORT_PARSERS, ContentItemService
+from src.services.timeseries_service import TimeseriesService
+from src.services.response_cache import cached_response
 from src.models.schemas import YouTubeVideoResponse, YouTubeHistoryResponse
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/api/v1/youtube", tags=["YouTube"])
+router = APIRouter(prefix="/api/v1/youtube", tags=["YouTube"], dependencies=[Depends(conditional_get)])
+PERIOD_DAYS = {"7d": 7, "30d": 30, "90d": 90}
+def _video_response(item: ContentItem) -> dict:
+    return {
+        'video_id': item.external_id,
+        'title': item.caption or 'Unknown',
+        'published_at': item.published_at.isoformat() if item.published_at else '',
+        'views': item.views or 0,
+        'likes': item.likes or 0,
+        'comments': item.comments or 0,
+        'engagement_rate': item.engagement_rate or 0.0,
+        'account_id': str(item.account_id)
+    }
 @router.get("/videos", response_model=list[YouTubeVideoResponse])
 async def get_youtube_videos(
+    response: Response,
     account_id: Optional[str] = Query(None, description="Filter by account ID"),
     limit: int = Query(20, ge=1, le=100, description="Number of videos per page"),
-    offset: int = Query(0, ge=0, description="Offset for pagination"),
+    offset: int = Query(0, ge=0, description="Offset for pagination (not allowed together with cursor)"),
     sort_by: str = Query("date", regex="^(views|likes|comments|engagement|date)$", description="Sort field"),
     order: str = Query("desc", regex="^(asc|desc)$", description="Sort order"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
     db: AsyncSession = Depends(get_db)
 ) -> list[YouTubeVideoResponse]:
     try:
-        stmt = select(Metric).join(Account).where(Account.platform == 'youtube')
-        if account_id:
-            stmt = stmt.where(Metric.account_id == account_id)
-        stmt = stmt.order_by(Metric.collected_at.desc()).limit(10 if account_id else 100)
-        result = await db.execute(stmt)
-        metrics = result.scalars().all()
-        if not metrics:
-            return []
-        all_videos = []
-        for metric in metrics:
-            extra_data = metric.extra_data or {}
-            recent_videos = extra_data.get('recent_videos', [])
-            for video in recent_videos:
-                views = video.get('views', 0)
-                likes = video.get('likes', 0)
-                comments = video.get('comments', 0)
-                engagement_rate = ((likes + comments) / views * 100) if views > 0 else 0
-                all_videos.append({
-                    'video_id': video.get('video_id', ''),
-                    'title': video.get('title', 'Unknown'),
-                    'published_at': video.get('published_at', ''),
-                    'views': views,
-                    'likes': likes,
-                    'comments': comments,
-                    'engagement_rate': round(engagement_rate, 2),
-                    'account_id': str(metric.account_id)
-                })
-        reverse = (order == 'desc')
-        if sort_by == 'views':
-            all_videos.sort(key=lambda v: v['views'], reverse=reverse)
-        elif sort_by == 'likes':
-            all_videos.sort(key=lambda v: v['likes'], reverse=reverse)
-        elif sort_by == 'comments':
-            all_videos.sort(key=lambda v: v['comments'], reverse=reverse)
-        elif sort_by == 'engagement':
-            all_videos.sort(key=lambda v: v['engagement_rate'], reverse=reverse)
-        else:
-            all_videos.sort(
-                key=lambda v: v['published_at'],
-                reverse=reverse
-            )
-        paginated = all_videos[offset:offset + limit]
-        logger.info(f"Retrieved {len(paginated)} videos (total: {len(all_videos)})")
-        return paginated
+        reject_offset_with_cursor(cursor, offset)
+        after = tuple(decode_cursor(cursor, SORT_PARSERS[sort_by], parse_uuid)) if cursor else None
+        items = await ContentItemService(db).list_items(
+            platform='youtube',
+            account_id=account_id,
+            sort_by=sort_by,
+            order=order,
+            limit=limit + 1,
+            offset=offset,
+            after=after
+        )
+        page = paginate(response, items, limit, lambda i: (getattr(i, SORT_COLUMNS[sort_by].key), i.id))
+        logger.info(f"Retrieved {len(page)} videos")
+        return trusted_json([_video_response(item) for item in page], response)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error retrieving YouTube videos: {e}", exc_info=True)
         raise HTTPException(
@@ -71,6 +62,7 @@ async def get_youtube_videos(
             detail=f"Failed to retrieve videos: {str(e)}"
         )
 @router.get("/top-videos", response_model=list[YouTubeVideoResponse])
+@cached_response()
 async def get_top_videos(
     metric: str = Query(..., regex="^(views|likes|comments|engagement)$", description="Metric to rank by"),
     period: str = Query("30d", regex="^(7d|30d|90d|all)$", description="Time period"),
@@ -79,44 +71,19 @@ async def get_top_videos(
     db: AsyncSession = Depends(get_db)
 ) -> list[YouTubeVideoResponse]:
     try:
-        stmt = select(Metric).join(Account).where(Account.platform == 'youtube')
-        if account_id:
-            stmt = stmt.where(Metric.account_id == account_id)
-        stmt = stmt.order_by(Metric.collected_at.desc()).limit(10 if account_id else 100)
-        result = await db.execute(stmt)
-        metrics = result.scalars().all()
-        if not metrics:
-            return []
-        all_videos = []
-        for m in metrics:
-            extra_data = m.extra_data or {}
-            videos = extra_data.get('recent_videos', [])
-            for video in videos:
-                views = video.get('views', 0)
-                likes = video.get('likes', 0)
-                comments = video.get('comments', 0)
-                engagement_rate = ((likes + comments) / views * 100) if views > 0 else 0
-                all_videos.append({
-                    'video_id': video.get('video_id', ''),
-                    'title': video.get('title', 'Unknown'),
-                    'published_at': video.get('published_at', ''),
-                    'views': views,
-                    'likes': likes,
-                    'comments': comments,
-                    'engagement_rate': round(engagement_rate, 2),
-                    'account_id': str(m.account_id)
-                })
-        if metric == 'views':
-            all_videos.sort(key=lambda v: v['views'], reverse=True)
-        elif metric == 'likes':
-            all_videos.sort(key=lambda v: v['likes'], reverse=True)
-        elif metric == 'comments':
-            all_videos.sort(key=lambda v: v['comments'], reverse=True)
-        elif metric == 'engagement':
-            all_videos.sort(key=lambda v: v['engagement_rate'], reverse=True)
-        top_videos = all_videos[:limit]
-        logger.info(f"Retrieved top {len(top_videos)} videos by {metric}")
-        return top_videos
+        published_after = None
+        if period in PERIOD_DAYS:
+            published_after = datetime.now(timezone.utc) - timedelta(days=PERIOD_DAYS[period])
+        items = await ContentItemService(db).list_items(
+            platform='youtube',
+            account_id=account_id,
+            sort_by=metric,
+            order='desc',
+            limit=limit,
+            published_after=published_after
+        )
+        logger.info(f"Retrieved top {len(items)} videos by {metric}")
+        return [_video_response(item) for item in items]
     except Exception as e:
         logger.error(f"Error retrieving top videos: {e}", exc_info=True)
         raise HTTPException(
@@ -124,6 +91,7 @@ async def get_top_videos(
             detail=f"Failed to retrieve top videos: {str(e)}"
         )
 @router.get("/history", response_model=YouTubeHistoryResponse)
+@cached_response()
 async def get_youtube_history(
     account_id: str = Query(..., description="YouTube account ID"),
     start_date: Optional[datetime] = Query(None, description="Start date (ISO 8601)"),
@@ -132,20 +100,16 @@ async def get_youtube_history(
     db: AsyncSession = Depends(get_db)
 ) -> YouTubeHistoryResponse:
     try:
-        stmt = select(Metric).join(Account).where(
-            and_(
-                Account.platform == 'youtube',
-                Metric.account_id == account_id
-            )
+        series = await TimeseriesService(db).get_series(
+            [UUID(account_id)],
+            ["followers", "posts_count", "total_views", "engagement_rate", "youtube_avg_likes_30d"],
+            bucket=granularity,
+            start=start_date,
+            end=end_date,
+            platform='youtube'
         )
-        if start_date:
-            stmt = stmt.where(Metric.collected_at >= start_date)
-        if end_date:
-            stmt = stmt.where(Metric.collected_at <= end_date)
-        stmt = stmt.order_by(Metric.collected_at.asc())
-        result = await db.execute(stmt)
-        metrics = result.scalars().all()
-        if not metrics:
+        points = series[UUID(account_id)]
+        if not points:
             logger.warning(f"No metrics found for account {account_id}")
             return YouTubeHistoryResponse(
                 account_id=account_id,
@@ -153,16 +117,15 @@ async def get_youtube_history(
                 data=[]
             )
         data_points = []
-        for m in metrics:
-            extra_data = m.extra_data or {}
-            metrics_30d = extra_data.get('metrics_30d', {})
+        for point in points:
+            values = point['values']
             data_points.append({
-                'timestamp': m.collected_at.isoformat(),
-                'subscribers': m.followers or 0,
-                'videos': m.posts_count or 0,
-                'total_views': m.total_views or 0,
-                'engagement_rate': m.engagement_rate or 0.0,
-                'avg_likes': metrics_30d.get('avg_likes_per_video', 0.0)
+                'timestamp': point['bucket_start'].isoformat(),
+                'subscribers': values['followers'] or 0,
+                'videos': values['posts_count'] or 0,
+                'total_views': values['total_views'] or 0,
+                'engagement_rate': values['engagement_rate'] or 0.0,
+                'avg_likes': values['youtube_avg_likes_30d'] or 0.0
             })
         logger.info(f"Retrieved {len(data_points)} data points for account {account_id}")
         return YouTubeHistoryResponse(
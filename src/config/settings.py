@@ -121,6 +121,164 @@ class Settings(BaseSettings):
         default=1.0,
         description="Initial retry delay in seconds (exponential backoff)",
     )
+    profile_refresh_hours: int = Field(
+        default=24,
+        description="Refresh interval for slow-changing profile fields (bio, avatar, description)",
+    )
+    audience_refresh_hours: int = Field(
+        default=168,
+        description="Refresh interval for audience/demographics reports",
+    )
+    platform_health_ttl_seconds: int = Field(
+        default=900,
+        description="How long a platform availability probe result is reused (seconds)",
+    )
+    platform_failure_threshold: int = Field(
+        default=3,
+        description="Consecutive account failures before a platform is treated as unavailable",
+    )
+    circuit_breaker_failure_threshold: int = Field(
+        default=3,
+        description="Consecutive failures per platform/credential before the circuit opens",
+    )
+    circuit_breaker_cooldown_seconds: int = Field(
+        default=1800,
+        description="How long an open circuit skips accounts before a half-open trial (seconds)",
+    )
+    collect_account_timeout_seconds: int = Field(
+        default=300,
+        description="Default time budget for collecting one account (seconds)",
+    )
+    collect_account_timeout_overrides: dict[str, int] = Field(
+        default={"dzen": 600, "wibes": 600, "telegram": 180},
+        description="Per-platform account time budgets overriding the default (seconds)",
+    )
+    collection_retry_attempts: int = Field(
+        default=2,
+        description="Automatic follow-up retries of failed accounts after a scheduled run",
+    )
+    collection_retry_backoff_minutes: int = Field(
+        default=15,
+        description="Delay before the first follow-up retry; doubles for each further attempt",
+    )
+    parser_close_timeout_seconds: int = Field(
+        default=30,
+        description="Time allowed for a parser to release its resources (seconds)",
+    )
+    metrics_partition_months_ahead: int = Field(
+        default=3,
+        description="Number of future monthly metrics partitions kept pre-created",
+    )
+    retention_enabled: bool = Field(
+        default=False,
+        description="Run the daily retention and downsampling job and drop metrics partitions older than every daily_days policy",
+    )
+    retention_raw_days: int = Field(
+        default=30,
+        description="Keep every raw metrics snapshot for this many days",
+    )
+    retention_daily_days: int = Field(
+        default=365,
+        description="Keep one stripped snapshot per account per day up to this age; older history lives in weekly rollups",
+    )
+    retention_platform_overrides: dict[str, dict[str, int]] = Field(
+        default={},
+        description="Per-platform overrides of raw_days/daily_days, e.g. {\"telegram\": {\"raw_days\": 60}}",
+    )
+    retention_heavy_keys: list[str] = Field(
+        default=[
+            "recent_videos",
+            "recent_media",
+            "top_pins",
+            "recent_posts",
+            "recent_posts_stats",
+            "top_posts_by_views",
+            "top_posts_by_reactions",
+        ],
+        description="extra_data keys stripped from snapshots once they leave the raw window",
+    )
+    retention_table_days: dict[str, int] = Field(
+        default={
+            "instagram_story_snapshots": 90,
+            "metrics_rollup_hour": 90,
+            "metrics_rollup_day": 730,
+            "content_item_stats": 365,
+            "raw_payloads": 365,
+        },
+        description="Row retention in days for secondary time-series tables",
+    )
+    retention_batch_size: int = Field(
+        default=1000,
+        description="Rows deleted or rewritten per retention batch",
+    )
+    metrics_extra_data_storage: str = Field(
+        default="inline",
+        description="How metrics.extra_data is written: inline (full document) or blobs (large sub-documents stored once by hash)",
+    )
+    metrics_blob_min_bytes: int = Field(
+        default=512,
+        description="Serialized size from which an extra_data sub-document is moved to extra_data_blobs",
+    )
+    raw_archive_enabled: bool = Field(
+        default=False,
+        description="Archive raw parser payloads (scraped HTML, API JSON) for offline re-parsing",
+    )
+    raw_archive_platforms: list[str] = Field(
+        default=["dzen", "wibes"],
+        description="Platforms whose raw payloads are archived when raw_archive_enabled is set",
+    )
+    reparse_workers: int = Field(
+        default=4,
+        description="Worker processes used by the offline re-parse command",
+    )
+    recompute_workers: int = Field(
+        default=4,
+        description="Worker processes used to evaluate engagement formulas during a recompute",
+    )
+    recompute_chunk_size: int = Field(
+        default=5000,
+        description="Snapshots per recompute chunk (one worker task and one batched UPDATE)",
+    )
+    metrics_stream_chunk_size: int = Field(
+        default=2000,
+        description="Rows fetched per server-side cursor round trip when streaming metrics as NDJSON or Arrow",
+    )
+    export_row_group_size: int = Field(
+        default=100000,
+        description="Rows per Parquet row group in metric exports",
+    )
+    response_cache_backend: str = Field(
+        default="memory",
+        description="Read endpoint response cache: memory (per process LRU), redis, or off",
+    )
+    response_cache_ttl_seconds: int = Field(
+        default=900,
+        description="Upper bound on how long a cached response is served",
+    )
+    response_cache_max_entries: int = Field(
+        default=2048,
+        description="Maximum entries kept by the in-process response cache",
+    )
+    redis_url: Optional[str] = Field(
+        default=None,
+        description="Redis connection URL used when response_cache_backend is redis",
+    )
+    http_cache_max_age_seconds: int = Field(
+        default=0,
+        description="Cache-Control max-age sent with ETagged GET responses (0 forces revalidation)",
+    )
+    compression_minimum_size: int = Field(
+        default=1024,
+        description="Smallest response body in bytes that is gzip/brotli compressed",
+    )
+    compression_gzip_level: int = Field(
+        default=6,
+        description="zlib level used for gzip responses (1-9)",
+    )
+    compression_brotli_quality: int = Field(
+        default=4,
+        description="Brotli quality used for br responses (0-11)",
+    )
     api_timeout_seconds: int = Field(
         default=30,
         description="Timeout for API requests in seconds",
@@ -161,6 +319,22 @@ class Settings(BaseSettings):
         if v not in valid_envs:
             raise ValueError(f"environment must be one of {valid_envs}")
         return v
+    @field_validator("response_cache_backend")
+    @classmethod
+    def validate_response_cache_backend(cls, v: str) -> str:
+        valid_backends = ["memory", "redis", "off"]
+        v = v.lower()
+        if v not in valid_backends:
+            raise ValueError(f"response_cache_backend must be one of {valid_backends}")
+        return v
+    @field_validator("metrics_extra_data_storage")
+    @classmethod
+    def validate_metrics_extra_data_storage(cls, v: str) -> str:
+        valid_modes = ["inline", "blobs"]
+        v = v.lower()
+        if v not in valid_modes:
+            raise ValueError(f"metrics_extra_data_storage must be one of {valid_modes}")
+        return v
     @field_validator("token_encryption_key")
     @classmethod
     def validate_encryption_key(cls, v: str) -> str:
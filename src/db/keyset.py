@@ -0,0 +1,16 @@
+from typing import Any, Sequence
+from sqlalchemy import and_, or_, tuple_
+from sqlalchemy.sql import ColumnElement
+def after_desc(columns: Sequence[ColumnElement], values: Sequence[Any]) -> ColumnElement:
+    return tuple_(*columns) < tuple_(*values)
+def after_nullable(
+    column: ColumnElement,
+    tiebreak: ColumnElement,
+    value: Any,
+    last_id: Any,
+    descending: bool
+) -> ColumnElement:
+    if value is None:
+        return and_(column.is_(None), tiebreak > last_id)
+    beyond = column < value if descending else column > value
+    return or_(beyond, and_(column == value, tiebreak > last_id), column.is_(None))
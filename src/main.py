@@ -4,8 +4,12 @@ from typing import AsyncGenerator, Optional
 from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.ext.asyncio import AsyncSession
+from src.api.compression import CompressionMiddleware
+from src.api.conditional import ETAG_HEADER
 from src.api.dependencies import verify_database_connection
-from src.api.routers import collection, accounts, youtube, oauth, instagram, instagram_stories, instagram_analytics, instagram_insights, tiktok, telegram, pinterest
+from src.api.pagination import NEXT_CURSOR_HEADER
+from src.api.responses import FastJSONResponse
+from src.api.routers import collection, accounts, youtube, oauth, instagram, instagram_stories, instagram_analytics, instagram_insights, tiktok, telegram, pinterest, content, export, timeseries, overview, growth
 from src.config.settings import get_settings
 from src.db.database import get_db
 from src.models.schemas import HealthResponse
@@ -33,6 +37,7 @@ app = FastAPI(
     description="REST API for NIGINart Social Media Analytics Dashboard",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 app.add_middleware(
     CORSMiddleware,
@@ -40,6 +45,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, ETAG_HEADER],
+)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_minimum_size,
+    gzip_level=settings.compression_gzip_level,
+    brotli_quality=settings.compression_brotli_quality,
 )
 app.include_router(collection.router)
 app.include_router(accounts.router)
@@ -52,6 +64,11 @@ app.include_router(instagram_insights.router)
 app.include_router(tiktok.router)
 app.include_router(telegram.router)
 app.include_router(pinterest.router)
+app.include_router(content.router)
+app.include_router(export.router)
+app.include_router(timeseries.router)
+app.include_router(overview.router)
+app.include_router(growth.router)
 @app.get("/api/v1/health", response_model=HealthResponse)
 async def health_check(db: AsyncSession = Depends(get_db)) -> HealthResponse:
     db_status = await verify_database_connection(db)
@@ -1,5 +1,17 @@
 from src.models.account import Account
+from src.models.account_latest_metric import AccountLatestMetric
+from src.models.account_profile_attribute import AccountProfileAttribute
 from src.models.base import Base
+from src.models.circuit_breaker import CircuitBreaker
+from src.models.collection_account_result import CollectionAccountResult
 from src.models.collection_log import CollectionLog
+from src.models.content_item import ContentItem
+from src.models.content_item_stat import ContentItemStat
+from src.models.data_version import DataVersion
+from src.models.extra_data_blob import ExtraDataBlob
 from src.models.metric import Metric
-__all__ = ["Base", "Account", "Metric", "CollectionLog"]
+from src.models.metric_rollup import MetricRollupDay, MetricRollupHour, MetricRollupWeek
+from src.models.raw_payload import RawPayload
+from src.models.recompute_job import RecomputeJob
+from src.models.retention_watermark import RetentionWatermark
+__all__ = ["Base", "Account", "Metric", "CollectionLog", "AccountProfileAttribute", "CircuitBreaker", "CollectionAccountResult", "ContentItem", "ContentItemStat", "MetricRollupHour", "MetricRollupDay", "MetricRollupWeek", "RetentionWatermark", "AccountLatestMetric", "ExtraDataBlob", "RawPayload", "RecomputeJob", "DataVersion"]
@@ -1,16 +1,18 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
-from sqlalchemy import Boolean, String, Text, DateTime
+from sqlalchemy import Boolean, DateTime, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.models.base import Base, TimestampMixin, UUIDMixin
 if TYPE_CHECKING:
     from src.models.metric import Metric
 class Account(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "accounts"
+    __table_args__ = (
+        Index("ix_accounts_platform_active_name", "platform", "is_active", "display_name"),
+    )
     platform: Mapped[str] = mapped_column(
         String(50),
         nullable=False,
-        index=True,
         comment="Platform name (instagram, telegram, youtube, etc.)",
     )
     account_id: Mapped[str] = mapped_column(
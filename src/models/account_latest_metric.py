@@ -0,0 +1,103 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+from sqlalchemy import DateTime, Float, ForeignKey, Integer, event, func, inspect
+from sqlalchemy.dialects.postgresql import JSONB, insert
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+from src.models.base import Base
+from src.models.extra_data_blob import FULL_EXTRA_DATA_KEY
+from src.models.metric import Metric
+SNAPSHOT_COLUMNS = (
+    "collected_at",
+    "followers",
+    "posts_count",
+    "total_likes",
+    "total_comments",
+    "total_views",
+    "total_shares",
+    "engagement_rate",
+    "extra_data",
+)
+class AccountLatestMetric(Base):
+    __tablename__ = "account_latest_metrics"
+    account_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("accounts.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="Reference to account",
+    )
+    metric_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        nullable=False,
+        comment="ID of the metrics row this snapshot was copied from",
+    )
+    collected_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="Timestamp when data was collected",
+    )
+    followers: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Number of followers/subscribers",
+    )
+    posts_count: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Total number of posts/videos",
+    )
+    total_likes: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Total likes across recent posts",
+    )
+    total_comments: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Total comments across recent posts",
+    )
+    total_views: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Total views (for video platforms)",
+    )
+    total_shares: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Total shares/reposts",
+    )
+    engagement_rate: Mapped[Optional[float]] = mapped_column(
+        Float,
+        nullable=True,
+        comment="Engagement rate percentage",
+    )
+    extra_data: Mapped[Optional[dict]] = mapped_column(
+        JSONB,
+        nullable=True,
+        comment="Additional platform-specific metrics",
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+    def __repr__(self) -> str:
+        return f"<AccountLatestMetric {self.account_id} at {self.collected_at}>"
+@event.listens_for(Metric, "after_insert")
+def sync_latest_metric(mapper, connection, target: Metric) -> None:
+    values = {column: getattr(target, column) for column in SNAPSHOT_COLUMNS}
+    values["extra_data"] = inspect(target).info.pop(FULL_EXTRA_DATA_KEY, target.extra_data)
+    stmt = insert(AccountLatestMetric).values(account_id=target.account_id, metric_id=target.id, **values)
+    connection.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[AccountLatestMetric.account_id],
+            set_={
+                "metric_id": stmt.excluded.metric_id,
+                **{column: getattr(stmt.excluded, column) for column in SNAPSHOT_COLUMNS},
+                "updated_at": func.now(),
+            },
+            where=stmt.excluded.collected_at >= AccountLatestMetric.collected_at
+        )
+    )
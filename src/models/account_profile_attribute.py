@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+from src.models.base import Base, TimestampMixin
+class AccountProfileAttribute(Base, TimestampMixin):
+    __tablename__ = "account_profile_attributes"
+    account_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("accounts.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="Reference to account",
+    )
+    field: Mapped[str] = mapped_column(
+        String(100),
+        primary_key=True,
+        comment="Profile field name (bio_description, avatar_url, etc.)",
+    )
+    refresh_group: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        comment="Refresh cadence group (profile, audience)",
+    )
+    value: Mapped[Optional[Any]] = mapped_column(
+        JSONB,
+        nullable=True,
+        comment="Cached field value",
+    )
+    refreshed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="When the field was last fetched from the platform",
+    )
+    def __repr__(self) -> str:
+        return f"<AccountProfileAttribute {self.account_id}:{self.field}>"
@@ -0,0 +1,59 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import DateTime, Integer, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+from src.models.base import Base
+class CircuitBreaker(Base):
+    __tablename__ = "circuit_breakers"
+    key: Mapped[str] = mapped_column(
+        String(300),
+        primary_key=True,
+        nullable=False,
+        comment="Breaker key (platform:credential)",
+    )
+    platform: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+        index=True,
+        comment="Platform name",
+    )
+    credential: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+        comment="Credential scope (account UUID for OAuth platforms, 'default' for shared keys)",
+    )
+    state: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        default="closed",
+        comment="State: closed, open, half_open",
+    )
+    failure_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Consecutive failures since last success",
+    )
+    opened_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="When the breaker last opened or started a half-open trial",
+    )
+    last_failure_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Last failure timestamp",
+    )
+    last_error: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True,
+        comment="Last failure message",
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+    def __repr__(self) -> str:
+        return f"<CircuitBreaker {self.key} {self.state}>"
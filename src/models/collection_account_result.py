@@ -0,0 +1,54 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+from src.models.base import Base, UUIDMixin
+class CollectionAccountResult(Base, UUIDMixin):
+    __tablename__ = "collection_account_results"
+    __table_args__ = (
+        UniqueConstraint("log_id", "account_id", name="uq_collection_account_results_log_account"),
+    )
+    log_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("collection_logs.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="Reference to collection run",
+    )
+    account_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("accounts.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="Reference to account",
+    )
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        comment="Outcome: success, failed, timed_out, skipped",
+    )
+    error: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True,
+        comment="Error or skip reason",
+    )
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=1,
+        comment="Number of attempts within this run",
+    )
+    started_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="Start of the latest attempt",
+    )
+    finished_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="End of the latest attempt",
+    )
+    def __repr__(self) -> str:
+        return f"<CollectionAccountResult {self.log_id}:{self.account_id} {self.status}>"
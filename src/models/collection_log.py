@@ -19,7 +19,7 @@ class CollectionLog(Base, UUIDMixin):
     status: Mapped[str] = mapped_column(
         String(20),
         nullable=False,
-        comment="Status: success, partial, failed",
+        comment="Status: running, success, partial, skipped, failed",
     )
     accounts_processed: Mapped[int] = mapped_column(
         Integer,
@@ -33,6 +33,18 @@ class CollectionLog(Base, UUIDMixin):
         nullable=False,
         comment="Number of accounts that failed",
     )
+    accounts_skipped: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        nullable=False,
+        comment="Number of accounts skipped (open circuit or platform unavailable)",
+    )
+    accounts_timed_out: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        nullable=False,
+        comment="Number of accounts that exceeded their collection time budget",
+    )
     error_message: Mapped[Optional[str]] = mapped_column(
         Text,
         nullable=True,
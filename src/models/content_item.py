@@ -0,0 +1,98 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String, Text, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+from src.models.base import Base, TimestampMixin, UUIDMixin
+class ContentItem(Base, UUIDMixin, TimestampMixin):
+    __tablename__ = "content_items"
+    __table_args__ = (
+        UniqueConstraint("account_id", "external_id", name="uq_content_items_account_external"),
+        Index("ix_content_items_platform_published", "platform", "published_at"),
+        Index("ix_content_items_platform_views", "platform", "views"),
+        Index("ix_content_items_account_published", "account_id", "published_at"),
+    )
+    account_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("accounts.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Reference to account",
+    )
+    platform: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+        comment="Platform name",
+    )
+    external_id: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+        comment="Platform-specific post/video ID",
+    )
+    content_type: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+        comment="Content type (video, image, carousel_album, pin, post)",
+    )
+    caption: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True,
+        comment="Title or caption",
+    )
+    url: Mapped[Optional[str]] = mapped_column(
+        String(1000),
+        nullable=True,
+        comment="Permalink",
+    )
+    published_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="When the item was published",
+    )
+    last_collected_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="Timestamp of the latest stats snapshot",
+    )
+    views: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Latest View count",
+    )
+    likes: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Latest Like count",
+    )
+    comments: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Latest Comment count",
+    )
+    shares: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Latest Share/forward count",
+    )
+    saves: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Latest Save count",
+    )
+    impressions: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Latest Impressions",
+    )
+    reach: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Latest Unique reach",
+    )
+    engagement_rate: Mapped[Optional[float]] = mapped_column(
+        Float,
+        nullable=True,
+        comment="Latest Engagement rate percentage",
+    )
+    def __repr__(self) -> str:
+        return f"<ContentItem {self.platform}:{self.external_id}>"
@@ -0,0 +1,66 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+from src.models.base import Base, UUIDMixin
+class ContentItemStat(Base, UUIDMixin):
+    __tablename__ = "content_item_stats"
+    __table_args__ = (
+        UniqueConstraint("content_item_id", "collected_at", name="uq_content_item_stats_item_collected"),
+        Index("brin_content_item_stats_collected_at", "collected_at", postgresql_using="brin"),
+    )
+    content_item_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("content_items.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Reference to content item",
+    )
+    collected_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="Timestamp when the snapshot was collected",
+    )
+    views: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="View count",
+    )
+    likes: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Like count",
+    )
+    comments: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Comment count",
+    )
+    shares: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Share/forward count",
+    )
+    saves: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Save count",
+    )
+    impressions: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Impressions",
+    )
+    reach: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Unique reach",
+    )
+    engagement_rate: Mapped[Optional[float]] = mapped_column(
+        Float,
+        nullable=True,
+        comment="Engagement rate percentage",
+    )
+    def __repr__(self) -> str:
+        return f"<ContentItemStat {self.content_item_id} at {self.collected_at}>"
@@ -0,0 +1,25 @@
+from datetime import datetime
+from sqlalchemy import BigInteger, DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+from src.models.base import Base
+class DataVersion(Base):
+    __tablename__ = "data_versions"
+    scope: Mapped[str] = mapped_column(
+        String(100),
+        primary_key=True,
+        comment="Account UUID, or * for changes that touch every account",
+    )
+    version: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=1,
+        comment="Incremented whenever stored data in the scope is rewritten in place",
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+    def __repr__(self) -> str:
+        return f"<DataVersion {self.scope} {self.version}>"
@@ -0,0 +1,85 @@
+import hashlib
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+from sqlalchemy import DateTime, Integer, String, event, func, inspect
+from sqlalchemy.dialects.postgresql import JSONB, insert
+from sqlalchemy.orm import Mapped, mapped_column
+from src.config.settings import get_settings
+from src.models.base import Base
+from src.models.metric import Metric
+from src.models.promoted_field import PROMOTED_ROOT_KEYS
+settings = get_settings()
+BLOB_REF_KEY = "$blob"
+FULL_EXTRA_DATA_KEY = "full_extra_data"
+class ExtraDataBlob(Base):
+    __tablename__ = "extra_data_blobs"
+    hash: Mapped[str] = mapped_column(
+        String(64),
+        primary_key=True,
+        comment="SHA-256 of the canonical JSON encoding of value",
+    )
+    value: Mapped[Any] = mapped_column(
+        JSONB,
+        nullable=False,
+        comment="Shared extra_data sub-document",
+    )
+    size_bytes: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="Size of the canonical JSON encoding",
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    def __repr__(self) -> str:
+        return f"<ExtraDataBlob {self.hash[:12]} ({self.size_bytes} bytes)>"
+def canonical_json(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+def is_blob_ref(value: Any) -> bool:
+    return isinstance(value, dict) and len(value) == 1 and BLOB_REF_KEY in value
+def encode_extra_data(
+    extra_data: Optional[dict],
+    min_bytes: int,
+    keep_inline: frozenset = PROMOTED_ROOT_KEYS
+) -> Tuple[Optional[dict], Dict[str, dict]]:
+    if not extra_data:
+        return extra_data, {}
+    encoded = {}
+    blobs = {}
+    for key, value in extra_data.items():
+        if key in keep_inline or not isinstance(value, (dict, list)) or not value:
+            encoded[key] = value
+            continue
+        payload = canonical_json(value)
+        size = len(payload.encode("utf-8"))
+        if size < min_bytes:
+            encoded[key] = value
+            continue
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        blobs[digest] = {"hash": digest, "value": json.loads(payload), "size_bytes": size}
+        encoded[key] = {BLOB_REF_KEY: digest}
+    return encoded, blobs
+def decode_extra_data(extra_data: Optional[dict], blobs: Dict[str, Any]) -> Optional[dict]:
+    if not extra_data:
+        return extra_data
+    return {
+        key: blobs.get(value[BLOB_REF_KEY]) if is_blob_ref(value) else value
+        for key, value in extra_data.items()
+    }
+@event.listens_for(Metric, "before_insert")
+def offload_extra_data(mapper, connection, target: Metric) -> None:
+    if settings.metrics_extra_data_storage != "blobs":
+        return
+    encoded, blobs = encode_extra_data(target.extra_data, settings.metrics_blob_min_bytes)
+    if not blobs:
+        return
+    connection.execute(
+        insert(ExtraDataBlob)
+        .values(list(blobs.values()))
+        .on_conflict_do_nothing(index_elements=[ExtraDataBlob.hash])
+    )
+    inspect(target).info[FULL_EXTRA_DATA_KEY] = target.extra_data
+    target.extra_data = encoded
@@ -14,19 +14,16 @@ class InstagramStorySnapshot(Base, UUIDMixin, TimestampMixin):
         PGUUID(as_uuid=True),
         ForeignKey("accounts.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
         comment="Reference to Instagram account",
     )
     story_id: Mapped[str] = mapped_column(
         String(255),
         nullable=False,
-        index=True,
         comment="Instagram story media ID (from Graph API)",
     )
     collected_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        index=True,
         comment="Timestamp of this snapshot collection",
     )
     posted_at: Mapped[datetime] = mapped_column(
@@ -96,6 +93,13 @@ class InstagramStorySnapshot(Base, UUIDMixin, TimestampMixin):
     )
     __table_args__ = (
         Index("idx_story_snapshots_story_id_collected", "story_id", "collected_at"),
+        Index(
+            "idx_story_snapshots_account_story_collected",
+            "account_id",
+            "story_id",
+            "collected_at",
+        ),
+        Index("brin_story_snapshots_collected_at", "collected_at", postgresql_using="brin"),
         Index(
             "idx_story_snapshots_account_retention",
             "account_id",
@@ -1,11 +1,12 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID
-from sqlalchemy import DateTime, Float, ForeignKey, Integer
+from sqlalchemy import Computed, DateTime, Float, ForeignKey, Index, Integer, SmallInteger
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.models.base import Base, UUIDMixin
+from src.models.promoted_field import PROMOTED_FIELDS
 if TYPE_CHECKING:
     from src.models.account import Account
 class Metric(Base, UUIDMixin):
@@ -57,6 +58,11 @@ class Metric(Base, UUIDMixin):
         nullable=True,
         comment="Engagement rate percentage",
     )
+    formula_version: Mapped[Optional[int]] = mapped_column(
+        SmallInteger,
+        nullable=True,
+        comment="Version of the engagement formula behind engagement_rate (NULL if computed by a legacy parser)",
+    )
     extra_data: Mapped[Optional[dict]] = mapped_column(
         JSONB,
         nullable=True,
@@ -68,3 +74,12 @@ class Metric(Base, UUIDMixin):
     )
     def __repr__(self) -> str:
         return f"<Metric {self.account_id} at {self.collected_at}>"
+for promoted in PROMOTED_FIELDS:
+    setattr(Metric, promoted.column_name, mapped_column(
+        promoted.type,
+        Computed(promoted.expression, persisted=True),
+        nullable=True,
+        comment=promoted.comment,
+    ))
+    column = getattr(Metric, promoted.column_name)
+    Index(promoted.index_name, column, Metric.collected_at, postgresql_where=column.isnot(None))
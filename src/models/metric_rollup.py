@@ -0,0 +1,173 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+from sqlalchemy import BigInteger, DateTime, Float, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+from src.models.base import Base
+ROLLUP_FIELDS = ("followers", "posts_count", "total_views", "total_likes", "engagement_rate")
+class MetricRollupMixin:
+    account_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("accounts.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="Reference to account",
+    )
+    bucket_start: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        primary_key=True,
+        comment="Start of the aggregation bucket (UTC)",
+    )
+    samples: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Number of snapshots aggregated into the bucket",
+    )
+    last_collected_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="Timestamp of the latest snapshot in the bucket",
+    )
+    followers_last: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Last followers/subscribers in bucket",
+    )
+    followers_min: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Minimum followers/subscribers in bucket",
+    )
+    followers_max: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Maximum followers/subscribers in bucket",
+    )
+    followers_sum: Mapped[Optional[int]] = mapped_column(
+        BigInteger,
+        nullable=True,
+        comment="Sum of followers/subscribers samples",
+    )
+    followers_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Number of non-null followers/subscribers samples",
+    )
+    posts_count_last: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Last posts/videos count in bucket",
+    )
+    posts_count_min: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Minimum posts/videos count in bucket",
+    )
+    posts_count_max: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Maximum posts/videos count in bucket",
+    )
+    posts_count_sum: Mapped[Optional[int]] = mapped_column(
+        BigInteger,
+        nullable=True,
+        comment="Sum of posts/videos count samples",
+    )
+    posts_count_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Number of non-null posts/videos count samples",
+    )
+    total_views_last: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Last total views in bucket",
+    )
+    total_views_min: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Minimum total views in bucket",
+    )
+    total_views_max: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Maximum total views in bucket",
+    )
+    total_views_sum: Mapped[Optional[int]] = mapped_column(
+        BigInteger,
+        nullable=True,
+        comment="Sum of total views samples",
+    )
+    total_views_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Number of non-null total views samples",
+    )
+    total_likes_last: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Last total likes in bucket",
+    )
+    total_likes_min: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Minimum total likes in bucket",
+    )
+    total_likes_max: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Maximum total likes in bucket",
+    )
+    total_likes_sum: Mapped[Optional[int]] = mapped_column(
+        BigInteger,
+        nullable=True,
+        comment="Sum of total likes samples",
+    )
+    total_likes_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Number of non-null total likes samples",
+    )
+    engagement_rate_last: Mapped[Optional[float]] = mapped_column(
+        Float,
+        nullable=True,
+        comment="Last engagement rate in bucket",
+    )
+    engagement_rate_min: Mapped[Optional[float]] = mapped_column(
+        Float,
+        nullable=True,
+        comment="Minimum engagement rate in bucket",
+    )
+    engagement_rate_max: Mapped[Optional[float]] = mapped_column(
+        Float,
+        nullable=True,
+        comment="Maximum engagement rate in bucket",
+    )
+    engagement_rate_sum: Mapped[Optional[float]] = mapped_column(
+        Float,
+        nullable=True,
+        comment="Sum of engagement rate samples",
+    )
+    engagement_rate_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Number of non-null engagement rate samples",
+    )
+class MetricRollupHour(MetricRollupMixin, Base):
+    __tablename__ = "metrics_rollup_hour"
+    def __repr__(self) -> str:
+        return f"<MetricRollupHour {self.account_id} at {self.bucket_start}>"
+class MetricRollupDay(MetricRollupMixin, Base):
+    __tablename__ = "metrics_rollup_day"
+    def __repr__(self) -> str:
+        return f"<MetricRollupDay {self.account_id} at {self.bucket_start}>"
+class MetricRollupWeek(MetricRollupMixin, Base):
+    __tablename__ = "metrics_rollup_week"
+    def __repr__(self) -> str:
+        return f"<MetricRollupWeek {self.account_id} at {self.bucket_start}>"
@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+from typing import Tuple
+from sqlalchemy import BigInteger, Float
+from sqlalchemy.types import TypeEngine
+SQL_TYPES = {
+    "double precision": Float,
+    "bigint": BigInteger,
+}
+@dataclass(frozen=True)
+class PromotedField:
+    platform: str
+    name: str
+    path: Tuple[str, ...]
+    sql_type: str = "double precision"
+    @property
+    def column_name(self) -> str:
+        return f"{self.platform}_{self.name}"
+    @property
+    def index_name(self) -> str:
+        return f"ix_metrics_{self.column_name}"
+    @property
+    def json_path(self) -> str:
+        return "{" + ",".join(self.path) + "}"
+    @property
+    def expression(self) -> str:
+        cast = "numeric::bigint" if self.sql_type == "bigint" else self.sql_type
+        return (
+            f"CASE WHEN jsonb_typeof(extra_data #> '{self.json_path}') = 'number' "
+            f"THEN (extra_data #>> '{self.json_path}')::{cast} END"
+        )
+    @property
+    def type(self) -> TypeEngine:
+        return SQL_TYPES[self.sql_type]()
+    @property
+    def comment(self) -> str:
+        return f"{self.platform} extra_data.{'.'.join(self.path)} (generated)"
+PROMOTED_FIELDS: Tuple[PromotedField, ...] = (
+    PromotedField("telegram", "err_views", ("err_views",)),
+    PromotedField("telegram", "avg_views", ("avg_views",)),
+    PromotedField("tiktok", "avg_engagement_rate", ("avg_engagement_rate",)),
+    PromotedField("pinterest", "impressions_30d", ("impressions_30d",), "bigint"),
+    PromotedField("pinterest", "saves_30d", ("saves_30d",), "bigint"),
+    PromotedField("youtube", "avg_views_30d", ("metrics_30d", "avg_views_per_video")),
+    PromotedField("youtube", "avg_likes_30d", ("metrics_30d", "avg_likes_per_video")),
+    PromotedField("youtube", "engagement_rate_30d", ("metrics_30d", "engagement_rate")),
+)
+PROMOTED_ROOT_KEYS = frozenset(field.path[0] for field in PROMOTED_FIELDS)
+def add_promoted_field(op, field: PromotedField) -> None:
+    op.execute(
+        f"ALTER TABLE metrics ADD COLUMN IF NOT EXISTS {field.column_name} {field.sql_type} "
+        f"GENERATED ALWAYS AS ({field.expression}) STORED"
+    )
+    op.execute(f"COMMENT ON COLUMN metrics.{field.column_name} IS '{field.comment}'")
+    op.execute(
+        f"CREATE INDEX IF NOT EXISTS {field.index_name} ON metrics ({field.column_name}, collected_at) "
+        f"WHERE {field.column_name} IS NOT NULL"
+    )
+def drop_promoted_field(op, field: PromotedField) -> None:
+    op.execute(f"DROP INDEX IF EXISTS {field.index_name}")
+    op.execute(f"ALTER TABLE metrics DROP COLUMN IF EXISTS {field.column_name}")
@@ -0,0 +1,70 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, LargeBinary, String, UniqueConstraint, func
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+from src.models.base import Base, UUIDMixin
+class RawPayload(Base, UUIDMixin):
+    __tablename__ = "raw_payloads"
+    __table_args__ = (
+        UniqueConstraint("metric_id", "kind", name="uq_raw_payloads_metric_kind"),
+        Index("ix_raw_payloads_account_collected", "account_id", "collected_at"),
+        Index("brin_raw_payloads_collected_at", "collected_at", postgresql_using="brin"),
+    )
+    account_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("accounts.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Reference to account",
+    )
+    log_id: Mapped[Optional[UUID]] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("collection_logs.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+        comment="Collection run that fetched the payload",
+    )
+    metric_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        nullable=False,
+        comment="Metrics snapshot extracted from the payload",
+    )
+    collected_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="Timestamp of the metrics snapshot",
+    )
+    kind: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+        comment="Parser-defined payload kind, e.g. channel_html",
+    )
+    content_type: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+        comment="MIME type of the uncompressed payload",
+    )
+    sha256: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        index=True,
+        comment="SHA-256 of the uncompressed payload",
+    )
+    size_bytes: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="Uncompressed payload size",
+    )
+    payload: Mapped[bytes] = mapped_column(
+        LargeBinary,
+        nullable=False,
+        comment="zlib-compressed payload",
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    def __repr__(self) -> str:
+        return f"<RawPayload {self.kind} for {self.account_id} at {self.collected_at}>"
@@ -0,0 +1,63 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+from sqlalchemy import DateTime, Integer, String, Text
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+from src.models.base import Base, TimestampMixin, UUIDMixin
+class RecomputeJob(Base, UUIDMixin, TimestampMixin):
+    __tablename__ = "recompute_jobs"
+    platform: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+        index=True,
+        comment="Platform whose metrics are recomputed",
+    )
+    formula_version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="Target engagement formula version",
+    )
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        comment="Status: pending, running, completed, failed",
+    )
+    since: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Only recompute snapshots collected from this time",
+    )
+    cursor_collected_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="collected_at of the last snapshot written (resume point)",
+    )
+    cursor_metric_id: Mapped[Optional[UUID]] = mapped_column(
+        PGUUID(as_uuid=True),
+        nullable=True,
+        comment="ID of the last snapshot written (resume point)",
+    )
+    rows_processed: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        nullable=False,
+        comment="Snapshots recomputed so far",
+    )
+    started_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Time the job last started or resumed",
+    )
+    finished_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Completion time",
+    )
+    error_message: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True,
+        comment="Error details if the job failed",
+    )
+    def __repr__(self) -> str:
+        return f"<RecomputeJob {self.platform} v{self.formula_version} {self.status}>"
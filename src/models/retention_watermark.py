@@ -0,0 +1,24 @@
+from datetime import datetime
+from sqlalchemy import DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+from src.models.base import Base
+class RetentionWatermark(Base):
+    __tablename__ = "retention_watermarks"
+    key: Mapped[str] = mapped_column(
+        String(100),
+        primary_key=True,
+        comment="Retention step key (step:platform)",
+    )
+    processed_until: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="Data before this timestamp has been processed by the step",
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+    def __repr__(self) -> str:
+        return f"<RetentionWatermark {self.key} {self.processed_until}>"
@@ -35,6 +35,15 @@ class MetricResponse(MetricBase):
     account_id: UUID
     collected_at: datetime
     model_config = ConfigDict(from_attributes=True)
+class ProfileAttributeResponse(BaseModel):
+    field: str
+    refresh_group: str
+    value: Optional[Any] = None
+    refreshed_at: datetime
+    model_config = ConfigDict(from_attributes=True)
+class AccountProfileResponse(BaseModel):
+    account_id: UUID = Field(..., description="Account UUID")
+    attributes: List[ProfileAttributeResponse] = Field(..., description="Cached slow-changing profile fields")
 class CollectionLogResponse(BaseModel):
     id: UUID
     started_at: datetime
@@ -42,6 +51,8 @@ class CollectionLogResponse(BaseModel):
     status: str
     accounts_processed: int
     accounts_failed: int
+    accounts_skipped: int = 0
+    accounts_timed_out: int = 0
     error_message: Optional[str] = None
     model_config = ConfigDict(from_attributes=True)
 class HealthResponse(BaseModel):
@@ -62,8 +73,66 @@ class CollectionTriggerResponse(BaseModel):
     finished_at: Optional[datetime] = Field(None, description="When collection finished")
     accounts_processed: int = Field(..., description="Number of successfully processed accounts")
     accounts_failed: int = Field(..., description="Number of failed accounts")
+    accounts_skipped: int = Field(default=0, description="Number of accounts skipped by an open circuit")
+    accounts_timed_out: int = Field(default=0, description="Number of accounts that exceeded their time budget")
     success_details: list = Field(default=[], description="Details of successful collections")
     error_details: list = Field(default=[], description="Details of failed collections")
+    skipped_details: list = Field(default=[], description="Details of skipped accounts")
+class PlatformHealthResponse(BaseModel):
+    platform: str = Field(..., description="Platform name")
+    available: bool = Field(..., description="Whether collection is currently attempted")
+    checked_at: datetime = Field(..., description="When availability was last established")
+    consecutive_failures: int = Field(..., description="Consecutive failed account collections")
+    last_error: Optional[str] = Field(None, description="Last recorded error")
+    model_config = ConfigDict(from_attributes=True)
+class CollectionAccountResultResponse(BaseModel):
+    account_id: UUID = Field(..., description="Account ID")
+    status: str = Field(..., description="Outcome: success, failed, timed_out, skipped")
+    error: Optional[str] = Field(None, description="Error or skip reason")
+    attempts: int = Field(..., description="Number of attempts within the run")
+    started_at: datetime = Field(..., description="Start of the latest attempt")
+    finished_at: datetime = Field(..., description="End of the latest attempt")
+    model_config = ConfigDict(from_attributes=True)
+class CircuitBreakerResponse(BaseModel):
+    key: str = Field(..., description="Breaker key (platform:credential)")
+    platform: str = Field(..., description="Platform name")
+    credential: str = Field(..., description="Credential scope")
+    state: str = Field(..., description="closed, open or half_open")
+    failure_count: int = Field(..., description="Consecutive failures")
+    opened_at: Optional[datetime] = Field(None, description="When the circuit opened")
+    last_failure_at: Optional[datetime] = Field(None, description="Last failure timestamp")
+    last_error: Optional[str] = Field(None, description="Last failure message")
+    model_config = ConfigDict(from_attributes=True)
+class ContentItemResponse(BaseModel):
+    id: UUID = Field(..., description="Content item ID")
+    account_id: UUID = Field(..., description="Account ID")
+    platform: str = Field(..., description="Platform name")
+    external_id: str = Field(..., description="Platform-specific post/video ID")
+    content_type: str = Field(..., description="Content type")
+    caption: Optional[str] = Field(None, description="Title or caption")
+    url: Optional[str] = Field(None, description="Permalink")
+    published_at: Optional[datetime] = Field(None, description="Publication time")
+    last_collected_at: datetime = Field(..., description="Latest snapshot time")
+    views: Optional[int] = None
+    likes: Optional[int] = None
+    comments: Optional[int] = None
+    shares: Optional[int] = None
+    saves: Optional[int] = None
+    impressions: Optional[int] = None
+    reach: Optional[int] = None
+    engagement_rate: Optional[float] = None
+    model_config = ConfigDict(from_attributes=True)
+class ContentItemStatResponse(BaseModel):
+    collected_at: datetime = Field(..., description="Snapshot time")
+    views: Optional[int] = None
+    likes: Optional[int] = None
+    comments: Optional[int] = None
+    shares: Optional[int] = None
+    saves: Optional[int] = None
+    impressions: Optional[int] = None
+    reach: Optional[int] = None
+    engagement_rate: Optional[float] = None
+    model_config = ConfigDict(from_attributes=True)
 class YouTubeVideoResponse(BaseModel):
     video_id: str = Field(..., description="YouTube video ID")
     title: str = Field(..., description="Video title")
@@ -510,3 +579,61 @@ class PinterestTopPinsResponse(BaseModel):
     sort_by: str = Field(..., description="Field used for sorting")
     limit: int = Field(..., description="Number of pins returned")
     pins: List[PinterestPinInfo] = Field(..., description="List of top pins")
+class TimeseriesPoint(BaseModel):
+    bucket_start: datetime = Field(..., description="Start of the bucket (UTC)")
+    samples: int = Field(..., description="Number of snapshots aggregated into the bucket")
+    values: Dict[str, Optional[float]] = Field(..., description="Aggregated value per requested metric")
+class TimeseriesSeries(BaseModel):
+    account_id: UUID = Field(..., description="Account UUID")
+    points: List[TimeseriesPoint] = Field(..., description="Buckets in chronological order")
+class TimeseriesResponse(BaseModel):
+    bucket: str = Field(..., description="Bucket size (hour/day/week/month)")
+    agg: str = Field(..., description="Aggregate applied within each bucket (last/avg/max)")
+    metrics: List[str] = Field(..., description="Requested metrics")
+    series: List[TimeseriesSeries] = Field(..., description="One series per requested account")
+class OverviewPlatform(BaseModel):
+    platform: str = Field(..., description="Platform name")
+    accounts: int = Field(..., description="Registered accounts")
+    active_accounts: int = Field(..., description="Accounts with collection enabled")
+    accounts_with_data: int = Field(..., description="Accounts with a snapshot in the period")
+    followers: int = Field(..., description="Sum of the latest follower counts")
+    posts: int = Field(..., description="Sum of the latest post counts")
+    avg_engagement_rate: Optional[float] = Field(None, description="Mean of the latest engagement rates %")
+    last_collected_at: Optional[datetime] = Field(None, description="Most recent snapshot in the period")
+class OverviewEngagementPoint(BaseModel):
+    bucket_start: datetime = Field(..., description="Day (UTC)")
+    engagement_rate: float = Field(..., description="Average engagement rate % across the platform's snapshots")
+class OverviewResponse(BaseModel):
+    start: datetime = Field(..., description="Start of the period")
+    end: datetime = Field(..., description="End of the period")
+    total_accounts: int = Field(..., description="Registered accounts across platforms")
+    active_accounts: int = Field(..., description="Active accounts across platforms")
+    total_followers: int = Field(..., description="Sum of the latest follower counts")
+    total_posts: int = Field(..., description="Sum of the latest post counts")
+    avg_engagement_rate: float = Field(..., description="Mean of the per-platform average engagement rates %")
+    platforms: List[OverviewPlatform] = Field(..., description="Totals per platform")
+    engagement: Dict[str, List[OverviewEngagementPoint]] = Field(..., description="Daily engagement rate series per platform")
+class GrowthCounter(BaseModel):
+    current: Optional[float] = Field(None, description="Latest value in the period")
+    baseline: Optional[float] = Field(None, description="Value compared against")
+    change: Optional[float] = Field(None, description="Absolute change")
+    change_pct: Optional[float] = Field(None, description="Change in % of the baseline")
+class GrowthAccount(BaseModel):
+    account_id: UUID = Field(..., description="Account UUID")
+    platform: str = Field(..., description="Platform name")
+    display_name: str = Field(..., description="Account display name")
+    rank: int = Field(..., description="Rank by percentage change of the ranking counter")
+    counters: Dict[str, GrowthCounter] = Field(..., description="Change per counter")
+class GrowthPlatform(BaseModel):
+    platform: str = Field(..., description="Platform name")
+    accounts: int = Field(..., description="Accounts with data in the period")
+    counters: Dict[str, GrowthCounter] = Field(..., description="Change per counter across comparable accounts")
+class GrowthResponse(BaseModel):
+    period: str = Field(..., description="Period length (7d/30d/90d)")
+    compare: str = Field(..., description="Baseline: previous period or start of the period")
+    rank_by: str = Field(..., description="Counter used for the leaderboard")
+    start: datetime = Field(..., description="Start of the period")
+    end: datetime = Field(..., description="End of the period")
+    platforms: List[GrowthPlatform] = Field(..., description="Change per platform")
+    accounts: List[GrowthAccount] = Field(..., description="Change per account, ranked")
+    leaderboard: List[GrowthAccount] = Field(..., description="Top accounts by percentage change")
@@ -1,7 +1,8 @@
+import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 @dataclass
 class PlatformMetrics:
     platform: str
@@ -16,9 +17,32 @@ class PlatformMetrics:
     engagement_rate: Optional[float] = None
     extra_data: Optional[dict] = None
 class BaseParser(ABC):
+    SLOW_FIELDS: dict[str, str] = {}
+    ARCHIVE_KINDS: tuple[str, ...] = ()
     def __init__(self, account_id: str, account_url: str):
         self.account_id = account_id
         self.account_url = account_url
+        self._fresh_profile_groups: set[str] = set()
+        self.archive_enabled = False
+        self.archived_payloads: dict[str, tuple[str, bytes]] = {}
+    def set_profile_context(self, fresh_groups: set[str]) -> None:
+        self._fresh_profile_groups = set(fresh_groups)
+    def is_profile_fresh(self, group: str) -> bool:
+        return group in self._fresh_profile_groups
+    def enable_archive(self) -> None:
+        self.archive_enabled = True
+        self.archived_payloads = {}
+    def archive_payload(self, kind: str, content: Any, content_type: str = "text/html") -> None:
+        if not self.archive_enabled:
+            return
+        if isinstance(content, (dict, list)):
+            content = json.dumps(content, ensure_ascii=False, default=str)
+            content_type = "application/json"
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        self.archived_payloads[kind] = (content_type, content)
+    async def parse_archived(self, payloads: dict[str, bytes], collected_at: datetime) -> PlatformMetrics:
+        raise NotImplementedError(f"{self.__class__.__name__} cannot re-parse archived payloads")
     @abstractmethod
     async def fetch_metrics(self) -> PlatformMetrics:
         pass
@@ -19,6 +19,7 @@ USER_AGENTS = [
 ]
 class DzenParser(BaseParser):
     PLATFORM_NAME = "dzen"
+    ARCHIVE_KINDS = ("channel_html",)
     BASE_URL = "https://dzen.ru"
     FOLLOWER_SELECTORS = [
         '[data-testid="subscriber-count"]',
@@ -70,41 +71,9 @@ class DzenParser(BaseParser):
                 )
                 await self._human_delay(2.0, 4.0)
                 await self._scroll_page(page)
-                channel_name = await self._extract_channel_name(page)
-                followers = await self._extract_followers(page)
-                posts = await self._extract_posts(page)
-                posts_count = len(posts)
-                total_views = sum(p.get("views", 0) for p in posts)
-                total_likes = sum(p.get("likes", 0) for p in posts)
-                engagement_rate = 0.0
-                if followers and followers > 0 and posts_count > 0:
-                    avg_engagement = (total_views + total_likes) / posts_count
-                    engagement_rate = round((avg_engagement / followers) * 100, 2)
-                extra_data = {
-                    "channel_name": channel_name,
-                    "channel_id": self.account_id,
-                    "posts_analyzed": posts_count,
-                    "avg_views_per_post": round(total_views / posts_count, 2) if posts_count > 0 else 0,
-                    "avg_likes_per_post": round(total_likes / posts_count, 2) if posts_count > 0 else 0,
-                    "recent_posts": posts[:10],
-                }
-                logger.info(
-                    f"Dzen metrics collected: followers={followers}, "
-                    f"posts={posts_count}, views={total_views}, likes={total_likes}"
-                )
-                return PlatformMetrics(
-                    platform=self.PLATFORM_NAME,
-                    account_id=self.account_id,
-                    collected_at=datetime.utcnow(),
-                    followers=followers,
-                    posts_count=posts_count,
-                    total_views=total_views,
-                    total_likes=total_likes,
-                    total_comments=0,
-                    total_shares=0,
-                    engagement_rate=engagement_rate,
-                    extra_data=extra_data
-                )
+                if self.archive_enabled:
+                    self.archive_payload("channel_html", await page.content())
+                return await self._parse_page(page, datetime.utcnow())
             finally:
                 await page.close()
         return await retry_async(
@@ -113,6 +82,50 @@ class DzenParser(BaseParser):
             initial_delay=settings.parser_retry_delay,
             exceptions=(PlaywrightTimeout, ConnectionError, TimeoutError, Exception)
         )
+    async def parse_archived(self, payloads: dict[str, bytes], collected_at: datetime) -> PlatformMetrics:
+        await self._init_browser()
+        page = await self._context.new_page()
+        try:
+            await page.set_content(payloads["channel_html"].decode("utf-8"), wait_until="domcontentloaded")
+            return await self._parse_page(page, collected_at)
+        finally:
+            await page.close()
+    async def _parse_page(self, page: Page, collected_at: datetime) -> PlatformMetrics:
+        channel_name = await self._extract_channel_name(page)
+        followers = await self._extract_followers(page)
+        posts = await self._extract_posts(page)
+        posts_count = len(posts)
+        total_views = sum(p.get("views", 0) for p in posts)
+        total_likes = sum(p.get("likes", 0) for p in posts)
+        engagement_rate = 0.0
+        if followers and followers > 0 and posts_count > 0:
+            avg_engagement = (total_views + total_likes) / posts_count
+            engagement_rate = round((avg_engagement / followers) * 100, 2)
+        extra_data = {
+            "channel_name": channel_name,
+            "channel_id": self.account_id,
+            "posts_analyzed": posts_count,
+            "avg_views_per_post": round(total_views / posts_count, 2) if posts_count > 0 else 0,
+            "avg_likes_per_post": round(total_likes / posts_count, 2) if posts_count > 0 else 0,
+            "recent_posts": posts[:10],
+        }
+        logger.info(
+            f"Dzen metrics collected: followers={followers}, "
+            f"posts={posts_count}, views={total_views}, likes={total_likes}"
+        )
+        return PlatformMetrics(
+            platform=self.PLATFORM_NAME,
+            account_id=self.account_id,
+            collected_at=collected_at,
+            followers=followers,
+            posts_count=posts_count,
+            total_views=total_views,
+            total_likes=total_likes,
+            total_comments=0,
+            total_shares=0,
+            engagement_rate=engagement_rate,
+            extra_data=extra_data
+        )
     async def close(self) -> None:
         if self._context:
             await self._context.close()
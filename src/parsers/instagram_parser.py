@@ -15,6 +15,8 @@ settings = get_settings()
 class InstagramParser(BaseParser):
     PLATFORM_NAME = "instagram"
     MEDIA_SAMPLE_SIZE = 25
+    PROFILE_FIELDS = ["name", "profile_picture_url", "biography", "website"]
+    SLOW_FIELDS = {field: "profile" for field in PROFILE_FIELDS}
     requires_oauth = True
     def __init__(self, account_id: str, account_url: str):
         super().__init__(account_id, account_url)
@@ -65,10 +67,6 @@ class InstagramParser(BaseParser):
             aggregated = self._calculate_aggregated_metrics(media_insights)
             extra_data = {
                 "username": user_info.get("username"),
-                "name": user_info.get("name"),
-                "profile_picture_url": user_info.get("profile_picture_url"),
-                "biography": user_info.get("biography", "")[:300],
-                "website": user_info.get("website"),
                 "follows_count": user_info.get("follows_count", 0),
                 "sample_media": len(media_insights),
                 "avg_likes_per_post": round(aggregated["avg_likes"], 2),
@@ -79,6 +77,11 @@ class InstagramParser(BaseParser):
                 "avg_saved": round(aggregated["avg_saved"], 2),
                 "recent_media": media_insights
             }
+            if not self.is_profile_fresh("profile"):
+                extra_data["name"] = user_info.get("name")
+                extra_data["profile_picture_url"] = user_info.get("profile_picture_url")
+                extra_data["biography"] = (user_info.get("biography") or "")[:300]
+                extra_data["website"] = user_info.get("website")
             return PlatformMetrics(
                 platform=self.PLATFORM_NAME,
                 account_id=self.account_id,
@@ -143,11 +146,9 @@ class InstagramParser(BaseParser):
             fields = ["id", "username", "account_type", "media_count", "followers_count"]
             endpoint = "/me"
         else:
-            fields = [
-                "id", "username", "name", "profile_picture_url",
-                "biography", "website", "followers_count",
-                "follows_count", "media_count"
-            ]
+            fields = ["id", "username", "followers_count", "follows_count", "media_count"]
+            if not self.is_profile_fresh("profile"):
+                fields.extend(self.PROFILE_FIELDS)
             endpoint = f"/{self.account_id}"
         response = await self._client.get(
             endpoint,
@@ -15,6 +15,11 @@ settings = get_settings()
 class PinterestParser(BaseParser):
     PLATFORM_NAME = "pinterest"
     BASE_URL = "https://api.pinterest.com/v5"
+    SLOW_FIELDS = {
+        "about": "profile",
+        "profile_image": "profile",
+        "website_url": "profile",
+    }
     requires_oauth = True
     def __init__(self, account_id: str, account_url: str):
         super().__init__(account_id, account_url)
@@ -52,9 +57,6 @@ class PinterestParser(BaseParser):
             extra_data = {
                 "username": user_info.get("username"),
                 "business_name": user_info.get("business_name"),
-                "about": user_info.get("about", "")[:200],
-                "profile_image": user_info.get("profile_image"),
-                "website_url": user_info.get("website_url"),
                 "account_type": user_info.get("account_type"),
                 "board_count": user_info.get("board_count", 0),
                 "following_count": user_info.get("following_count", 0),
@@ -75,6 +77,10 @@ class PinterestParser(BaseParser):
                 "avg_saves_per_pin": aggregated.get("avg_saves", 0),
                 "avg_clicks_per_pin": aggregated.get("avg_clicks", 0),
             }
+            if not self.is_profile_fresh("profile"):
+                extra_data["about"] = (user_info.get("about") or "")[:200]
+                extra_data["profile_image"] = user_info.get("profile_image")
+                extra_data["website_url"] = user_info.get("website_url")
             impressions = analytics.get("IMPRESSION", 0)
             engagement = analytics.get("ENGAGEMENT", 0)
             engagement_rate = (engagement / impressions * 100) if impressions > 0 else 0.0
@@ -26,6 +26,7 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 class TelegramParser(BaseParser):
     POSTS_LIMIT = 100
+    SLOW_FIELDS = {"about": "profile"}
     def __init__(self, account_id: str, account_url: str):
         super().__init__(account_id, account_url)
         self.client: Optional[TelegramClient] = None
@@ -270,11 +271,12 @@ class TelegramParser(BaseParser):
                 full_chat = full_channel.full_chat
                 subscribers = full_chat.participants_count or 0
                 channel_info = {
-                    "about": full_chat.about or "",
                     "admins_count": getattr(full_chat, 'admins_count', None),
                     "can_view_stats": getattr(full_chat, 'can_view_stats', False),
                     "linked_chat_id": getattr(full_chat, 'linked_chat_id', None),
                 }
+                if not self.is_profile_fresh("profile"):
+                    channel_info["about"] = full_chat.about or ""
             except Exception as e:
                 logger.warning(f"Could not get full channel info: {e}, using basic info")
                 subscribers = entity.participants_count or 0
@@ -17,6 +17,13 @@ class TikTokParser(BaseParser):
     PLATFORM_NAME = "tiktok"
     BASE_URL = "https://open.tiktokapis.com/v2"
     VIDEO_SAMPLE_SIZE = 30
+    PROFILE_FIELDS = ["avatar_url", "bio_description", "profile_deep_link"]
+    SLOW_FIELDS = {
+        "bio_description": "profile",
+        "avatar_url": "profile",
+        "profile_deep_link": "profile",
+        "audience_insights": "audience",
+    }
     requires_oauth = True
     def __init__(self, account_id: str, account_url: str):
         super().__init__(account_id, account_url)
@@ -57,10 +64,7 @@ class TikTokParser(BaseParser):
             ads_data = await self.fetch_ads_metrics()
             extra_data = {
                 "display_name": user_info.get("display_name"),
-                "bio_description": user_info.get("bio_description", "")[:200],
-                "avatar_url": user_info.get("avatar_url"),
                 "is_verified": user_info.get("is_verified", False),
-                "profile_deep_link": user_info.get("profile_deep_link"),
                 "sample_videos": len(videos),
                 "avg_views_per_video": round(aggregated["avg_views"], 2),
                 "avg_likes_per_video": round(aggregated["avg_likes"], 2),
@@ -69,6 +73,10 @@ class TikTokParser(BaseParser):
                 "avg_engagement_rate": round(aggregated["avg_engagement"], 2),
                 "recent_videos": videos
             }
+            if not self.is_profile_fresh("profile"):
+                extra_data["bio_description"] = (user_info.get("bio_description") or "")[:200]
+                extra_data["avatar_url"] = user_info.get("avatar_url")
+                extra_data["profile_deep_link"] = user_info.get("profile_deep_link")
             if ads_data:
                 extra_data.update(ads_data)
             return PlatformMetrics(
@@ -142,16 +150,16 @@ class TikTokParser(BaseParser):
                         for c in sorted(campaigns, key=lambda x: x.budget or 0, reverse=True)[:5]
                     ]
                 }
-            audience = await marketing_client.get_audience_report(advertiser_id)
-            return {
-                "ads_metrics": ads_metrics,
-                "audience_insights": {
+            result = {"ads_metrics": ads_metrics}
+            if not self.is_profile_fresh("audience"):
+                audience = await marketing_client.get_audience_report(advertiser_id)
+                result["audience_insights"] = {
                     "age_distribution": audience.age_distribution,
                     "gender_distribution": audience.gender_distribution,
                     "top_countries": audience.top_countries[:10],
                     "top_interests": audience.top_interests[:20]
                 }
-            }
+            return result
         except Exception as e:
             logger.warning(f"Failed to fetch ads metrics: {e}")
             return None
@@ -199,16 +207,15 @@ class TikTokParser(BaseParser):
         fields = [
             "open_id",
             "union_id",
-            "avatar_url",
             "display_name",
-            "bio_description",
-            "profile_deep_link",
             "is_verified",
             "follower_count",
             "following_count",
             "likes_count",
             "video_count"
         ]
+        if not self.is_profile_fresh("profile"):
+            fields.extend(self.PROFILE_FIELDS)
         response = await client.get(
             "/user/info/",
             params={"fields": ",".join(fields)}
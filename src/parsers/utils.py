@@ -1,6 +1,7 @@
 import asyncio
 import logging
-from typing import Callable, TypeVar
+from typing import Any, Callable, TypeVar
+import requests
 T = TypeVar('T')
 logger = logging.getLogger(__name__)
 async def retry_async(
@@ -30,3 +31,10 @@ async def retry_async(
             await asyncio.sleep(delay)
             delay *= backoff_factor
     raise last_exception
+class TimeoutSession(requests.Session):
+    def __init__(self, timeout: float):
+        super().__init__()
+        self.timeout = timeout
+    def request(self, *args: Any, **kwargs: Any) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(*args, **kwargs)
@@ -1,10 +1,12 @@
 from datetime import datetime
 from typing import Optional
+import asyncio
 import logging
+import requests
 import vk_api
 from vk_api.exceptions import VkApiError
 from src.parsers.base import BaseParser, PlatformMetrics
-from src.parsers.utils import retry_async
+from src.parsers.utils import TimeoutSession, retry_async
 from src.config.settings import get_settings
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -16,20 +18,20 @@ class VKParser(BaseParser):
         return "vk"
     def _init_client(self) -> None:
         if self.vk is None:
-            self.vk = vk_api.VkApi(token=settings.vk_access_token)
+            self.vk = vk_api.VkApi(token=settings.vk_access_token, session=TimeoutSession(settings.api_timeout_seconds))
             logger.debug("VK API client initialized")
     async def is_available(self) -> bool:
         try:
             self._init_client()
             api = self.vk.get_api()
-            api.groups.getById(group_id=self.account_id)
+            await asyncio.to_thread(api.groups.getById, group_id=self.account_id)
             return True
         except Exception as e:
             logger.error(f"VK availability check failed: {e}")
             return False
     async def fetch_metrics(self) -> PlatformMetrics:
         self._init_client()
-        async def _fetch() -> PlatformMetrics:
+        def _fetch_blocking() -> PlatformMetrics:
             api = self.vk.get_api()
             group_info = api.groups.getById(
                 group_id=self.account_id,
@@ -79,9 +81,11 @@ class VKParser(BaseParser):
                     "avg_shares_per_post": round(total_shares / sample_posts, 2) if sample_posts > 0 else 0
                 }
             )
+        async def _fetch() -> PlatformMetrics:
+            return await asyncio.to_thread(_fetch_blocking)
         return await retry_async(
             _fetch,
             max_attempts=settings.parser_retry_attempts,
             initial_delay=settings.parser_retry_delay,
-            exceptions=(VkApiError, ConnectionError, TimeoutError)
+            exceptions=(VkApiError, ConnectionError, TimeoutError, requests.ConnectionError, requests.Timeout)
         )
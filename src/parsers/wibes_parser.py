@@ -19,6 +19,7 @@ USER_AGENTS = [
 ]
 class WibesParser(BaseParser):
     PLATFORM_NAME = "wibes"
+    ARCHIVE_KINDS = ("author_html",)
     BASE_URL = "https://wibes.ru"
     FOLLOWER_SELECTORS = [
         '.author-subscribers',
@@ -90,43 +91,9 @@ class WibesParser(BaseParser):
                     raise RuntimeError("Wibes returned bot block page (498)")
                 await self._human_delay(3.0, 5.0)
                 await self._simulate_human_behavior(page)
-                author_name = await self._extract_author_name(page)
-                followers = await self._extract_followers(page)
-                posts_count = await self._extract_posts_count(page)
-                reactions = await self._extract_reactions(page)
-                posts = await self._extract_posts(page)
-                engagement_rate = 0.0
-                if followers and followers > 0 and reactions:
-                    engagement_rate = round((reactions / followers) * 100, 2)
-                extra_data = {
-                    "author_name": author_name,
-                    "author_id": self.account_id,
-                    "total_reactions": reactions,
-                    "posts_analyzed": len(posts),
-                    "recent_posts": posts[:10],
-                }
-                if posts:
-                    total_post_reactions = sum(p.get("reactions", 0) for p in posts)
-                    extra_data["avg_reactions_per_post"] = round(
-                        total_post_reactions / len(posts), 2
-                    ) if len(posts) > 0 else 0
-                logger.info(
-                    f"Wibes metrics collected: followers={followers}, "
-                    f"posts={posts_count}, reactions={reactions}"
-                )
-                return PlatformMetrics(
-                    platform=self.PLATFORM_NAME,
-                    account_id=self.account_id,
-                    collected_at=datetime.utcnow(),
-                    followers=followers,
-                    posts_count=posts_count,
-                    total_views=0,
-                    total_likes=reactions,
-                    total_comments=0,
-                    total_shares=reactions,
-                    engagement_rate=engagement_rate,
-                    extra_data=extra_data
-                )
+                if self.archive_enabled:
+                    self.archive_payload("author_html", await page.content())
+                return await self._parse_page(page, datetime.utcnow())
             finally:
                 await page.close()
         return await retry_async(
@@ -135,6 +102,52 @@ class WibesParser(BaseParser):
             initial_delay=settings.parser_retry_delay * 2,
             exceptions=(PlaywrightTimeout, ConnectionError, TimeoutError, RuntimeError, Exception)
         )
+    async def parse_archived(self, payloads: dict[str, bytes], collected_at: datetime) -> PlatformMetrics:
+        await self._init_browser()
+        page = await self._context.new_page()
+        try:
+            await page.set_content(payloads["author_html"].decode("utf-8"), wait_until="domcontentloaded")
+            return await self._parse_page(page, collected_at)
+        finally:
+            await page.close()
+    async def _parse_page(self, page: Page, collected_at: datetime) -> PlatformMetrics:
+        author_name = await self._extract_author_name(page)
+        followers = await self._extract_followers(page)
+        posts_count = await self._extract_posts_count(page)
+        reactions = await self._extract_reactions(page)
+        posts = await self._extract_posts(page)
+        engagement_rate = 0.0
+        if followers and followers > 0 and reactions:
+            engagement_rate = round((reactions / followers) * 100, 2)
+        extra_data = {
+            "author_name": author_name,
+            "author_id": self.account_id,
+            "total_reactions": reactions,
+            "posts_analyzed": len(posts),
+            "recent_posts": posts[:10],
+        }
+        if posts:
+            total_post_reactions = sum(p.get("reactions", 0) for p in posts)
+            extra_data["avg_reactions_per_post"] = round(
+                total_post_reactions / len(posts), 2
+            ) if len(posts) > 0 else 0
+        logger.info(
+            f"Wibes metrics collected: followers={followers}, "
+            f"posts={posts_count}, reactions={reactions}"
+        )
+        return PlatformMetrics(
+            platform=self.PLATFORM_NAME,
+            account_id=self.account_id,
+            collected_at=collected_at,
+            followers=followers,
+            posts_count=posts_count,
+            total_views=0,
+            total_likes=reactions,
+            total_comments=0,
+            total_shares=reactions,
+            engagement_rate=engagement_rate,
+            extra_data=extra_data
+        )
     async def close(self) -> None:
         if self._context:
             await self._context.close()
@@ -1,6 +1,8 @@
 from datetime import datetime, timedelta, timezone
 from typing import Optional, List, Dict, Any
+import asyncio
 import logging
+import httplib2
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from src.parsers.base import BaseParser, PlatformMetrics
@@ -9,6 +11,10 @@ from src.config.settings import get_settings
 logger = logging.getLogger(__name__)
 settings = get_settings()
 class YouTubeParser(BaseParser):
+    SLOW_FIELDS = {
+        "channel_description": "profile",
+        "channel_created_at": "profile",
+    }
     def __init__(self, account_id: str, account_url: str):
         super().__init__(account_id, account_url)
         self.youtube = None
@@ -20,16 +26,17 @@ class YouTubeParser(BaseParser):
                 'youtube',
                 'v3',
                 developerKey=settings.youtube_api_key,
-                cache_discovery=False
+                cache_discovery=False,
+                http=httplib2.Http(timeout=settings.api_timeout_seconds)
             )
             logger.debug("YouTube API client initialized")
     async def is_available(self) -> bool:
         try:
             self._init_client()
-            self.youtube.channels().list(
+            await asyncio.to_thread(self.youtube.channels().list(
                 part='id',
                 id=self.account_id
-            ).execute()
+            ).execute)
             return True
         except Exception as e:
             logger.error(f"YouTube availability check failed: {e}")
@@ -114,11 +121,13 @@ class YouTubeParser(BaseParser):
         return [v for v in videos if v['published_at'] >= cutoff_date]
     async def fetch_metrics(self) -> PlatformMetrics:
         self._init_client()
-        async def _fetch() -> PlatformMetrics:
+        profile_fresh = self.is_profile_fresh("profile")
+        snippet_fields = 'title' if profile_fresh else 'title,description,publishedAt'
+        def _fetch_blocking() -> PlatformMetrics:
             channel_response = self.youtube.channels().list(
                 part='statistics,snippet',
                 id=self.account_id,
-                fields='items(snippet(title,description,publishedAt),statistics(subscriberCount,videoCount,viewCount))'
+                fields=f'items(snippet({snippet_fields}),statistics(subscriberCount,videoCount,viewCount))'
             ).execute()
             if not channel_response.get('items'):
                 raise ValueError(f"Channel {self.account_id} not found")
@@ -142,6 +151,53 @@ class YouTubeParser(BaseParser):
                 'avg_views_top50': metrics_90d.get('avg_views', 0),
                 'total_views_top50': metrics_90d.get('total_views', 0)
             }
+            extra_data = {
+                "channel_title": snippet.get('title'),
+                "metrics_7d": {
+                    "videos_count": metrics_7d['total_videos'],
+                    "total_views": metrics_7d['total_views'],
+                    "total_likes": metrics_7d['total_likes'],
+                    "total_comments": metrics_7d['total_comments'],
+                    "avg_views_per_video": metrics_7d['avg_views'],
+                    "engagement_rate": metrics_7d['engagement_rate'],
+                    "best_video": metrics_7d.get('best_video')
+                },
+                "metrics_30d": {
+                    "videos_count": metrics_30d['total_videos'],
+                    "total_views": metrics_30d['total_views'],
+                    "total_likes": metrics_30d['total_likes'],
+                    "total_comments": metrics_30d['total_comments'],
+                    "avg_views_per_video": metrics_30d['avg_views'],
+                    "avg_likes_per_video": metrics_30d['avg_likes'],
+                    "avg_comments_per_video": metrics_30d['avg_comments'],
+                    "engagement_rate": metrics_30d['engagement_rate'],
+                    "best_video": metrics_30d.get('best_video')
+                },
+                "metrics_90d": {
+                    "videos_count": metrics_90d['total_videos'],
+                    "total_views": metrics_90d['total_views'],
+                    "total_likes": metrics_90d['total_likes'],
+                    "total_comments": metrics_90d['total_comments'],
+                    "avg_views_per_video": metrics_90d['avg_views'],
+                    "engagement_rate": metrics_90d['engagement_rate'],
+                    "best_video": metrics_90d.get('best_video')
+                },
+                "all_time_top_videos": all_time_top,
+                "recent_videos": [
+                    {
+                        "title": v['title'],
+                        "views": v['views'],
+                        "likes": v['likes'],
+                        "comments": v['comments'],
+                        "published_at": v['published_at'].isoformat() if isinstance(v['published_at'], datetime) else v['published_at'],
+                        "video_id": v['video_id']
+                    }
+                    for v in videos_30d[:10]
+                ]
+            }
+            if not profile_fresh:
+                extra_data["channel_description"] = snippet.get('description', '')[:200]
+                extra_data["channel_created_at"] = snippet.get('publishedAt')
             return PlatformMetrics(
                 platform=self.get_platform_name(),
                 account_id=self.account_id,
@@ -152,53 +208,10 @@ class YouTubeParser(BaseParser):
                 total_likes=metrics_30d['total_likes'],
                 total_comments=metrics_30d['total_comments'],
                 engagement_rate=metrics_30d['engagement_rate'],
-                extra_data={
-                    "channel_title": snippet.get('title'),
-                    "channel_description": snippet.get('description', '')[:200],
-                    "channel_created_at": snippet.get('publishedAt'),
-                    "metrics_7d": {
-                        "videos_count": metrics_7d['total_videos'],
-                        "total_views": metrics_7d['total_views'],
-                        "total_likes": metrics_7d['total_likes'],
-                        "total_comments": metrics_7d['total_comments'],
-                        "avg_views_per_video": metrics_7d['avg_views'],
-                        "engagement_rate": metrics_7d['engagement_rate'],
-                        "best_video": metrics_7d.get('best_video')
-                    },
-                    "metrics_30d": {
-                        "videos_count": metrics_30d['total_videos'],
-                        "total_views": metrics_30d['total_views'],
-                        "total_likes": metrics_30d['total_likes'],
-                        "total_comments": metrics_30d['total_comments'],
-                        "avg_views_per_video": metrics_30d['avg_views'],
-                        "avg_likes_per_video": metrics_30d['avg_likes'],
-                        "avg_comments_per_video": metrics_30d['avg_comments'],
-                        "engagement_rate": metrics_30d['engagement_rate'],
-                        "best_video": metrics_30d.get('best_video')
-                    },
-                    "metrics_90d": {
-                        "videos_count": metrics_90d['total_videos'],
-                        "total_views": metrics_90d['total_views'],
-                        "total_likes": metrics_90d['total_likes'],
-                        "total_comments": metrics_90d['total_comments'],
-                        "avg_views_per_video": metrics_90d['avg_views'],
-                        "engagement_rate": metrics_90d['engagement_rate'],
-                        "best_video": metrics_90d.get('best_video')
-                    },
-                    "all_time_top_videos": all_time_top,
-                    "recent_videos": [
-                        {
-                            "title": v['title'],
-                            "views": v['views'],
-                            "likes": v['likes'],
-                            "comments": v['comments'],
-                            "published_at": v['published_at'].isoformat() if isinstance(v['published_at'], datetime) else v['published_at'],
-                            "video_id": v['video_id']
-                        }
-                        for v in videos_30d[:10]
-                    ]
-                }
+                extra_data=extra_data
             )
+        async def _fetch() -> PlatformMetrics:
+            return await asyncio.to_thread(_fetch_blocking)
         return await retry_async(
             _fetch,
             max_attempts=settings.parser_retry_attempts,
@@ -0,0 +1,109 @@
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+import logging
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.config.settings import get_settings
+from src.models.account import Account
+from src.models.circuit_breaker import CircuitBreaker
+from src.parsers.base import BaseParser
+logger = logging.getLogger(__name__)
+settings = get_settings()
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+class CircuitBreakerService:
+    def __init__(
+        self,
+        db: AsyncSession,
+        failure_threshold: Optional[int] = None,
+        cooldown_seconds: Optional[int] = None
+    ):
+        self.db = db
+        self.failure_threshold = failure_threshold or settings.circuit_breaker_failure_threshold
+        self.cooldown = timedelta(
+            seconds=cooldown_seconds if cooldown_seconds is not None else settings.circuit_breaker_cooldown_seconds
+        )
+    @staticmethod
+    def credential_key(account: Account, parser: BaseParser) -> str:
+        if not getattr(parser, 'requires_oauth', False):
+            return "default"
+        if account.platform == "instagram" and settings.instagram_system_user_token:
+            return "system_user"
+        return str(account.id)
+    @staticmethod
+    def make_key(platform: str, credential: str) -> str:
+        return f"{platform.lower()}:{credential}"
+    @staticmethod
+    def can_attempt(
+        state: str,
+        opened_at: Optional[datetime],
+        cooldown: timedelta,
+        now: Optional[datetime] = None
+    ) -> Tuple[bool, str]:
+        if state == CLOSED:
+            return True, CLOSED
+        now = now or datetime.utcnow()
+        if opened_at is None or now - opened_at.replace(tzinfo=None) >= cooldown:
+            return True, HALF_OPEN
+        return False, state
+    @staticmethod
+    def after_failure(state: str, failure_count: int, threshold: int) -> Tuple[str, int]:
+        failure_count += 1
+        if state == HALF_OPEN or failure_count >= threshold:
+            return OPEN, failure_count
+        return CLOSED, failure_count
+    async def allow(self, platform: str, credential: str) -> bool:
+        key = self.make_key(platform, credential)
+        breaker = await self.db.get(CircuitBreaker, key)
+        if breaker is None or breaker.state == CLOSED:
+            return True
+        breaker = await self._lock(platform, credential)
+        allowed, new_state = self.can_attempt(breaker.state, breaker.opened_at, self.cooldown)
+        if allowed and new_state == HALF_OPEN:
+            breaker.state = HALF_OPEN
+            breaker.opened_at = datetime.utcnow()
+            logger.info(f"Circuit {key} half-open, allowing trial request")
+        await self.db.commit()
+        return allowed
+    async def record_success(self, platform: str, credential: str) -> None:
+        breaker = await self._lock(platform, credential)
+        if breaker.state != CLOSED:
+            logger.info(f"Circuit {breaker.key} closed after successful trial")
+        breaker.state = CLOSED
+        breaker.failure_count = 0
+        breaker.opened_at = None
+        await self.db.commit()
+    async def record_failure(self, platform: str, credential: str, error: Optional[str] = None) -> None:
+        breaker = await self._lock(platform, credential)
+        previous_state = breaker.state
+        breaker.state, breaker.failure_count = self.after_failure(
+            breaker.state, breaker.failure_count, self.failure_threshold
+        )
+        breaker.last_failure_at = datetime.utcnow()
+        breaker.last_error = error[:1000] if error else None
+        if breaker.state == OPEN and previous_state != OPEN:
+            breaker.opened_at = breaker.last_failure_at
+            logger.warning(
+                f"Circuit {breaker.key} opened after {breaker.failure_count} failures, "
+                f"cooling down for {self.cooldown.total_seconds():.0f}s"
+            )
+        await self.db.commit()
+    async def get_all(self) -> List[CircuitBreaker]:
+        result = await self.db.execute(select(CircuitBreaker).order_by(CircuitBreaker.key))
+        return list(result.scalars().all())
+    async def _lock(self, platform: str, credential: str) -> CircuitBreaker:
+        key = self.make_key(platform, credential)
+        await self.db.execute(
+            insert(CircuitBreaker)
+            .values(key=key, platform=platform.lower(), credential=credential, state=CLOSED, failure_count=0)
+            .on_conflict_do_nothing(index_elements=[CircuitBreaker.key])
+        )
+        result = await self.db.execute(
+            select(CircuitBreaker)
+            .where(CircuitBreaker.key == key)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one()
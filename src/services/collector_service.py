@@ -1,16 +1,36 @@
 from datetime import datetime
 from typing import List, Optional, Dict
-from uuid import UUID
+from uuid import UUID, uuid4
+import asyncio
 import logging
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
 from src.models.account import Account
 from src.models.metric import Metric
 from src.models.collection_log import CollectionLog
+from src.models.collection_account_result import CollectionAccountResult
 from src.parsers.factory import ParserFactory
-from src.parsers.base import PlatformMetrics
+from src.parsers.base import BaseParser, PlatformMetrics
+from src.config.settings import get_settings
 from src.db.repository import BaseRepository
+from src.services.profile_cache_service import ProfileCacheService
+from src.services.platform_health_service import is_transport_error, platform_health
+from src.services.circuit_breaker_service import CircuitBreakerService
+from src.services.content_item_service import ContentItemService
+from src.services.rollup_service import RollupService
+from src.services.response_cache import get_response_cache
+from src.services.raw_payload_service import RawPayloadService
+from src.services.metric_formulas import BASE_COLUMNS, evaluate as evaluate_formula
+from src.models.metric_rollup import ROLLUP_FIELDS
 logger = logging.getLogger(__name__)
+settings = get_settings()
+RETRYABLE_OUTCOMES = ("failed", "timed_out")
+RETRYABLE_RUN_STATUSES = ("partial", "failed")
+class CollectionSkipped(Exception):
+    pass
+class CollectionTimedOut(Exception):
+    pass
 class CollectionResult:
     def __init__(self):
         self.log_id: Optional[UUID] = None
@@ -18,14 +38,20 @@ class CollectionResult:
         self.finished_at: Optional[datetime] = None
         self.accounts_processed: int = 0
         self.accounts_failed: int = 0
+        self.accounts_skipped: int = 0
+        self.accounts_timed_out: int = 0
         self.success_details: List[Dict] = []
         self.error_details: List[Dict] = []
+        self.skipped_details: List[Dict] = []
     @property
     def status(self) -> str:
-        if self.accounts_failed == 0:
+        failed = self.accounts_failed + self.accounts_timed_out
+        if failed == 0 and self.accounts_skipped == 0:
             return "success"
         elif self.accounts_processed > 0:
             return "partial"
+        elif failed == 0:
+            return "skipped"
         return "failed"
 class CollectorService:
     def __init__(self, db: AsyncSession):
@@ -33,6 +59,11 @@ class CollectorService:
         self.account_repo = BaseRepository(Account, db)
         self.metric_repo = BaseRepository(Metric, db)
         self.log_repo = BaseRepository(CollectionLog, db)
+        self.profile_cache = ProfileCacheService(db)
+        self.circuit_breaker = CircuitBreakerService(db)
+        self.content_items = ContentItemService(db)
+        self.rollups = RollupService(db)
+        self.raw_payloads = RawPayloadService(db)
     async def collect_all(
         self,
         platform_filter: Optional[str] = None
@@ -42,7 +73,9 @@ class CollectorService:
             started_at=result.started_at,
             status="running",
             accounts_processed=0,
-            accounts_failed=0
+            accounts_failed=0,
+            accounts_skipped=0,
+            accounts_timed_out=0
         )
         result.log_id = log.id
         await self.db.commit()
@@ -52,40 +85,48 @@ class CollectorService:
             logger.info(f"Found {len(accounts)} active accounts to process")
             if platform_filter:
                 logger.info(f"Platform filter: {platform_filter}")
-            for account in accounts:
-                try:
-                    await self._collect_account(account, result)
-                except Exception as e:
-                    logger.error(
-                        f"Failed to collect {account.platform}:{account.account_id}: {e}",
-                        exc_info=True
-                    )
-                    result.accounts_failed += 1
-                    result.error_details.append({
-                        "account_id": str(account.id),
-                        "platform": account.platform,
-                        "account_name": account.account_id,
-                        "error": str(e)
-                    })
+            await self._run_accounts(log.id, accounts, result)
             result.finished_at = datetime.utcnow()
+            await self._finish_log(log.id, result.finished_at)
+            logger.info(
+                f"Collection completed. Status: {result.status}, "
+                f"Success: {result.accounts_processed}, Failed: {result.accounts_failed}, "
+                f"Skipped: {result.accounts_skipped}, Timed out: {result.accounts_timed_out}"
+            )
+        except Exception as e:
+            result.finished_at = datetime.utcnow()
+            logger.error(f"Collection run failed: {e}", exc_info=True)
+            await self.db.rollback()
             await self.log_repo.update(
-                log.id,
+                result.log_id,
                 finished_at=result.finished_at,
-                status=result.status,
-                accounts_processed=result.accounts_processed,
-                accounts_failed=result.accounts_failed,
-                error_message=self._format_errors(result.error_details) if result.error_details else None
+                status="failed",
+                error_message=str(e)
             )
             await self.db.commit()
+            raise
+        return result
+    async def retry_failed(self, log_id: UUID) -> CollectionResult:
+        await self._claim_for_retry(log_id)
+        result = CollectionResult()
+        result.log_id = log_id
+        accounts = await self._get_retry_accounts(log_id)
+        logger.info(f"Retrying {len(accounts)} failed accounts from run {log_id}")
+        try:
+            await self._run_accounts(log_id, accounts, result)
+            result.finished_at = datetime.utcnow()
+            status = await self._finish_log(log_id, result.finished_at)
             logger.info(
-                f"Collection completed. Status: {result.status}, "
-                f"Success: {result.accounts_processed}, Failed: {result.accounts_failed}"
+                f"Retry of run {log_id} completed. Run status: {status}, "
+                f"Recovered: {result.accounts_processed}, "
+                f"Still failing: {result.accounts_failed + result.accounts_timed_out}"
             )
         except Exception as e:
             result.finished_at = datetime.utcnow()
-            logger.error(f"Collection run failed: {e}", exc_info=True)
+            logger.error(f"Retry of run {log_id} failed: {e}", exc_info=True)
+            await self.db.rollback()
             await self.log_repo.update(
-                log.id,
+                log_id,
                 finished_at=result.finished_at,
                 status="failed",
                 error_message=str(e)
@@ -93,6 +134,151 @@ class CollectorService:
             await self.db.commit()
             raise
         return result
+    async def _claim_for_retry(self, log_id: UUID) -> None:
+        claimed = await self.db.execute(
+            update(CollectionLog)
+            .where(CollectionLog.id == log_id, CollectionLog.status.in_(RETRYABLE_RUN_STATUSES))
+            .values(status="running")
+            .returning(CollectionLog.id)
+        )
+        if claimed.scalar_one_or_none() is not None:
+            await self.db.commit()
+            return
+        await self.db.rollback()
+        log = await self.log_repo.get(log_id)
+        if log is None:
+            raise ValueError(f"Collection log {log_id} not found")
+        raise RuntimeError(f"Collection run {log_id} is {log.status} and cannot be retried")
+    async def get_account_results(self, log_id: UUID) -> List[CollectionAccountResult]:
+        query = (
+            select(CollectionAccountResult)
+            .where(CollectionAccountResult.log_id == log_id)
+            .order_by(CollectionAccountResult.started_at)
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+    async def _run_accounts(self, log_id: UUID, accounts: List[Account], result: CollectionResult) -> None:
+        for account in accounts:
+            self.db.expunge(account)
+        for account in accounts:
+            started_at = datetime.utcnow()
+            try:
+                await self._collect_account(account, result, log_id)
+                await self._record_outcome(log_id, account.id, "success", None, started_at)
+            except CollectionSkipped as e:
+                await self.db.rollback()
+                logger.info(f"Skipped {account.platform}:{account.account_id}: {e}")
+                result.accounts_skipped += 1
+                result.skipped_details.append({
+                    "account_id": str(account.id),
+                    "platform": account.platform,
+                    "account_name": account.account_id,
+                    "reason": str(e)
+                })
+                await self._record_outcome(log_id, account.id, "skipped", str(e), started_at)
+            except CollectionTimedOut as e:
+                await self.db.rollback()
+                logger.error(f"Timed out collecting {account.platform}:{account.account_id}: {e}")
+                result.accounts_timed_out += 1
+                result.error_details.append({
+                    "account_id": str(account.id),
+                    "platform": account.platform,
+                    "account_name": account.account_id,
+                    "error": str(e),
+                    "outcome": "timed_out"
+                })
+                await self._record_outcome(log_id, account.id, "timed_out", str(e), started_at)
+            except Exception as e:
+                await self.db.rollback()
+                logger.error(
+                    f"Failed to collect {account.platform}:{account.account_id}: {e}",
+                    exc_info=True
+                )
+                result.accounts_failed += 1
+                result.error_details.append({
+                    "account_id": str(account.id),
+                    "platform": account.platform,
+                    "account_name": account.account_id,
+                    "error": str(e)
+                })
+                await self._record_outcome(log_id, account.id, "failed", str(e), started_at)
+    async def _record_outcome(
+        self,
+        log_id: UUID,
+        account_id: UUID,
+        status: str,
+        error: Optional[str],
+        started_at: datetime
+    ) -> None:
+        values = {
+            "log_id": log_id,
+            "account_id": account_id,
+            "status": status,
+            "error": error,
+            "started_at": started_at,
+            "finished_at": datetime.utcnow(),
+        }
+        stmt = insert(CollectionAccountResult).values(id=uuid4(), attempts=1, **values)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_collection_account_results_log_account",
+            set_={
+                "status": stmt.excluded.status,
+                "error": stmt.excluded.error,
+                "started_at": stmt.excluded.started_at,
+                "finished_at": stmt.excluded.finished_at,
+                "attempts": CollectionAccountResult.attempts + 1,
+            }
+        )
+        await self.db.execute(stmt)
+        await self.db.commit()
+    async def _finish_log(self, log_id: UUID, finished_at: datetime) -> str:
+        rows = await self.db.execute(
+            select(
+                CollectionAccountResult.status,
+                CollectionAccountResult.error,
+                Account.platform,
+                Account.account_id
+            )
+            .join(Account, Account.id == CollectionAccountResult.account_id)
+            .where(CollectionAccountResult.log_id == log_id)
+        )
+        totals = CollectionResult()
+        for outcome, error, platform, account_name in rows.all():
+            if outcome == "success":
+                totals.accounts_processed += 1
+                continue
+            if outcome == "skipped":
+                totals.accounts_skipped += 1
+                continue
+            if outcome == "timed_out":
+                totals.accounts_timed_out += 1
+            else:
+                totals.accounts_failed += 1
+            totals.error_details.append({"platform": platform, "account_name": account_name, "error": error})
+        await self.log_repo.update(
+            log_id,
+            finished_at=finished_at,
+            status=totals.status,
+            accounts_processed=totals.accounts_processed,
+            accounts_failed=totals.accounts_failed,
+            accounts_skipped=totals.accounts_skipped,
+            accounts_timed_out=totals.accounts_timed_out,
+            error_message=self._format_errors(totals.error_details) if totals.error_details else None
+        )
+        await self.db.commit()
+        return totals.status
+    async def _get_retry_accounts(self, log_id: UUID) -> List[Account]:
+        query = (
+            select(Account)
+            .join(CollectionAccountResult, CollectionAccountResult.account_id == Account.id)
+            .where(
+                CollectionAccountResult.log_id == log_id,
+                CollectionAccountResult.status.in_(RETRYABLE_OUTCOMES),
+                Account.is_active == True
+            )
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
     async def _get_active_accounts(self, platform_filter: Optional[str] = None) -> List[Account]:
         query = select(Account).where(Account.is_active == True)
         if platform_filter:
@@ -101,21 +287,42 @@ class CollectorService:
         accounts = list(result.scalars().all())
         logger.debug(f"Fetched {len(accounts)} active accounts")
         return accounts
-    async def _collect_account(self, account: Account, result: CollectionResult) -> None:
+    async def _collect_account(self, account: Account, result: CollectionResult, log_id: Optional[UUID] = None) -> None:
         logger.info(f"Collecting metrics for {account.platform}:{account.account_id}")
         parser = ParserFactory.create(
             account.platform,
             account.account_id,
             account.account_url
         )
+        credential = CircuitBreakerService.credential_key(account, parser)
         if hasattr(parser, 'set_db_context'):
             parser.set_db_context(self.db, account.id)
+        if self.raw_payloads.should_archive(account.platform, parser):
+            parser.enable_archive()
         try:
-            is_available = await parser.is_available()
-            if not is_available:
-                raise RuntimeError(f"Platform {account.platform} is not available")
-            metrics = await parser.fetch_metrics()
-            await self._save_metrics(account.id, metrics)
+            if not await self.circuit_breaker.allow(account.platform, credential):
+                raise CollectionSkipped(f"Circuit open for {account.platform}:{credential}")
+            fresh_groups = await self.profile_cache.get_fresh_groups(account.id, parser.SLOW_FIELDS)
+            parser.set_profile_context(fresh_groups)
+            timeout = self.account_timeout(account.platform)
+            try:
+                metrics = await asyncio.wait_for(self._fetch_account(account, parser), timeout=timeout)
+            except CollectionSkipped:
+                raise
+            except asyncio.TimeoutError:
+                error = f"Exceeded {timeout}s time budget"
+                platform_health.record_failure(account.platform, error)
+                await self.circuit_breaker.record_failure(account.platform, credential, error)
+                raise CollectionTimedOut(error)
+            except Exception as e:
+                if is_transport_error(e):
+                    platform_health.record_failure(account.platform, str(e))
+                    await self.circuit_breaker.record_failure(account.platform, credential, str(e))
+                raise
+            platform_health.record_success(account.platform)
+            await self.circuit_breaker.record_success(account.platform, credential)
+            await self.profile_cache.store(account.id, parser.SLOW_FIELDS, metrics.extra_data, fresh_groups)
+            await self._save_metrics(account.id, metrics, log_id, parser.archived_payloads)
             result.accounts_processed += 1
             result.success_details.append({
                 "account_id": str(account.id),
@@ -132,9 +339,40 @@ class CollectorService:
             )
         finally:
             if hasattr(parser, 'close'):
-                await parser.close()
-    async def _save_metrics(self, account_id: UUID, metrics: PlatformMetrics) -> None:
-        await self.metric_repo.create(
+                await self._close_parser(account, parser)
+    @staticmethod
+    def account_timeout(platform: str) -> int:
+        return settings.collect_account_timeout_overrides.get(
+            platform.lower(),
+            settings.collect_account_timeout_seconds
+        )
+    async def _fetch_account(self, account: Account, parser: BaseParser) -> PlatformMetrics:
+        is_available = await platform_health.ensure_available(account.platform, parser)
+        if not is_available:
+            raise CollectionSkipped(f"Platform {account.platform} is not available")
+        return await parser.fetch_metrics()
+    async def _close_parser(self, account: Account, parser: BaseParser) -> None:
+        try:
+            await asyncio.wait_for(parser.close(), timeout=settings.parser_close_timeout_seconds)
+        except asyncio.TimeoutError:
+            logger.warning(f"Parser for {account.platform}:{account.account_id} did not close in time")
+        except Exception as e:
+            logger.warning(f"Failed to close parser for {account.platform}:{account.account_id}: {e}")
+    async def _save_metrics(
+        self,
+        account_id: UUID,
+        metrics: PlatformMetrics,
+        log_id: Optional[UUID] = None,
+        payloads: Optional[Dict] = None
+    ) -> None:
+        formula_version = None
+        evaluated = evaluate_formula(metrics.platform, {
+            **{column: getattr(metrics, column) for column in BASE_COLUMNS},
+            "extra_data": metrics.extra_data,
+        })
+        if evaluated:
+            metrics.engagement_rate, formula_version = evaluated
+        metric = await self.metric_repo.create(
             account_id=account_id,
             collected_at=metrics.collected_at,
             followers=metrics.followers,
@@ -144,9 +382,19 @@ class CollectorService:
             total_views=metrics.total_views,
             total_shares=metrics.total_shares,
             engagement_rate=metrics.engagement_rate,
+            formula_version=formula_version,
             extra_data=metrics.extra_data
         )
+        if payloads:
+            await self.raw_payloads.store(account_id, log_id, metric.id, metrics.collected_at, payloads)
+        await self.content_items.upsert(account_id, metrics.platform, metrics.extra_data, metrics.collected_at)
+        await self.rollups.apply(
+            account_id,
+            metrics.collected_at,
+            {field: getattr(metrics, field) for field in ROLLUP_FIELDS}
+        )
         await self.db.commit()
+        await get_response_cache().bump(account_id)
         logger.debug(f"Saved metrics for account {account_id}")
     @staticmethod
     def _format_errors(errors: List[Dict]) -> str:
@@ -0,0 +1,238 @@
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+import logging
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.db.keyset import after_nullable
+from src.models.account import Account
+from src.models.content_item import ContentItem
+from src.models.content_item_stat import ContentItemStat
+from src.models.metric import Metric
+from src.services.extra_data_service import ExtraDataService
+logger = logging.getLogger(__name__)
+COUNTERS = ("views", "likes", "comments", "shares", "saves", "impressions", "reach", "engagement_rate")
+SORT_COLUMNS = {
+    "date": ContentItem.published_at,
+    "views": ContentItem.views,
+    "likes": ContentItem.likes,
+    "comments": ContentItem.comments,
+    "engagement": ContentItem.engagement_rate,
+}
+SORT_PARSERS = {
+    "date": datetime.fromisoformat,
+    "views": int,
+    "likes": int,
+    "comments": int,
+    "engagement": float,
+}
+def _parse_datetime(value: Any) -> Optional[datetime]:
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        try:
+            parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+def _engagement(views: Optional[int], *interactions: Optional[int]) -> Optional[float]:
+    if not views:
+        return None
+    return round(sum(i or 0 for i in interactions) / views * 100, 2)
+def _youtube_video(video: Dict) -> Dict:
+    video_id = video.get("video_id")
+    return {
+        "external_id": video_id,
+        "content_type": "video",
+        "caption": video.get("title"),
+        "url": f"https://www.youtube.com/watch?v={video_id}",
+        "published_at": _parse_datetime(video.get("published_at")),
+        "views": video.get("views"),
+        "likes": video.get("likes"),
+        "comments": video.get("comments"),
+        "engagement_rate": _engagement(video.get("views"), video.get("likes"), video.get("comments")),
+    }
+def _tiktok_video(video: Dict) -> Dict:
+    return {
+        "external_id": video.get("video_id"),
+        "content_type": "video",
+        "caption": video.get("title"),
+        "published_at": _parse_datetime(video.get("published_at")),
+        "views": video.get("views"),
+        "likes": video.get("likes"),
+        "comments": video.get("comments"),
+        "shares": video.get("shares"),
+        "engagement_rate": video.get("engagement_rate"),
+    }
+def _instagram_media(media: Dict) -> Dict:
+    return {
+        "external_id": media.get("media_id") or media.get("id"),
+        "content_type": (media.get("media_type") or "post").lower(),
+        "caption": media.get("caption"),
+        "url": media.get("permalink"),
+        "published_at": _parse_datetime(media.get("timestamp")),
+        "likes": media.get("likes", media.get("like_count")),
+        "comments": media.get("comments", media.get("comments_count")),
+        "saves": media.get("saved"),
+        "impressions": media.get("impressions"),
+        "reach": media.get("reach"),
+        "engagement_rate": media.get("engagement_rate"),
+    }
+def _pinterest_pin(pin: Dict) -> Dict:
+    pin_id = pin.get("pin_id")
+    return {
+        "external_id": pin_id,
+        "content_type": "pin",
+        "url": f"https://www.pinterest.com/pin/{pin_id}/",
+        "saves": pin.get("saves"),
+        "impressions": pin.get("impressions"),
+        "engagement_rate": _engagement(pin.get("impressions"), pin.get("saves"), pin.get("pin_clicks")),
+    }
+def _telegram_post(post: Dict) -> Dict:
+    return {
+        "external_id": str(post["id"]) if post.get("id") is not None else None,
+        "content_type": "post",
+        "caption": post.get("text"),
+        "published_at": _parse_datetime(post.get("date")),
+        "views": post.get("views"),
+        "likes": post.get("reactions"),
+        "shares": post.get("forwards"),
+    }
+EXTRACTORS: Dict[str, tuple[str, Callable[[Dict], Dict]]] = {
+    "youtube": ("recent_videos", _youtube_video),
+    "tiktok": ("recent_videos", _tiktok_video),
+    "instagram": ("recent_media", _instagram_media),
+    "pinterest": ("top_pins", _pinterest_pin),
+    "telegram": ("top_posts_by_views", _telegram_post),
+}
+class ContentItemService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    @staticmethod
+    def extract_items(platform: str, extra_data: Optional[dict]) -> List[Dict]:
+        extractor = EXTRACTORS.get(platform.lower())
+        if not extractor or not extra_data:
+            return []
+        key, normalize = extractor
+        items = {}
+        for raw in extra_data.get(key) or []:
+            if not isinstance(raw, dict):
+                continue
+            item = normalize(raw)
+            if item.get("external_id"):
+                item["external_id"] = str(item["external_id"])
+                items[item["external_id"]] = item
+        return list(items.values())
+    async def upsert(
+        self,
+        account_id: UUID,
+        platform: str,
+        extra_data: Optional[dict],
+        collected_at: datetime
+    ) -> int:
+        items = self.extract_items(platform, extra_data)
+        if not items:
+            return 0
+        stmt = insert(ContentItem).values([
+            {
+                "id": uuid4(),
+                "account_id": account_id,
+                "platform": platform.lower(),
+                "external_id": item["external_id"],
+                "content_type": item["content_type"],
+                "caption": item.get("caption"),
+                "url": item.get("url"),
+                "published_at": item.get("published_at"),
+                "last_collected_at": collected_at,
+                **{counter: item.get(counter) for counter in COUNTERS},
+            }
+            for item in items
+        ])
+        refreshed = {
+            column: func.coalesce(getattr(stmt.excluded, column), getattr(ContentItem, column))
+            for column in ("caption", "url", "published_at") + COUNTERS
+        }
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_content_items_account_external",
+            set_={
+                **refreshed,
+                "content_type": stmt.excluded.content_type,
+                "last_collected_at": func.greatest(stmt.excluded.last_collected_at, ContentItem.last_collected_at),
+                "updated_at": func.now(),
+            }
+        ).returning(ContentItem.id, ContentItem.external_id)
+        result = await self.db.execute(stmt)
+        item_ids = {external_id: item_id for item_id, external_id in result.all()}
+        stats = insert(ContentItemStat).values([
+            {
+                "id": uuid4(),
+                "content_item_id": item_ids[item["external_id"]],
+                "collected_at": collected_at,
+                **{counter: item.get(counter) for counter in COUNTERS},
+            }
+            for item in items
+        ]).on_conflict_do_nothing(constraint="uq_content_item_stats_item_collected")
+        await self.db.execute(stats)
+        logger.debug(f"Upserted {len(items)} {platform} content items for account {account_id}")
+        return len(items)
+    async def list_items(
+        self,
+        platform: Optional[str] = None,
+        account_id: Optional[str] = None,
+        sort_by: str = "date",
+        order: str = "desc",
+        limit: int = 20,
+        offset: int = 0,
+        published_after: Optional[datetime] = None,
+        after: Optional[Tuple[Any, UUID]] = None
+    ) -> List[ContentItem]:
+        column = SORT_COLUMNS[sort_by]
+        query = select(ContentItem)
+        if platform:
+            query = query.where(ContentItem.platform == platform.lower())
+        if account_id:
+            query = query.where(ContentItem.account_id == account_id)
+        if published_after:
+            query = query.where(ContentItem.published_at >= published_after)
+        if after:
+            query = query.where(after_nullable(column, ContentItem.id, after[0], after[1], order == "desc"))
+        ordering = column.desc().nulls_last() if order == "desc" else column.asc().nulls_last()
+        query = query.order_by(ordering, ContentItem.id).limit(limit).offset(offset)
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+    async def get_stats(self, item_id: UUID) -> List[ContentItemStat]:
+        result = await self.db.execute(
+            select(ContentItemStat)
+            .where(ContentItemStat.content_item_id == item_id)
+            .order_by(ContentItemStat.collected_at.asc())
+        )
+        return list(result.scalars().all())
+    async def backfill(self, batch_size: int = 500) -> int:
+        total = 0
+        cursor = None
+        platforms = list(EXTRACTORS)
+        while True:
+            query = (
+                select(Metric.id, Metric.account_id, Metric.collected_at, Metric.extra_data, Account.platform)
+                .join(Account, Account.id == Metric.account_id)
+                .where(Account.platform.in_(platforms))
+                .order_by(Metric.collected_at, Metric.id)
+                .limit(batch_size)
+            )
+            if cursor:
+                query = query.where(tuple_(Metric.collected_at, Metric.id) > cursor)
+            rows = (await self.db.execute(query)).all()
+            if not rows:
+                break
+            documents = await ExtraDataService(self.db).resolve_many([row.extra_data for row in rows])
+            for (metric_id, account_id, collected_at, _, platform), extra_data in zip(rows, documents):
+                total += await self.upsert(account_id, platform, extra_data, collected_at)
+            await self.db.commit()
+            cursor = (rows[-1].collected_at, rows[-1].id)
+            logger.info(f"Backfilled content items up to {cursor[0]} ({total} item snapshots)")
+        return total
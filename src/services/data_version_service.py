@@ -0,0 +1,68 @@
+from typing import Any, Optional
+from uuid import UUID
+from sqlalchemy import func, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.models.data_version import DataVersion
+GLOBAL_SCOPE = "*"
+MEMO_KEY = "data_versions"
+ACCOUNT_VERSION_SQL = """
+SELECT concat_ws(
+    ':',
+    a.updated_at,
+    l.metric_id,
+    l.collected_at,
+    l.updated_at,
+    COALESCE((SELECT version FROM data_versions WHERE scope = CAST(:account_id AS text)), 0),
+    COALESCE((SELECT version FROM data_versions WHERE scope = :global_scope), 0)
+)
+FROM accounts a
+LEFT JOIN account_latest_metrics l ON l.account_id = a.id
+WHERE a.id = :account_id
+"""
+GLOBAL_VERSION_SQL = """
+SELECT concat_ws(
+    ':',
+    (SELECT count(*) FROM accounts),
+    (SELECT max(updated_at) FROM accounts),
+    (SELECT md5(string_agg(metric_id::text, ',' ORDER BY account_id)) FROM account_latest_metrics),
+    (SELECT max(updated_at) FROM account_latest_metrics),
+    (SELECT COALESCE(sum(version), 0) FROM data_versions),
+    (SELECT concat_ws('/', id, status, finished_at) FROM collection_logs ORDER BY started_at DESC LIMIT 1)
+)
+"""
+class DataVersionService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    @staticmethod
+    def scope_for(account_id: Any = None) -> str:
+        return str(account_id) if account_id else GLOBAL_SCOPE
+    async def bump(self, account_id: Any = None) -> None:
+        self.db.info.pop(MEMO_KEY, None)
+        stmt = insert(DataVersion).values(scope=self.scope_for(account_id), version=1)
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[DataVersion.scope],
+                set_={"version": DataVersion.version + 1, "updated_at": func.now()},
+            )
+        )
+    async def account_version(self, account_id: UUID) -> Optional[str]:
+        result = await self.db.execute(
+            text(ACCOUNT_VERSION_SQL),
+            {"account_id": account_id, "global_scope": GLOBAL_SCOPE}
+        )
+        return result.scalar_one_or_none()
+    async def global_version(self) -> str:
+        result = await self.db.execute(text(GLOBAL_VERSION_SQL))
+        return result.scalar_one()
+    async def version(self, account_id: Optional[UUID] = None) -> str:
+        memo = self.db.info.setdefault(MEMO_KEY, {})
+        if account_id not in memo:
+            memo[account_id] = await self.compute_version(account_id)
+        return memo[account_id]
+    async def compute_version(self, account_id: Optional[UUID]) -> str:
+        if account_id is not None:
+            version = await self.account_version(account_id)
+            if version is not None:
+                return f"account:{version}"
+        return f"global:{await self.global_version()}"
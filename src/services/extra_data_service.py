@@ -0,0 +1,90 @@
+from typing import Any, Dict, Iterable, List, Optional
+import logging
+from sqlalchemy import select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.config.settings import get_settings
+from src.models.extra_data_blob import (
+    BLOB_REF_KEY,
+    ExtraDataBlob,
+    decode_extra_data,
+    encode_extra_data,
+    is_blob_ref,
+)
+from src.models.metric import Metric
+from src.services.data_version_service import DataVersionService
+logger = logging.getLogger(__name__)
+settings = get_settings()
+class ExtraDataService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    @staticmethod
+    def referenced_hashes(documents: Iterable[Optional[dict]]) -> set[str]:
+        return {
+            value[BLOB_REF_KEY]
+            for document in documents if document
+            for value in document.values() if is_blob_ref(value)
+        }
+    async def load_blobs(self, hashes: Iterable[str]) -> Dict[str, Any]:
+        hashes = list(hashes)
+        if not hashes:
+            return {}
+        result = await self.db.execute(
+            select(ExtraDataBlob.hash, ExtraDataBlob.value).where(ExtraDataBlob.hash.in_(hashes))
+        )
+        return dict(result.all())
+    async def resolve_many(self, documents: List[Optional[dict]]) -> List[Optional[dict]]:
+        blobs = await self.load_blobs(self.referenced_hashes(documents))
+        if not blobs:
+            return documents
+        return [decode_extra_data(document, blobs) for document in documents]
+    async def resolve(self, document: Optional[dict]) -> Optional[dict]:
+        return (await self.resolve_many([document]))[0]
+    async def insert_blobs(self, blobs: Dict[str, dict]) -> None:
+        if not blobs:
+            return
+        await self.db.execute(
+            insert(ExtraDataBlob)
+            .values(list(blobs.values()))
+            .on_conflict_do_nothing(index_elements=[ExtraDataBlob.hash])
+        )
+    async def prepare_for_storage(self, extra_data: Optional[dict]) -> Optional[dict]:
+        if settings.metrics_extra_data_storage != "blobs":
+            return extra_data
+        encoded, blobs = encode_extra_data(extra_data, settings.metrics_blob_min_bytes)
+        await self.insert_blobs(blobs)
+        return encoded
+    async def pack_existing(self, batch_size: int = 500, min_bytes: Optional[int] = None) -> int:
+        min_bytes = min_bytes or settings.metrics_blob_min_bytes
+        packed = 0
+        cursor = None
+        while True:
+            query = (
+                select(Metric.id, Metric.collected_at, Metric.extra_data)
+                .where(Metric.extra_data.isnot(None))
+                .order_by(Metric.collected_at, Metric.id)
+                .limit(batch_size)
+            )
+            if cursor:
+                query = query.where(tuple_(Metric.collected_at, Metric.id) > cursor)
+            rows = (await self.db.execute(query)).all()
+            if not rows:
+                break
+            for metric_id, collected_at, extra_data in rows:
+                encoded, blobs = encode_extra_data(extra_data, min_bytes)
+                if not blobs:
+                    continue
+                await self.insert_blobs(blobs)
+                await self.db.execute(
+                    update(Metric)
+                    .where(Metric.id == metric_id, Metric.collected_at == collected_at)
+                    .values(extra_data=encoded)
+                )
+                packed += 1
+            await self.db.commit()
+            cursor = (rows[-1].collected_at, rows[-1].id)
+            logger.info(f"Packed extra_data up to {cursor[0]} ({packed} snapshots rewritten)")
+        if packed:
+            await DataVersionService(self.db).bump()
+            await self.db.commit()
+        return packed
@@ -0,0 +1,142 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence
+import logging
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.services.rollup_service import RollupService
+logger = logging.getLogger(__name__)
+PERIOD_DAYS = {"7d": 7, "30d": 30, "90d": 90}
+COMPARE_MODES = ("previous", "start")
+GROWTH_COUNTERS = ("followers", "posts_count", "total_views", "total_likes")
+def change(current: Optional[float], baseline: Optional[float]) -> Dict[str, Any]:
+    if current is None or baseline is None:
+        return {"current": current, "baseline": baseline, "change": None, "change_pct": None}
+    delta = current - baseline
+    return {
+        "current": current,
+        "baseline": baseline,
+        "change": delta,
+        "change_pct": delta / abs(baseline) * 100 if baseline else None,
+    }
+class GrowthService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    @staticmethod
+    def build_sql(compare: str, rank_by: str, platform: bool) -> str:
+        if compare not in COMPARE_MODES:
+            raise ValueError(f"Unsupported comparison: {compare}")
+        if rank_by not in GROWTH_COUNTERS:
+            raise ValueError(f"Unsupported ranking counter: {rank_by}")
+        period_values = []
+        lagged = []
+        outputs = []
+        for counter in GROWTH_COUNTERS:
+            period_values += [
+                f"(array_agg({counter}_last ORDER BY bucket_start DESC) FILTER (WHERE {counter}_last IS NOT NULL))[1] AS {counter}_end",
+                f"(array_agg({counter}_last ORDER BY bucket_start) FILTER (WHERE {counter}_last IS NOT NULL))[1] AS {counter}_start",
+            ]
+            lagged.append(f"LAG({counter}_end) OVER account_periods AS {counter}_previous")
+            baseline = f"{counter}_previous" if compare == "previous" else f"{counter}_start"
+            outputs.append(f"{counter}_end AS {counter}_current, {baseline} AS {counter}_baseline")
+        rank_baseline = f"{rank_by}_previous" if compare == "previous" else f"{rank_by}_start"
+        rank_change = f"({rank_by}_end - {rank_baseline})"
+        platform_filter = "AND a.platform = :platform" if platform else ""
+        return f"""
+WITH daily AS (
+    SELECT r.*, a.platform, a.display_name, CASE WHEN r.bucket_start >= :current_start THEN 1 ELSE 0 END AS period_index
+    FROM metrics_rollup_day r
+    JOIN accounts a ON a.id = r.account_id
+    WHERE r.bucket_start >= :previous_start AND r.bucket_start <= :end {platform_filter}
+),
+periods AS (
+    SELECT account_id, platform, display_name, period_index, {', '.join(period_values)}
+    FROM daily
+    GROUP BY account_id, platform, display_name, period_index
+),
+compared AS (
+    SELECT *, {', '.join(lagged)}
+    FROM periods
+    WINDOW account_periods AS (PARTITION BY account_id ORDER BY period_index)
+)
+SELECT
+    account_id,
+    platform,
+    display_name,
+    {', '.join(outputs)},
+    rank() OVER (
+        ORDER BY {rank_change}::double precision / NULLIF({rank_baseline}, 0) DESC NULLS LAST, {rank_change} DESC NULLS LAST
+    ) AS rank
+FROM compared
+WHERE period_index = 1
+ORDER BY rank, display_name
+"""
+    @staticmethod
+    def account_growth(row: Any) -> Dict[str, Any]:
+        values = row._mapping
+        return {
+            "account_id": values["account_id"],
+            "platform": values["platform"],
+            "display_name": values["display_name"],
+            "rank": values["rank"],
+            "counters": {
+                counter: change(values[f"{counter}_current"], values[f"{counter}_baseline"])
+                for counter in GROWTH_COUNTERS
+            },
+        }
+    @staticmethod
+    def platform_growth(accounts: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        platforms: Dict[str, Dict[str, Any]] = {}
+        for account in accounts:
+            totals = platforms.setdefault(account["platform"], {
+                "platform": account["platform"],
+                "accounts": 0,
+                "current": {counter: 0 for counter in GROWTH_COUNTERS},
+                "baseline": {counter: 0 for counter in GROWTH_COUNTERS},
+            })
+            totals["accounts"] += 1
+            for counter, values in account["counters"].items():
+                if values["change"] is None:
+                    continue
+                totals["current"][counter] += values["current"]
+                totals["baseline"][counter] += values["baseline"]
+        return [
+            {
+                "platform": platform,
+                "accounts": totals["accounts"],
+                "counters": {
+                    counter: change(totals["current"][counter], totals["baseline"][counter])
+                    for counter in GROWTH_COUNTERS
+                },
+            }
+            for platform, totals in sorted(platforms.items())
+        ]
+    async def get_growth(
+        self,
+        period: str = "7d",
+        compare: str = "previous",
+        rank_by: str = "followers",
+        platform: Optional[str] = None,
+        end: Optional[datetime] = None,
+        limit: int = 10
+    ) -> Dict[str, Any]:
+        if period not in PERIOD_DAYS:
+            raise ValueError(f"Unsupported period: {period}")
+        end = end or datetime.now(timezone.utc)
+        current_start = RollupService.bucket_start(end - timedelta(days=PERIOD_DAYS[period]), "day")
+        previous_start = current_start - timedelta(days=PERIOD_DAYS[period])
+        params: Dict[str, Any] = {"current_start": current_start, "previous_start": previous_start, "end": end}
+        if platform:
+            params["platform"] = platform.lower()
+        result = await self.db.execute(text(self.build_sql(compare, rank_by, bool(platform))), params)
+        accounts = [self.account_growth(row) for row in result]
+        logger.info(f"Computed {period} growth for {len(accounts)} accounts (compare={compare}, rank_by={rank_by})")
+        return {
+            "period": period,
+            "compare": compare,
+            "rank_by": rank_by,
+            "start": current_start,
+            "end": end,
+            "platforms": self.platform_growth(accounts),
+            "accounts": accounts,
+            "leaderboard": [account for account in accounts if account["counters"][rank_by]["change"] is not None][:limit],
+        }
@@ -3,7 +3,7 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from uuid import UUID
 import httpx
-from sqlalchemy import select
+from sqlalchemy import exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.config.settings import get_settings
 from src.db.repository import BaseRepository
@@ -188,12 +188,14 @@ class InstagramStoriesCollectorService:
         self, story_id: str, threshold_hours: int = 1
     ) -> bool:
         threshold_time = datetime.utcnow() - timedelta(hours=threshold_hours)
-        query = select(InstagramStorySnapshot).where(
-            InstagramStorySnapshot.story_id == story_id,
-            InstagramStorySnapshot.collected_at >= threshold_time,
+        query = select(
+            exists().where(
+                InstagramStorySnapshot.story_id == story_id,
+                InstagramStorySnapshot.collected_at >= threshold_time,
+            )
         )
         result = await self.db.execute(query)
-        return result.scalar_one_or_none() is not None
+        return bool(result.scalar())
     async def _save_snapshot(
         self, account_id: UUID, story: Dict, insights: Dict
     ) -> None:
@@ -0,0 +1,26 @@
+from typing import Optional
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+from src.models.account import Account
+from src.models.account_latest_metric import AccountLatestMetric
+class LatestMetricService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    async def get(self, account_id: UUID, platform: Optional[str] = None) -> Optional[AccountLatestMetric]:
+        query = select(AccountLatestMetric).where(AccountLatestMetric.account_id == account_id)
+        if platform:
+            query = query.join(Account, Account.id == AccountLatestMetric.account_id).where(Account.platform == platform)
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none()
+    @staticmethod
+    def accounts_with_latest(platform: Optional[str] = None, is_active: Optional[bool] = None) -> Select:
+        query = select(Account, AccountLatestMetric).outerjoin(
+            AccountLatestMetric, AccountLatestMetric.account_id == Account.id
+        )
+        if platform:
+            query = query.where(Account.platform == platform)
+        if is_active is not None:
+            query = query.where(Account.is_active == is_active)
+        return query.order_by(Account.display_name)
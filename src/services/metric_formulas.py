@@ -0,0 +1,67 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import pandas as pd
+BASE_COLUMNS = ("followers", "posts_count", "total_likes", "total_comments", "total_views", "total_shares")
+@dataclass(frozen=True)
+class Formula:
+    platform: str
+    version: int
+    compute: Callable[[pd.DataFrame], pd.Series]
+    extra_fields: Dict[str, Tuple[str, ...]] = field(default_factory=dict)
+    def frame(self, rows: Iterable[Dict[str, Any]]) -> pd.DataFrame:
+        records = []
+        for row in rows:
+            record = {column: row.get(column) for column in BASE_COLUMNS}
+            for name, path in self.extra_fields.items():
+                record[name] = extract_path(row.get("extra_data"), path)
+            records.append(record)
+        columns = list(BASE_COLUMNS) + list(self.extra_fields)
+        return pd.DataFrame.from_records(records, columns=columns).apply(pd.to_numeric, errors="coerce").fillna(0)
+    def apply(self, rows: List[Dict[str, Any]]) -> List[float]:
+        if not rows:
+            return []
+        return self.compute(self.frame(rows)).round(2).tolist()
+FORMULAS: Dict[str, Dict[int, Formula]] = {}
+def register(platform: str, version: int, extra_fields: Optional[Dict[str, Tuple[str, ...]]] = None):
+    def decorator(compute: Callable[[pd.DataFrame], pd.Series]) -> Callable[[pd.DataFrame], pd.Series]:
+        FORMULAS.setdefault(platform, {})[version] = Formula(platform, version, compute, extra_fields or {})
+        return compute
+    return decorator
+def get_formula(platform: str, version: Optional[int] = None) -> Optional[Formula]:
+    versions = FORMULAS.get(platform.lower())
+    if not versions:
+        return None
+    if version is None:
+        version = max(versions)
+    return versions.get(version)
+def evaluate(platform: str, row: Dict[str, Any]) -> Optional[Tuple[float, int]]:
+    formula = get_formula(platform)
+    if not formula:
+        return None
+    return formula.apply([row])[0], formula.version
+def extract_path(document: Optional[dict], path: Tuple[str, ...]) -> Any:
+    value: Any = document
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+def percent(numerator: pd.Series, denominator: pd.Series) -> pd.Series:
+    return (numerator / denominator.where(denominator > 0) * 100).fillna(0.0)
+@register("youtube", 1, {"views_30d": ("metrics_30d", "total_views")})
+def youtube_v1(df: pd.DataFrame) -> pd.Series:
+    return percent(df["total_likes"] + df["total_comments"], df["views_30d"])
+@register("telegram", 1)
+def telegram_v1(df: pd.DataFrame) -> pd.Series:
+    avg_views = df["total_views"] / df["posts_count"].where(df["posts_count"] > 0)
+    return percent(avg_views.fillna(0.0), df["followers"])
+@register("dzen", 1)
+def dzen_v1(df: pd.DataFrame) -> pd.Series:
+    avg_engagement = (df["total_views"] + df["total_likes"]) / df["posts_count"].where(df["posts_count"] > 0)
+    return percent(avg_engagement.fillna(0.0), df["followers"])
+@register("wibes", 1)
+def wibes_v1(df: pd.DataFrame) -> pd.Series:
+    return percent(df["total_likes"], df["followers"])
+@register("pinterest", 1, {"impressions_30d": ("impressions_30d",), "engagements_30d": ("engagements_30d",)})
+def pinterest_v1(df: pd.DataFrame) -> pd.Series:
+    return percent(df["engagements_30d"], df["impressions_30d"])
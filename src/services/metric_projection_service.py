@@ -0,0 +1,82 @@
+from typing import Any, Dict, List, Optional, Sequence
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement
+from src.models.metric import Metric
+from src.services.extra_data_service import ExtraDataService
+KEY_FIELDS = ("id", "account_id", "collected_at")
+METRIC_FIELDS = (
+    "followers",
+    "posts_count",
+    "total_likes",
+    "total_comments",
+    "total_views",
+    "total_shares",
+    "engagement_rate",
+    "extra_data",
+)
+MAX_EXTRA_KEYS = 50
+class MetricProjectionService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    @staticmethod
+    def parse_list(value: Optional[str]) -> Optional[List[str]]:
+        if value is None:
+            return None
+        return list(dict.fromkeys(item.strip() for item in value.split(",") if item.strip()))
+    @staticmethod
+    def select_fields(fields: Optional[List[str]], extra_keys: Optional[List[str]]) -> List[str]:
+        if fields is None:
+            selected = list(METRIC_FIELDS)
+        else:
+            unknown = sorted(set(fields) - set(METRIC_FIELDS) - set(KEY_FIELDS))
+            if unknown:
+                raise ValueError(f"Unknown metric fields: {', '.join(unknown)}")
+            selected = [name for name in METRIC_FIELDS if name in fields]
+        if extra_keys is not None:
+            if len(extra_keys) > MAX_EXTRA_KEYS:
+                raise ValueError(f"At most {MAX_EXTRA_KEYS} extra_keys may be requested")
+            reserved = sorted(set(extra_keys) & {*KEY_FIELDS, *METRIC_FIELDS})
+            if reserved:
+                raise ValueError(f"extra_keys clash with metric fields: {', '.join(reserved)}")
+            selected = [name for name in selected if name != "extra_data"]
+        return selected
+    @staticmethod
+    def extra_heads(extra_keys: Optional[Sequence[str]]) -> List[str]:
+        return list(dict.fromkeys(key.split(".", 1)[0] for key in extra_keys or []))
+    @staticmethod
+    def extract(document: Optional[Dict[str, Any]], key: str) -> Any:
+        value: Any = document
+        for part in key.split("."):
+            if not isinstance(value, dict):
+                return None
+            value = value.get(part)
+        return value
+    @classmethod
+    def columns(cls, fields: Sequence[str], extra_keys: Optional[Sequence[str]]) -> List[ColumnElement]:
+        columns = [getattr(Metric, name) for name in (*KEY_FIELDS, *fields)]
+        columns.extend(Metric.extra_data[head].label(f"extra_{i}") for i, head in enumerate(cls.extra_heads(extra_keys)))
+        return columns
+    @classmethod
+    def to_item(cls, row: Sequence[Any], fields: Sequence[str], extra_keys: Optional[Sequence[str]]) -> Dict[str, Any]:
+        names = (*KEY_FIELDS, *fields)
+        item = dict(zip(names, row))
+        if extra_keys is not None:
+            values = row[len(names):]
+            item["extra_data"] = {head: value for head, value in zip(cls.extra_heads(extra_keys), values) if value is not None}
+        return item
+    @classmethod
+    def project_extra(cls, document: Optional[Dict[str, Any]], extra_keys: Sequence[str]) -> Dict[str, Any]:
+        values = {key: cls.extract(document, key) for key in extra_keys}
+        return {key: value for key, value in values.items() if value is not None}
+    async def serialize(
+        self,
+        rows: Sequence[Sequence[Any]],
+        fields: Sequence[str],
+        extra_keys: Optional[Sequence[str]]
+    ) -> List[Dict[str, Any]]:
+        items = [self.to_item(row, fields, extra_keys) for row in rows]
+        if items and "extra_data" in items[0]:
+            documents = await ExtraDataService(self.db).resolve_many([item["extra_data"] for item in items])
+            for item, document in zip(items, documents):
+                item["extra_data"] = document if extra_keys is None else self.project_extra(document, extra_keys)
+        return items
@@ -0,0 +1,137 @@
+import importlib.util
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+from uuid import UUID
+import logging
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from src.config.settings import get_settings
+from src.db.database import async_session_factory
+from src.services.metric_projection_service import KEY_FIELDS, MetricProjectionService
+logger = logging.getLogger(__name__)
+settings = get_settings()
+STREAM_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+ARROW_END_OF_STREAM = b"\xff\xff\xff\xff\x00\x00\x00\x00"
+ARROW_JSON_METADATA = {b"encoding": b"json"}
+ARROW_NUMBER_METADATA = {b"encoding": b"number"}
+def arrow_available() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+def json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+def encode_ndjson(items: Sequence[Dict[str, Any]]) -> bytes:
+    return "".join(
+        json.dumps(item, default=json_default, separators=(",", ":"), ensure_ascii=False) + "\n"
+        for item in items
+    ).encode("utf-8")
+def is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+def arrow_schema(fields: Sequence[str], extra_keys: Optional[Sequence[str]] = None, sample: Sequence[Dict[str, Any]] = ()):
+    import pyarrow as pa
+    types = {
+        "id": pa.string(),
+        "account_id": pa.string(),
+        "collected_at": pa.timestamp("us", tz="UTC"),
+        "followers": pa.int64(),
+        "posts_count": pa.int64(),
+        "total_likes": pa.int64(),
+        "total_comments": pa.int64(),
+        "total_views": pa.int64(),
+        "total_shares": pa.int64(),
+        "engagement_rate": pa.float64(),
+    }
+    schema = [pa.field(name, types[name]) for name in fields]
+    for key in extra_keys or []:
+        values = [item["extra_data"][key] for item in sample if key in item.get("extra_data", {})]
+        if values and all(is_number(value) for value in values):
+            schema.append(pa.field(key, pa.float64(), metadata=ARROW_NUMBER_METADATA))
+        else:
+            schema.append(pa.field(key, pa.string(), metadata=ARROW_JSON_METADATA))
+    return pa.schema(schema)
+def arrow_value(name: str, value: Any) -> Any:
+    if value is None:
+        return None
+    if name in ("id", "account_id"):
+        return str(value)
+    return value
+def arrow_extra_value(field, value: Any) -> Any:
+    if value is None:
+        return None
+    if field.metadata == ARROW_JSON_METADATA:
+        return json.dumps(value, default=json_default, separators=(",", ":"), ensure_ascii=False)
+    return float(value) if is_number(value) else None
+def encode_arrow_batch(schema, items: Sequence[Dict[str, Any]], extra_keys: Optional[Sequence[str]] = None) -> bytes:
+    import pyarrow as pa
+    extra = set(extra_keys or [])
+    columns = [
+        pa.array([
+            arrow_extra_value(field, item.get("extra_data", {}).get(field.name)) if field.name in extra
+            else arrow_value(field.name, item.get(field.name))
+            for item in items
+        ], type=field.type)
+        for field in schema
+    ]
+    return pa.RecordBatch.from_arrays(columns, schema=schema).serialize().to_pybytes()
+class MetricStreamService:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker = async_session_factory,
+        chunk_size: Optional[int] = None
+    ):
+        self.session_factory = session_factory
+        self.chunk_size = chunk_size or settings.metrics_stream_chunk_size
+    async def chunks(
+        self,
+        query: Select,
+        fields: Sequence[str],
+        extra_keys: Optional[Sequence[str]]
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        async with self.session_factory() as session:
+            projection = MetricProjectionService(session)
+            result = await session.stream(query.execution_options(yield_per=self.chunk_size))
+            sent = 0
+            async for partition in result.partitions(self.chunk_size):
+                items = await projection.serialize(partition, fields, extra_keys)
+                sent += len(items)
+                yield items
+            logger.info(f"Streamed {sent} metrics")
+    async def ndjson(
+        self,
+        query: Select,
+        fields: Sequence[str],
+        extra_keys: Optional[Sequence[str]]
+    ) -> AsyncIterator[bytes]:
+        async for items in self.chunks(query, fields, extra_keys):
+            yield encode_ndjson(items)
+    async def arrow(
+        self,
+        query: Select,
+        fields: Sequence[str],
+        extra_keys: Optional[Sequence[str]]
+    ) -> AsyncIterator[bytes]:
+        schema = None
+        async for items in self.chunks(query, fields, extra_keys):
+            if schema is None:
+                schema = arrow_schema([*KEY_FIELDS, *fields], extra_keys, items)
+                yield schema.serialize().to_pybytes()
+            yield encode_arrow_batch(schema, items, extra_keys)
+        if schema is None:
+            yield arrow_schema([*KEY_FIELDS, *fields], extra_keys).serialize().to_pybytes()
+        yield ARROW_END_OF_STREAM
+    def stream(
+        self,
+        format: str,
+        query: Select,
+        fields: Sequence[str],
+        extra_keys: Optional[Sequence[str]]
+    ) -> AsyncIterator[bytes]:
+        if format == "arrow":
+            return self.arrow(query, fields, extra_keys)
+        return self.ndjson(query, fields, extra_keys)
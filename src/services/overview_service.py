@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+import logging
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+logger = logging.getLogger(__name__)
+DEFAULT_SERIES_DAYS = 30
+LATEST_SQL = """
+SELECT account_id, followers, posts_count, engagement_rate, collected_at
+FROM account_latest_metrics
+"""
+LATEST_IN_RANGE_SQL = """
+SELECT account_id, followers, posts_count, engagement_rate, collected_at
+FROM (
+    SELECT
+        account_id,
+        followers_last AS followers,
+        posts_count_last AS posts_count,
+        engagement_rate_last AS engagement_rate,
+        last_collected_at AS collected_at,
+        row_number() OVER (PARTITION BY account_id ORDER BY bucket_start DESC) AS position
+    FROM metrics_rollup_day
+    WHERE bucket_start >= date_trunc('day', CAST(:start AS timestamptz) AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'
+      AND bucket_start <= :end
+) ranked
+WHERE position = 1
+"""
+PLATFORM_TOTALS_SQL = """
+WITH latest AS ({latest})
+SELECT
+    a.platform,
+    count(*) AS accounts,
+    count(*) FILTER (WHERE a.is_active) AS active_accounts,
+    count(l.account_id) AS accounts_with_data,
+    COALESCE(sum(l.followers), 0) AS followers,
+    COALESCE(sum(l.posts_count), 0) AS posts,
+    avg(l.engagement_rate)::double precision AS avg_engagement_rate,
+    max(l.collected_at) AS last_collected_at
+FROM accounts a
+LEFT JOIN latest l ON l.account_id = a.id
+GROUP BY a.platform
+ORDER BY a.platform
+"""
+ENGAGEMENT_SERIES_SQL = """
+SELECT
+    a.platform,
+    r.bucket_start,
+    (sum(r.engagement_rate_sum) / NULLIF(sum(r.engagement_rate_count), 0))::double precision AS engagement_rate
+FROM metrics_rollup_day r
+JOIN accounts a ON a.id = r.account_id
+WHERE r.bucket_start >= date_trunc('day', CAST(:start AS timestamptz) AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'
+  AND r.bucket_start <= :end
+GROUP BY a.platform, r.bucket_start
+HAVING sum(r.engagement_rate_count) > 0
+ORDER BY a.platform, r.bucket_start
+"""
+class OverviewService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    @staticmethod
+    def summarize(platforms: List[Dict[str, Any]]) -> Dict[str, Any]:
+        rates = [p["avg_engagement_rate"] for p in platforms if p["avg_engagement_rate"]]
+        return {
+            "total_accounts": sum(p["accounts"] for p in platforms),
+            "active_accounts": sum(p["active_accounts"] for p in platforms),
+            "total_followers": sum(p["followers"] for p in platforms),
+            "total_posts": sum(p["posts"] for p in platforms),
+            "avg_engagement_rate": sum(rates) / len(rates) if rates else 0.0,
+        }
+    async def get_platform_totals(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        if start is None and end is None:
+            sql, params = PLATFORM_TOTALS_SQL.format(latest=LATEST_SQL), {}
+        else:
+            sql = PLATFORM_TOTALS_SQL.format(latest=LATEST_IN_RANGE_SQL)
+            params = {
+                "start": start or datetime(1970, 1, 1, tzinfo=timezone.utc),
+                "end": end or datetime.now(timezone.utc),
+            }
+        result = await self.db.execute(text(sql), params)
+        return [dict(row._mapping) for row in result]
+    async def get_engagement_series(self, start: datetime, end: datetime) -> Dict[str, List[Dict[str, Any]]]:
+        result = await self.db.execute(text(ENGAGEMENT_SERIES_SQL), {"start": start, "end": end})
+        series: Dict[str, List[Dict[str, Any]]] = {}
+        for row in result:
+            series.setdefault(row.platform, []).append({
+                "bucket_start": row.bucket_start,
+                "engagement_rate": row.engagement_rate,
+            })
+        return series
+    async def get_overview(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        series_end = end or datetime.now(timezone.utc)
+        series_start = start or series_end - timedelta(days=DEFAULT_SERIES_DAYS)
+        platforms = await self.get_platform_totals(start, end)
+        engagement = await self.get_engagement_series(series_start, series_end)
+        logger.info(f"Built overview for {len(platforms)} platforms ({series_start:%Y-%m-%d} to {series_end:%Y-%m-%d})")
+        return {
+            "start": series_start,
+            "end": series_end,
+            **self.summarize(platforms),
+            "platforms": platforms,
+            "engagement": engagement,
+        }
@@ -0,0 +1,241 @@
+import io
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+import logging
+from sqlalchemy import Select, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.config.settings import get_settings
+from src.models.account import Account
+from src.models.metric import Metric
+from src.services.extra_data_service import ExtraDataService
+logger = logging.getLogger(__name__)
+settings = get_settings()
+EXTRA_PREFIX = "extra_data."
+MAX_EXTRA_DEPTH = 4
+MAX_EXTRA_COLUMNS = 500
+BASE_COLUMNS = (
+    "id",
+    "account_id",
+    "platform",
+    "collected_at",
+    "followers",
+    "posts_count",
+    "total_likes",
+    "total_comments",
+    "total_views",
+    "total_shares",
+    "engagement_rate",
+    "formula_version",
+)
+DISCOVER_EXTRA_COLUMNS_SQL = """
+WITH RECURSIVE leaves(path, value) AS (
+    SELECT ARRAY[e.key], e.value
+    FROM metrics m
+    JOIN accounts a ON a.id = m.account_id
+    CROSS JOIN LATERAL jsonb_each(
+        CASE WHEN jsonb_typeof(m.extra_data) = 'object' THEN resolve_extra_data(m.extra_data) ELSE '{}'::jsonb END
+    ) e
+    WHERE (CAST(:platform AS text) IS NULL OR a.platform = CAST(:platform AS text))
+      AND (CAST(:account_id AS uuid) IS NULL OR m.account_id = CAST(:account_id AS uuid))
+      AND (CAST(:start_date AS timestamptz) IS NULL OR m.collected_at >= CAST(:start_date AS timestamptz))
+      AND (CAST(:end_date AS timestamptz) IS NULL OR m.collected_at <= CAST(:end_date AS timestamptz))
+    UNION ALL
+    SELECT l.path || e.key, e.value
+    FROM leaves l
+    CROSS JOIN LATERAL jsonb_each(
+        CASE WHEN jsonb_typeof(l.value) = 'object' THEN l.value ELSE '{}'::jsonb END
+    ) e
+    WHERE cardinality(l.path) < :max_depth
+)
+SELECT
+    array_to_string(path, '.') AS name,
+    array_agg(DISTINCT jsonb_typeof(value)) AS kinds,
+    bool_and(CASE WHEN jsonb_typeof(value) = 'number' THEN (value #>> '{}')::numeric % 1 = 0 ELSE true END) AS integral,
+    count(*) AS occurrences
+FROM leaves
+WHERE jsonb_typeof(value) IN ('number', 'string', 'boolean')
+GROUP BY path
+ORDER BY occurrences DESC, name
+LIMIT :max_columns
+"""
+@dataclass(frozen=True)
+class ExportFilters:
+    platform: Optional[str] = None
+    account_id: Optional[UUID] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    def params(self) -> Dict[str, Any]:
+        return {
+            "platform": self.platform.lower() if self.platform else None,
+            "account_id": self.account_id,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+        }
+def extra_column_type(kinds: Sequence[str], integral: bool) -> str:
+    if set(kinds) == {"number"}:
+        return "int64" if integral else "float64"
+    if set(kinds) == {"boolean"}:
+        return "bool"
+    return "string"
+def flatten_extra_data(document: Any, prefix: str = "", depth: int = 1) -> Iterator[Tuple[str, Any]]:
+    if not isinstance(document, dict):
+        return
+    for key, value in document.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            if depth < MAX_EXTRA_DEPTH:
+                yield from flatten_extra_data(value, f"{name}.", depth + 1)
+        elif not isinstance(value, list):
+            yield name, value
+def coerce_value(kind: str, value: Any) -> Any:
+    if value is None:
+        return None
+    if kind == "string":
+        return value if isinstance(value, str) else json.dumps(value)
+    if kind == "int64":
+        return int(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+    if kind == "float64":
+        return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+    if kind == "bool":
+        return value if isinstance(value, bool) else None
+    return value
+def parquet_schema(extra_columns: Sequence[Tuple[str, str]]):
+    import pyarrow as pa
+    types = {
+        "id": pa.string(),
+        "account_id": pa.string(),
+        "platform": pa.string(),
+        "collected_at": pa.timestamp("us", tz="UTC"),
+        "followers": pa.int64(),
+        "posts_count": pa.int64(),
+        "total_likes": pa.int64(),
+        "total_comments": pa.int64(),
+        "total_views": pa.int64(),
+        "total_shares": pa.int64(),
+        "engagement_rate": pa.float64(),
+        "formula_version": pa.int16(),
+        "int64": pa.int64(),
+        "float64": pa.float64(),
+        "bool": pa.bool_(),
+        "string": pa.string(),
+    }
+    fields = [(name, types[name]) for name in BASE_COLUMNS]
+    fields.extend((f"{EXTRA_PREFIX}{name}", types[kind]) for name, kind in extra_columns)
+    return pa.schema(fields)
+class _ChunkSink(io.RawIOBase):
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.position = 0
+    def writable(self) -> bool:
+        return True
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self.chunks.append(chunk)
+        self.position += len(chunk)
+        return len(chunk)
+    def tell(self) -> int:
+        return self.position
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+class ParquetExportService:
+    def __init__(
+        self,
+        db: AsyncSession,
+        row_group_size: Optional[int] = None,
+        chunk_size: Optional[int] = None
+    ):
+        self.db = db
+        self.row_group_size = row_group_size or settings.export_row_group_size
+        self.chunk_size = chunk_size or settings.metrics_stream_chunk_size
+    async def discover_extra_columns(self, filters: ExportFilters) -> List[Tuple[str, str]]:
+        result = await self.db.execute(
+            text(DISCOVER_EXTRA_COLUMNS_SQL),
+            {**filters.params(), "max_depth": MAX_EXTRA_DEPTH, "max_columns": MAX_EXTRA_COLUMNS}
+        )
+        rows = result.all()
+        if len(rows) == MAX_EXTRA_COLUMNS:
+            logger.warning(f"extra_data export truncated to the {MAX_EXTRA_COLUMNS} most frequent keys")
+        return sorted((row.name, extra_column_type(row.kinds, row.integral)) for row in rows)
+    @staticmethod
+    def build_query(filters: ExportFilters) -> Select:
+        query = (
+            select(
+                Metric.id,
+                Metric.account_id,
+                Account.platform,
+                Metric.collected_at,
+                Metric.followers,
+                Metric.posts_count,
+                Metric.total_likes,
+                Metric.total_comments,
+                Metric.total_views,
+                Metric.total_shares,
+                Metric.engagement_rate,
+                Metric.formula_version,
+                Metric.extra_data,
+            )
+            .join(Account, Account.id == Metric.account_id)
+        )
+        if filters.platform:
+            query = query.where(Account.platform == filters.platform.lower())
+        if filters.account_id:
+            query = query.where(Metric.account_id == filters.account_id)
+        if filters.start_date:
+            query = query.where(Metric.collected_at >= filters.start_date)
+        if filters.end_date:
+            query = query.where(Metric.collected_at <= filters.end_date)
+        return query.order_by(Metric.collected_at, Metric.id)
+    @staticmethod
+    def to_table(schema, rows: Sequence[Any], documents: Sequence[Optional[dict]], extra_columns: Sequence[Tuple[str, str]]):
+        import pyarrow as pa
+        columns: Dict[str, List[Any]] = {name: [] for name in schema.names}
+        extra_kinds = dict(extra_columns)
+        for row, document in zip(rows, documents):
+            for name in BASE_COLUMNS:
+                value = getattr(row, name)
+                columns[name].append(str(value) if name in ("id", "account_id") else value)
+            flattened = dict(flatten_extra_data(document))
+            for name, kind in extra_kinds.items():
+                columns[f"{EXTRA_PREFIX}{name}"].append(coerce_value(kind, flattened.get(name)))
+        return pa.Table.from_pydict(columns, schema=schema)
+    async def iter_parquet(self, filters: ExportFilters) -> AsyncIterator[bytes]:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        extra_columns = await self.discover_extra_columns(filters)
+        schema = parquet_schema(extra_columns)
+        sink = _ChunkSink()
+        writer = pq.ParquetWriter(
+            sink,
+            schema,
+            compression="zstd",
+            write_statistics=True,
+            sorting_columns=[pq.SortingColumn(schema.get_field_index("collected_at"))],
+        )
+        resolver = ExtraDataService(self.db)
+        pending = []
+        pending_rows = 0
+        exported = 0
+        result = await self.db.stream(self.build_query(filters).execution_options(yield_per=self.chunk_size))
+        async for partition in result.partitions(self.chunk_size):
+            documents = await resolver.resolve_many([row.extra_data for row in partition])
+            pending.append(self.to_table(schema, partition, documents, extra_columns))
+            pending_rows += len(partition)
+            if pending_rows < self.row_group_size:
+                continue
+            table = pa.concat_tables(pending)
+            full = pending_rows - pending_rows % self.row_group_size
+            writer.write_table(table.slice(0, full), row_group_size=self.row_group_size)
+            exported += full
+            pending, pending_rows = [table.slice(full)], pending_rows - full
+            yield sink.drain()
+        if pending_rows:
+            writer.write_table(pa.concat_tables(pending), row_group_size=self.row_group_size)
+            exported += pending_rows
+        writer.close()
+        yield sink.drain()
+        logger.info(f"Exported {exported} metrics with {len(extra_columns)} extra_data columns to Parquet")
@@ -0,0 +1,119 @@
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+import logging
+import re
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.config.settings import get_settings
+from src.services.data_version_service import DataVersionService
+from src.services.response_cache import get_response_cache
+from src.services.retention_service import RetentionService
+logger = logging.getLogger(__name__)
+settings = get_settings()
+PARENT_TABLE = "metrics"
+DEFAULT_PARTITION = "metrics_default"
+PARTITION_PATTERN = re.compile(r"^metrics_y(\d{4})m(\d{2})$")
+INSERTABLE_COLUMNS_SQL = """
+SELECT string_agg(quote_ident(column_name), ', ' ORDER BY ordinal_position)
+FROM information_schema.columns
+WHERE table_schema = current_schema() AND table_name = :parent AND is_generated = 'NEVER'
+"""
+class PartitionService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    @staticmethod
+    def month_start(value: date) -> date:
+        return date(value.year, value.month, 1)
+    @staticmethod
+    def add_months(value: date, months: int) -> date:
+        index = value.year * 12 + value.month - 1 + months
+        return date(index // 12, index % 12 + 1, 1)
+    @staticmethod
+    def partition_name(month: date) -> str:
+        return f"{PARENT_TABLE}_y{month.year:04d}m{month.month:02d}"
+    @staticmethod
+    def parse_partition_name(name: str) -> Optional[date]:
+        match = PARTITION_PATTERN.match(name)
+        if not match:
+            return None
+        return date(int(match.group(1)), int(match.group(2)), 1)
+    @classmethod
+    def months_to_create(cls, today: date, months_ahead: int) -> List[date]:
+        start = cls.month_start(today)
+        return [cls.add_months(start, offset) for offset in range(months_ahead + 1)]
+    @classmethod
+    def expired_partitions(cls, partitions: List[str], cutoff: date) -> List[str]:
+        expired = []
+        for name in partitions:
+            month = cls.parse_partition_name(name)
+            if month is not None and cls.add_months(month, 1) <= cutoff:
+                expired.append(name)
+        return sorted(expired)
+    async def list_partitions(self) -> List[str]:
+        result = await self.db.execute(
+            text("""
+                SELECT child.relname
+                FROM pg_inherits
+                JOIN pg_class parent ON pg_inherits.inhparent = parent.oid
+                JOIN pg_class child ON pg_inherits.inhrelid = child.oid
+                WHERE parent.relname = :parent
+                ORDER BY child.relname
+            """),
+            {"parent": PARENT_TABLE}
+        )
+        return [row[0] for row in result.all()]
+    async def ensure_partitions(self, months_ahead: Optional[int] = None, today: Optional[date] = None) -> List[str]:
+        months_ahead = settings.metrics_partition_months_ahead if months_ahead is None else months_ahead
+        existing = set(await self.list_partitions())
+        created = []
+        for month in self.months_to_create(today or datetime.utcnow().date(), months_ahead):
+            name = self.partition_name(month)
+            if name in existing:
+                continue
+            await self._create_partition(name, month, DEFAULT_PARTITION in existing)
+            created.append(name)
+        await self.db.commit()
+        if created:
+            logger.info(f"Created metrics partitions: {', '.join(created)}")
+        return created
+    async def drop_expired(self, now: Optional[datetime] = None) -> List[str]:
+        if not settings.retention_enabled:
+            return []
+        now = now or datetime.now(timezone.utc)
+        cutoff = (now - timedelta(days=RetentionService.max_daily_days())).astimezone(timezone.utc).date()
+        expired = self.expired_partitions(await self.list_partitions(), cutoff)
+        for name in expired:
+            await self.db.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+            await self.db.execute(text(f"DROP TABLE {name}"))
+            await self.db.commit()
+            logger.info(f"Dropped expired metrics partition {name}")
+        if expired:
+            await DataVersionService(self.db).bump()
+            await self.db.commit()
+            await get_response_cache().invalidate_all()
+        return expired
+    async def _create_partition(self, name: str, month: date, has_default: bool) -> None:
+        lower, upper = self._bounds(month)
+        if not has_default:
+            await self.db.execute(
+                text(f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {PARENT_TABLE} FOR VALUES FROM ('{lower}') TO ('{upper}')")
+            )
+            return
+        columns = (await self.db.execute(text(INSERTABLE_COLUMNS_SQL), {"parent": PARENT_TABLE})).scalar_one()
+        await self.db.execute(text(f"CREATE TEMP TABLE {name}_moving (LIKE {DEFAULT_PARTITION}) ON COMMIT DROP"))
+        moved = await self.db.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE collected_at >= '{lower}' AND collected_at < '{upper}' RETURNING *) "
+                f"INSERT INTO {name}_moving SELECT * FROM moved"
+            )
+        )
+        await self.db.execute(
+            text(f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {PARENT_TABLE} FOR VALUES FROM ('{lower}') TO ('{upper}')")
+        )
+        if moved.rowcount:
+            await self.db.execute(text(f"INSERT INTO {PARENT_TABLE} ({columns}) SELECT {columns} FROM {name}_moving"))
+            logger.info(f"Moved {moved.rowcount} metrics from {DEFAULT_PARTITION} into {name}")
+    @classmethod
+    def _bounds(cls, month: date) -> Tuple[str, str]:
+        upper = cls.add_months(month, 1)
+        return f"{month.isoformat()} 00:00:00+00", f"{upper.isoformat()} 00:00:00+00"
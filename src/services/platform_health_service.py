@@ -0,0 +1,95 @@
+import asyncio
+import socket
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+import logging
+import aiohttp
+import httpx
+import requests
+from src.config.settings import get_settings
+from src.parsers.base import BaseParser
+logger = logging.getLogger(__name__)
+settings = get_settings()
+TRANSPORT_ERRORS = (
+    ConnectionError,
+    TimeoutError,
+    asyncio.TimeoutError,
+    socket.gaierror,
+    httpx.TransportError,
+    aiohttp.ClientConnectionError,
+    requests.ConnectionError,
+    requests.Timeout,
+)
+def is_transport_error(error: BaseException) -> bool:
+    return isinstance(error, TRANSPORT_ERRORS)
+@dataclass
+class PlatformHealth:
+    platform: str
+    available: bool
+    checked_at: datetime
+    consecutive_failures: int = 0
+    last_error: Optional[str] = None
+class PlatformHealthService:
+    def __init__(
+        self,
+        ttl_seconds: Optional[int] = None,
+        failure_threshold: Optional[int] = None
+    ):
+        self.ttl = timedelta(seconds=ttl_seconds if ttl_seconds is not None else settings.platform_health_ttl_seconds)
+        self.failure_threshold = failure_threshold or settings.platform_failure_threshold
+        self._states: Dict[str, PlatformHealth] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+    def get_state(self, platform: str) -> Optional[PlatformHealth]:
+        return self._states.get(platform.lower())
+    def get_all(self) -> List[PlatformHealth]:
+        return sorted(self._states.values(), key=lambda s: s.platform)
+    def is_fresh(self, state: PlatformHealth, now: Optional[datetime] = None) -> bool:
+        now = now or datetime.utcnow()
+        return now - state.checked_at < self.ttl
+    async def ensure_available(self, platform: str, parser: BaseParser) -> bool:
+        platform = platform.lower()
+        lock = self._locks.setdefault(platform, asyncio.Lock())
+        async with lock:
+            state = self._states.get(platform)
+            if state and self.is_fresh(state):
+                return state.available
+            available = await parser.is_available()
+            self._states[platform] = PlatformHealth(
+                platform=platform,
+                available=available,
+                checked_at=datetime.utcnow(),
+                consecutive_failures=0 if available else self.failure_threshold,
+                last_error=None if available else "Availability probe failed",
+            )
+            logger.info(f"Probed {platform} availability: {'up' if available else 'down'}")
+            return available
+    def record_success(self, platform: str) -> None:
+        platform = platform.lower()
+        self._states[platform] = PlatformHealth(
+            platform=platform,
+            available=True,
+            checked_at=datetime.utcnow(),
+        )
+    def record_failure(self, platform: str, error: Optional[str] = None) -> None:
+        platform = platform.lower()
+        state = self._states.get(platform)
+        failures = (state.consecutive_failures if state else 0) + 1
+        available = failures < self.failure_threshold
+        self._states[platform] = PlatformHealth(
+            platform=platform,
+            available=available,
+            checked_at=datetime.utcnow() if not available or not state else state.checked_at,
+            consecutive_failures=failures,
+            last_error=error,
+        )
+        if not available:
+            logger.warning(
+                f"Platform {platform} marked unavailable after {failures} consecutive failures"
+            )
+    def reset(self, platform: Optional[str] = None) -> None:
+        if platform:
+            self._states.pop(platform.lower(), None)
+        else:
+            self._states.clear()
+platform_health = PlatformHealthService()
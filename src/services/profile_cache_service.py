@@ -0,0 +1,109 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Optional, Tuple
+from uuid import UUID
+import logging
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.config.settings import get_settings
+from src.models.account_profile_attribute import AccountProfileAttribute
+logger = logging.getLogger(__name__)
+settings = get_settings()
+class ProfileCacheService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    @staticmethod
+    def refresh_intervals() -> Dict[str, timedelta]:
+        return {
+            "profile": timedelta(hours=settings.profile_refresh_hours),
+            "audience": timedelta(hours=settings.audience_refresh_hours),
+        }
+    @staticmethod
+    def compute_fresh_groups(
+        slow_fields: Dict[str, str],
+        cached: Iterable[Tuple[str, datetime]],
+        now: Optional[datetime] = None
+    ) -> set[str]:
+        now = now or datetime.utcnow()
+        intervals = ProfileCacheService.refresh_intervals()
+        refreshed = {field: refreshed_at for field, refreshed_at in cached}
+        fresh = set()
+        for group in set(slow_fields.values()):
+            interval = intervals.get(group)
+            if interval is None:
+                continue
+            fields = [f for f, g in slow_fields.items() if g == group]
+            timestamps = [refreshed.get(f) for f in fields]
+            if any(ts is None for ts in timestamps):
+                continue
+            oldest = min(ts.replace(tzinfo=None) for ts in timestamps)
+            if now - oldest < interval:
+                fresh.add(group)
+        return fresh
+    @staticmethod
+    def split_slow_fields(
+        slow_fields: Dict[str, str],
+        extra_data: Optional[dict],
+        fresh_groups: set[str]
+    ) -> Dict[str, Any]:
+        if not extra_data:
+            return {}
+        refreshed = {}
+        for field, group in slow_fields.items():
+            if field not in extra_data:
+                continue
+            value = extra_data.pop(field)
+            if group not in fresh_groups:
+                refreshed[field] = value
+        return refreshed
+    async def get_fresh_groups(self, account_id: UUID, slow_fields: Dict[str, str]) -> set[str]:
+        if not slow_fields:
+            return set()
+        result = await self.db.execute(
+            select(AccountProfileAttribute.field, AccountProfileAttribute.refreshed_at)
+            .where(AccountProfileAttribute.account_id == account_id)
+        )
+        fresh = self.compute_fresh_groups(slow_fields, result.all())
+        if fresh:
+            logger.debug(f"Profile groups served from cache for {account_id}: {sorted(fresh)}")
+        return fresh
+    async def store(
+        self,
+        account_id: UUID,
+        slow_fields: Dict[str, str],
+        extra_data: Optional[dict],
+        fresh_groups: set[str]
+    ) -> int:
+        refreshed = self.split_slow_fields(slow_fields, extra_data, fresh_groups)
+        if not refreshed:
+            return 0
+        now = datetime.utcnow()
+        stmt = insert(AccountProfileAttribute).values([
+            {
+                "account_id": account_id,
+                "field": field,
+                "refresh_group": slow_fields[field],
+                "value": value,
+                "refreshed_at": now,
+            }
+            for field, value in refreshed.items()
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[AccountProfileAttribute.account_id, AccountProfileAttribute.field],
+            set_={
+                "refresh_group": stmt.excluded.refresh_group,
+                "value": stmt.excluded.value,
+                "refreshed_at": stmt.excluded.refreshed_at,
+                "updated_at": now,
+            }
+        )
+        await self.db.execute(stmt)
+        logger.debug(f"Refreshed {len(refreshed)} profile fields for {account_id}")
+        return len(refreshed)
+    async def get_profile(self, account_id: UUID) -> list[AccountProfileAttribute]:
+        result = await self.db.execute(
+            select(AccountProfileAttribute)
+            .where(AccountProfileAttribute.account_id == account_id)
+            .order_by(AccountProfileAttribute.field)
+        )
+        return list(result.scalars().all())
@@ -0,0 +1,74 @@
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+import hashlib
+import logging
+import zlib
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.config.settings import get_settings
+from src.models.raw_payload import RawPayload
+from src.parsers.base import BaseParser
+logger = logging.getLogger(__name__)
+settings = get_settings()
+class RawPayloadService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    @staticmethod
+    def should_archive(platform: str, parser: BaseParser) -> bool:
+        return (
+            settings.raw_archive_enabled
+            and bool(parser.ARCHIVE_KINDS)
+            and platform.lower() in settings.raw_archive_platforms
+        )
+    @staticmethod
+    def compress(content: bytes) -> bytes:
+        return zlib.compress(content, 6)
+    @staticmethod
+    def decompress(payload: bytes) -> bytes:
+        return zlib.decompress(payload)
+    async def store(
+        self,
+        account_id: UUID,
+        log_id: Optional[UUID],
+        metric_id: UUID,
+        collected_at: datetime,
+        payloads: Dict[str, Tuple[str, bytes]]
+    ) -> int:
+        if not payloads:
+            return 0
+        rows = [
+            {
+                "account_id": account_id,
+                "log_id": log_id,
+                "metric_id": metric_id,
+                "collected_at": collected_at,
+                "kind": kind,
+                "content_type": content_type,
+                "sha256": hashlib.sha256(content).hexdigest(),
+                "size_bytes": len(content),
+                "payload": self.compress(content),
+            }
+            for kind, (content_type, content) in payloads.items()
+        ]
+        stmt = insert(RawPayload).values(rows)
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                constraint="uq_raw_payloads_metric_kind",
+                set_={
+                    "content_type": stmt.excluded.content_type,
+                    "sha256": stmt.excluded.sha256,
+                    "size_bytes": stmt.excluded.size_bytes,
+                    "payload": stmt.excluded.payload,
+                }
+            )
+        )
+        stored = sum(len(row["payload"]) for row in rows)
+        logger.debug(f"Archived {len(rows)} raw payloads for {account_id} ({stored} bytes compressed)")
+        return len(rows)
+    async def get_payloads(self, metric_id: UUID) -> Dict[str, bytes]:
+        result = await self.db.execute(
+            select(RawPayload.kind, RawPayload.payload).where(RawPayload.metric_id == metric_id)
+        )
+        return {kind: self.decompress(payload) for kind, payload in result.all()}
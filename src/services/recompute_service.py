@@ -0,0 +1,158 @@
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+import asyncio
+import logging
+from sqlalchemy import DateTime, Float, column, or_, select, tuple_, update, values
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.config.settings import get_settings
+from src.db.repository import BaseRepository
+from src.models.account import Account
+from src.models.account_latest_metric import AccountLatestMetric
+from src.models.metric import Metric
+from src.models.recompute_job import RecomputeJob
+from src.services.data_version_service import DataVersionService
+from src.services.extra_data_service import ExtraDataService
+from src.services.metric_formulas import BASE_COLUMNS, get_formula
+from src.services.rollup_service import RollupService
+from src.services.response_cache import get_response_cache
+from src.services.retention_service import RetentionService
+logger = logging.getLogger(__name__)
+settings = get_settings()
+def compute_chunk(platform: str, version: int, rows: List[Dict[str, Any]]) -> List[Tuple[UUID, datetime, float]]:
+    formula = get_formula(platform, version)
+    rates = formula.apply(rows)
+    return [(row["id"], row["collected_at"], rate) for row, rate in zip(rows, rates)]
+class RecomputeService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.job_repo = BaseRepository(RecomputeJob, db)
+        self.extra_data = ExtraDataService(db)
+        self.rollups = RollupService(db)
+    async def create_job(self, platform: str, version: Optional[int] = None, since: Optional[datetime] = None) -> RecomputeJob:
+        formula = get_formula(platform, version)
+        if not formula:
+            raise ValueError(f"No engagement formula registered for {platform} (version {version or 'latest'})")
+        job = await self.job_repo.create(
+            platform=formula.platform,
+            formula_version=formula.version,
+            status="pending",
+            since=since,
+        )
+        await self.db.commit()
+        return job
+    async def run(self, job_id: UUID, workers: Optional[int] = None, chunk_size: Optional[int] = None) -> RecomputeJob:
+        job = await self.job_repo.get(job_id)
+        if not job:
+            raise ValueError(f"Recompute job {job_id} not found")
+        if job.status == "completed":
+            return job
+        formula = get_formula(job.platform, job.formula_version)
+        chunk_size = chunk_size or settings.recompute_chunk_size
+        workers = workers or settings.recompute_workers
+        await self.job_repo.update(job.id, status="running", started_at=datetime.utcnow(), error_message=None)
+        await self.db.commit()
+        cursor = (job.cursor_collected_at, job.cursor_metric_id) if job.cursor_metric_id else None
+        processed = job.rows_processed
+        loop = asyncio.get_running_loop()
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                while True:
+                    chunks = []
+                    for _ in range(workers):
+                        rows = await self._fetch_chunk(job, formula.extra_fields, cursor, chunk_size)
+                        if not rows:
+                            break
+                        chunks.append(rows)
+                        cursor = (rows[-1]["collected_at"], rows[-1]["id"])
+                    if not chunks:
+                        break
+                    results = await asyncio.gather(*[
+                        loop.run_in_executor(pool, compute_chunk, job.platform, job.formula_version, rows)
+                        for rows in chunks
+                    ])
+                    for result in results:
+                        await self._write_results(result, job.formula_version)
+                    processed += sum(len(rows) for rows in chunks)
+                    await self.job_repo.update(
+                        job.id,
+                        cursor_collected_at=cursor[0],
+                        cursor_metric_id=cursor[1],
+                        rows_processed=processed,
+                    )
+                    await self.db.commit()
+                    logger.info(f"Recompute {job.platform} v{job.formula_version}: {processed} snapshots up to {cursor[0]}")
+            await self._rebuild_rollups(job)
+            await self.job_repo.update(job.id, status="completed", finished_at=datetime.utcnow())
+            await DataVersionService(self.db).bump()
+            await self.db.commit()
+            await get_response_cache().invalidate_all()
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Recompute job {job.id} failed: {e}", exc_info=True)
+            await self.job_repo.update(job.id, status="failed", error_message=str(e))
+            await self.db.commit()
+            raise
+        return await self.job_repo.get(job.id)
+    async def _fetch_chunk(
+        self,
+        job: RecomputeJob,
+        extra_fields: Dict[str, Tuple[str, ...]],
+        cursor: Optional[Tuple[datetime, UUID]],
+        chunk_size: int
+    ) -> List[Dict[str, Any]]:
+        columns = [Metric.id, Metric.collected_at] + [getattr(Metric, name) for name in BASE_COLUMNS]
+        if extra_fields:
+            columns.append(Metric.extra_data)
+        query = (
+            select(*columns)
+            .join(Account, Account.id == Metric.account_id)
+            .where(Account.platform == job.platform)
+            .order_by(Metric.collected_at, Metric.id)
+            .limit(chunk_size)
+        )
+        if job.since:
+            query = query.where(Metric.collected_at >= job.since)
+        if cursor:
+            query = query.where(tuple_(Metric.collected_at, Metric.id) > cursor)
+        rows = [dict(row._mapping) for row in (await self.db.execute(query)).all()]
+        if extra_fields and rows:
+            documents = await self.extra_data.resolve_many([row["extra_data"] for row in rows])
+            for row, document in zip(rows, documents):
+                row["extra_data"] = {
+                    key: document.get(key)
+                    for key in {path[0] for path in extra_fields.values()}
+                } if document else None
+        return rows
+    async def _write_results(self, results: List[Tuple[UUID, datetime, float]], version: int) -> None:
+        if not results:
+            return
+        batch = values(
+            column("id", PGUUID(as_uuid=True)),
+            column("collected_at", DateTime(timezone=True)),
+            column("engagement_rate", Float),
+            name="recomputed",
+        ).data(results)
+        await self.db.execute(
+            update(Metric)
+            .where(Metric.id == batch.c.id, Metric.collected_at == batch.c.collected_at)
+            .where(or_(
+                Metric.engagement_rate.is_distinct_from(batch.c.engagement_rate),
+                Metric.formula_version.is_distinct_from(version),
+            ))
+            .values(engagement_rate=batch.c.engagement_rate, formula_version=version)
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.execute(
+            update(AccountLatestMetric)
+            .where(AccountLatestMetric.metric_id == batch.c.id)
+            .values(engagement_rate=batch.c.engagement_rate)
+            .execution_options(synchronize_session=False)
+        )
+    async def _rebuild_rollups(self, job: RecomputeJob) -> None:
+        not_before = RetentionService.raw_cutoff(job.platform)
+        result = await self.db.execute(select(Account.id).where(Account.platform == job.platform))
+        for account_id in result.scalars().all():
+            await self.rollups.rebuild(account_id=account_id, since=job.since, not_before=not_before)
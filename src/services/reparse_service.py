@@ -0,0 +1,165 @@
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+import asyncio
+import logging
+import zlib
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.config.settings import get_settings
+from src.models.account import Account
+from src.models.account_latest_metric import AccountLatestMetric
+from src.models.metric import Metric
+from src.models.raw_payload import RawPayload
+from src.parsers import ParserFactory
+from src.services.data_version_service import DataVersionService
+from src.services.extra_data_service import ExtraDataService
+from src.services.metric_formulas import BASE_COLUMNS, evaluate as evaluate_formula
+from src.services.rollup_service import RollupService
+from src.services.response_cache import get_response_cache
+from src.services.retention_service import RetentionService
+logger = logging.getLogger(__name__)
+settings = get_settings()
+METRIC_FIELDS = (
+    "followers",
+    "posts_count",
+    "total_likes",
+    "total_comments",
+    "total_views",
+    "total_shares",
+    "engagement_rate",
+    "extra_data",
+)
+Snapshot = Tuple[UUID, datetime, Dict[str, bytes]]
+def reparse_snapshots(platform: str, account_id: str, account_url: str, snapshots: List[Snapshot]) -> List[Dict[str, Any]]:
+    return asyncio.run(_reparse_snapshots(platform, account_id, account_url, snapshots))
+async def _reparse_snapshots(platform: str, account_id: str, account_url: str, snapshots: List[Snapshot]) -> List[Dict[str, Any]]:
+    parser = ParserFactory.create(platform, account_id, account_url)
+    results = []
+    try:
+        for metric_id, collected_at, payloads in snapshots:
+            try:
+                metrics = await parser.parse_archived(
+                    {kind: zlib.decompress(payload) for kind, payload in payloads.items()},
+                    collected_at
+                )
+            except Exception as e:
+                logger.warning(f"Re-parse failed for {platform}:{account_id} at {collected_at}: {e}")
+                continue
+            results.append({
+                "metric_id": metric_id,
+                "collected_at": collected_at,
+                **{field: getattr(metrics, field) for field in METRIC_FIELDS},
+            })
+    finally:
+        if hasattr(parser, 'close'):
+            await parser.close()
+    return results
+class ReparseService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.extra_data = ExtraDataService(db)
+        self.rollups = RollupService(db)
+    async def run(
+        self,
+        platform: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        workers: Optional[int] = None,
+        batch_size: int = 50,
+        dry_run: bool = False
+    ) -> Dict[str, int]:
+        parser = ParserFactory.create(platform, "", "")
+        if not parser.ARCHIVE_KINDS:
+            raise ValueError(f"Platform {platform} does not archive raw payloads")
+        accounts = await self._get_accounts(platform)
+        stats = {"snapshots": 0, "reparsed": 0, "failed": 0}
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=workers or settings.reparse_workers) as pool:
+            for account in accounts:
+                pending = []
+                async for snapshots in self._iter_snapshots(account.id, since, until, batch_size):
+                    stats["snapshots"] += len(snapshots)
+                    pending.append(loop.run_in_executor(
+                        pool,
+                        reparse_snapshots,
+                        platform,
+                        account.account_id,
+                        account.account_url,
+                        snapshots
+                    ))
+                if not pending:
+                    continue
+                results = [row for batch in await asyncio.gather(*pending) for row in batch]
+                stats["reparsed"] += len(results)
+                if dry_run or not results:
+                    continue
+                await self._apply(platform, results)
+                await DataVersionService(self.db).bump(account.id)
+                await self.db.commit()
+                await self.rollups.rebuild(
+                    account_id=account.id,
+                    since=min(row["collected_at"] for row in results),
+                    not_before=RetentionService.raw_cutoff(platform)
+                )
+                await get_response_cache().bump(account.id)
+                logger.info(f"Rewrote {len(results)} snapshots for {platform}:{account.account_id}")
+        stats["failed"] = stats["snapshots"] - stats["reparsed"]
+        return stats
+    async def _get_accounts(self, platform: str) -> List[Account]:
+        result = await self.db.execute(
+            select(Account).where(Account.platform == platform).order_by(Account.display_name)
+        )
+        return list(result.scalars().all())
+    async def _iter_snapshots(
+        self,
+        account_id: UUID,
+        since: Optional[datetime],
+        until: Optional[datetime],
+        batch_size: int
+    ):
+        query = (
+            select(RawPayload.metric_id, RawPayload.collected_at, RawPayload.kind, RawPayload.payload)
+            .where(RawPayload.account_id == account_id)
+            .order_by(RawPayload.collected_at, RawPayload.metric_id)
+        )
+        if since:
+            query = query.where(RawPayload.collected_at >= since)
+        if until:
+            query = query.where(RawPayload.collected_at < until)
+        snapshots: Dict[UUID, Snapshot] = {}
+        result = await self.db.stream(query)
+        async for metric_id, collected_at, kind, payload in result:
+            if metric_id not in snapshots and len(snapshots) >= batch_size:
+                yield list(snapshots.values())
+                snapshots = {}
+            snapshots.setdefault(metric_id, (metric_id, collected_at, {}))[2][kind] = payload
+        if snapshots:
+            yield list(snapshots.values())
+    @staticmethod
+    def apply_formula(platform: str, row: Dict[str, Any]) -> Dict[str, Any]:
+        values = {field: row[field] for field in METRIC_FIELDS}
+        values["formula_version"] = None
+        evaluated = evaluate_formula(platform, {
+            **{column: row[column] for column in BASE_COLUMNS},
+            "extra_data": row["extra_data"],
+        })
+        if evaluated:
+            values["engagement_rate"], values["formula_version"] = evaluated
+        return values
+    async def _apply(self, platform: str, results: List[Dict[str, Any]]) -> None:
+        for row in results:
+            values = self.apply_formula(platform, row)
+            latest = {field: values[field] for field in METRIC_FIELDS}
+            values["extra_data"] = await self.extra_data.prepare_for_storage(row["extra_data"])
+            await self.db.execute(
+                update(Metric)
+                .where(Metric.id == row["metric_id"], Metric.collected_at == row["collected_at"])
+                .values(**values)
+            )
+            await self.db.execute(
+                update(AccountLatestMetric)
+                .where(AccountLatestMetric.metric_id == row["metric_id"])
+                .values(**latest)
+            )
@@ -0,0 +1,152 @@
+import functools
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from uuid import UUID
+import logging
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.config.settings import get_settings
+from src.services.data_version_service import GLOBAL_SCOPE, DataVersionService
+logger = logging.getLogger(__name__)
+settings = get_settings()
+EPOCH_SCOPE = "epoch"
+KEY_PREFIX = "response-cache"
+class MemoryCacheBackend:
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.versions: Dict[str, int] = {}
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self.entries[key]
+            return None
+        self.entries.move_to_end(key)
+        return value
+    async def set(self, key: str, value: Any) -> None:
+        self.entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+    async def version(self, scope: str) -> int:
+        return self.versions.get(scope, 0)
+    async def bump(self, scope: str) -> None:
+        self.versions[scope] = self.versions.get(scope, 0) + 1
+class RedisCacheBackend:
+    def __init__(self, url: str, ttl_seconds: int):
+        import redis.asyncio as redis
+        self.client = redis.from_url(url)
+        self.ttl_seconds = ttl_seconds
+    async def get(self, key: str) -> Optional[Any]:
+        raw = await self.client.get(f"{KEY_PREFIX}:entry:{key}")
+        return json.loads(raw) if raw is not None else None
+    async def set(self, key: str, value: Any) -> None:
+        await self.client.set(f"{KEY_PREFIX}:entry:{key}", json.dumps(value), ex=self.ttl_seconds)
+    async def version(self, scope: str) -> int:
+        raw = await self.client.get(f"{KEY_PREFIX}:version:{scope}")
+        return int(raw) if raw is not None else 0
+    async def bump(self, scope: str) -> None:
+        await self.client.incr(f"{KEY_PREFIX}:version:{scope}")
+class ResponseCache:
+    def __init__(self, backend: Optional[Any]):
+        self.backend = backend
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+    @staticmethod
+    def scope_for(account_id: Any) -> str:
+        if isinstance(account_id, (UUID, str)) and account_id:
+            return str(account_id)
+        return GLOBAL_SCOPE
+    @staticmethod
+    def account_uuid(account_id: Any) -> Optional[UUID]:
+        if isinstance(account_id, UUID):
+            return account_id
+        if not isinstance(account_id, str) or not account_id:
+            return None
+        try:
+            return UUID(account_id)
+        except ValueError:
+            return None
+    @staticmethod
+    def params_digest(params: Dict[str, Any]) -> str:
+        payload = json.dumps(jsonable_encoder(params), sort_keys=True, default=str)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+    async def key(self, route: str, params: Dict[str, Any], scope: str, data_version: str = "") -> str:
+        epoch = await self.backend.version(EPOCH_SCOPE)
+        version = await self.backend.version(scope)
+        data_digest = hashlib.sha1(data_version.encode("utf-8")).hexdigest()[:16]
+        return f"{route}:{self.params_digest(params)}:{epoch}.{scope}.{version}.{data_digest}"
+    async def get(self, key: str) -> Optional[Any]:
+        return await self.backend.get(key)
+    async def set(self, key: str, value: Any) -> None:
+        await self.backend.set(key, value)
+    async def bump(self, account_id: Any) -> None:
+        if not self.enabled:
+            return
+        try:
+            await self.backend.bump(self.scope_for(account_id))
+            await self.backend.bump(GLOBAL_SCOPE)
+        except Exception as e:
+            logger.warning(f"Failed to bump response cache version for {account_id}: {e}")
+    async def invalidate_all(self) -> None:
+        if not self.enabled:
+            return
+        try:
+            await self.backend.bump(EPOCH_SCOPE)
+        except Exception as e:
+            logger.warning(f"Failed to invalidate response cache: {e}")
+@lru_cache()
+def get_response_cache() -> ResponseCache:
+    if settings.response_cache_backend == "off":
+        return ResponseCache(None)
+    if settings.response_cache_backend == "redis":
+        if not settings.redis_url:
+            logger.warning("response_cache_backend is redis but redis_url is not set, using the in-process cache")
+        else:
+            try:
+                return ResponseCache(RedisCacheBackend(settings.redis_url, settings.response_cache_ttl_seconds))
+            except ImportError:
+                logger.warning("redis package is not installed, using the in-process cache")
+    return ResponseCache(MemoryCacheBackend(settings.response_cache_max_entries, settings.response_cache_ttl_seconds))
+def cached_response(account_param: str = "account_id") -> Callable:
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        route = f"{func.__module__}.{func.__qualname__}"
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            cache = get_response_cache()
+            if not cache.enabled:
+                return await func(*args, **kwargs)
+            params = {
+                name: value for name, value in kwargs.items()
+                if not isinstance(value, (AsyncSession, Request, Response))
+            }
+            db = next((value for value in kwargs.values() if isinstance(value, AsyncSession)), None)
+            account_id = kwargs.get(account_param)
+            try:
+                data_version = await DataVersionService(db).version(cache.account_uuid(account_id)) if db is not None else ""
+                key = await cache.key(route, params, cache.scope_for(account_id), data_version)
+                cached = await cache.get(key)
+            except Exception as e:
+                logger.warning(f"Response cache unavailable for {route}: {e}")
+                return await func(*args, **kwargs)
+            if cached is not None:
+                logger.debug(f"Response cache hit for {route}")
+                return cached
+            result = await func(*args, **kwargs)
+            try:
+                await cache.set(key, jsonable_encoder(result))
+            except Exception as e:
+                logger.warning(f"Failed to store response for {route}: {e}")
+            return result
+        return wrapper
+    return decorator
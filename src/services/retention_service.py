@@ -0,0 +1,174 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+import logging
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.config.settings import get_settings
+from src.models.retention_watermark import RetentionWatermark
+from src.services.data_version_service import DataVersionService
+from src.services.response_cache import get_response_cache
+logger = logging.getLogger(__name__)
+settings = get_settings()
+TABLE_TIME_COLUMNS = {
+    "instagram_story_snapshots": "collected_at",
+    "metrics_rollup_hour": "bucket_start",
+    "metrics_rollup_day": "bucket_start",
+    "content_item_stats": "collected_at",
+    "raw_payloads": "collected_at",
+}
+@dataclass
+class RetentionPolicy:
+    raw_days: int
+    daily_days: int
+class RetentionService:
+    def __init__(self, db: AsyncSession, batch_size: Optional[int] = None):
+        self.db = db
+        self.batch_size = batch_size or settings.retention_batch_size
+    @staticmethod
+    def policy_for(platform: str) -> RetentionPolicy:
+        override = settings.retention_platform_overrides.get(platform.lower(), {})
+        return RetentionPolicy(
+            raw_days=override.get("raw_days", settings.retention_raw_days),
+            daily_days=override.get("daily_days", settings.retention_daily_days),
+        )
+    @classmethod
+    def raw_cutoff(cls, platform: str, now: Optional[datetime] = None) -> Optional[datetime]:
+        if not settings.retention_enabled:
+            return None
+        cutoff = (now or datetime.now(timezone.utc)) - timedelta(days=cls.policy_for(platform).raw_days)
+        return cutoff.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    @staticmethod
+    def max_daily_days() -> int:
+        overrides = [override.get("daily_days", 0) for override in settings.retention_platform_overrides.values()]
+        return max([settings.retention_daily_days, *overrides])
+    @staticmethod
+    def day_windows(start: datetime, end: datetime) -> Iterator[Tuple[datetime, datetime]]:
+        day = start.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        while day + timedelta(days=1) <= end:
+            yield day, day + timedelta(days=1)
+            day += timedelta(days=1)
+    async def run(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        now = now or datetime.now(timezone.utc)
+        stats: Dict[str, int] = {}
+        for platform in await self._platforms():
+            policy = self.policy_for(platform)
+            stats[f"metrics_downsampled:{platform}"] = await self.downsample_metrics(platform, policy, now)
+            stats[f"metrics_purged:{platform}"] = await self.purge_metrics(platform, policy, now)
+        for table, days in settings.retention_table_days.items():
+            if table not in TABLE_TIME_COLUMNS:
+                logger.warning(f"Retention configured for unknown table {table}, skipping")
+                continue
+            stats[f"{table}_purged"] = await self.purge_table(table, now - timedelta(days=days))
+        if any(stats.values()):
+            await DataVersionService(self.db).bump()
+            await self.db.commit()
+            await get_response_cache().invalidate_all()
+        logger.info(f"Retention run completed: {stats}")
+        return stats
+    async def downsample_metrics(self, platform: str, policy: RetentionPolicy, now: datetime) -> int:
+        key = f"metrics_daily:{platform}"
+        raw_cutoff = now - timedelta(days=policy.raw_days)
+        daily_cutoff = now - timedelta(days=policy.daily_days)
+        start = await self._get_watermark(key) or await self._oldest_metric(platform)
+        if start is None:
+            return 0
+        start = max(start, daily_cutoff)
+        removed = 0
+        for day_start, day_end in self.day_windows(start, raw_cutoff):
+            params = {"platform": platform, "start": day_start, "end": day_end}
+            removed += await self._delete_in_batches(
+                """
+                DELETE FROM metrics WHERE (id, collected_at) IN (
+                    SELECT id, collected_at FROM (
+                        SELECT m.id, m.collected_at, row_number() OVER (
+                            PARTITION BY m.account_id ORDER BY m.collected_at DESC
+                        ) AS rn
+                        FROM metrics m JOIN accounts a ON a.id = m.account_id
+                        WHERE a.platform = :platform
+                          AND m.collected_at >= :start AND m.collected_at < :end
+                    ) ranked
+                    WHERE rn > 1
+                    LIMIT :batch_size
+                )
+                """,
+                params
+            )
+            if settings.retention_heavy_keys:
+                await self.db.execute(
+                    text("""
+                        UPDATE metrics m SET extra_data = m.extra_data - CAST(:keys AS text[])
+                        FROM accounts a
+                        WHERE a.id = m.account_id AND a.platform = :platform
+                          AND m.collected_at >= :start AND m.collected_at < :end
+                          AND jsonb_exists_any(m.extra_data, CAST(:keys AS text[]))
+                    """),
+                    {**params, "keys": list(settings.retention_heavy_keys)}
+                )
+            await self._set_watermark(key, day_end)
+            await self.db.commit()
+        if removed:
+            logger.info(f"Downsampled {platform} metrics to daily snapshots, removed {removed} rows")
+        return removed
+    async def purge_metrics(self, platform: str, policy: RetentionPolicy, now: datetime) -> int:
+        removed = await self._delete_in_batches(
+            """
+            DELETE FROM metrics WHERE (id, collected_at) IN (
+                SELECT m.id, m.collected_at
+                FROM metrics m JOIN accounts a ON a.id = m.account_id
+                WHERE a.platform = :platform AND m.collected_at < :cutoff
+                LIMIT :batch_size
+            )
+            """,
+            {"platform": platform, "cutoff": now - timedelta(days=policy.daily_days)}
+        )
+        if removed:
+            logger.info(f"Purged {removed} {platform} metrics older than {policy.daily_days} days")
+        return removed
+    async def purge_table(self, table: str, cutoff: datetime) -> int:
+        column = TABLE_TIME_COLUMNS[table]
+        removed = await self._delete_in_batches(
+            f"""
+            DELETE FROM {table} WHERE ctid IN (
+                SELECT ctid FROM {table} WHERE {column} < :cutoff LIMIT :batch_size
+            )
+            """,
+            {"cutoff": cutoff}
+        )
+        if removed:
+            logger.info(f"Purged {removed} rows from {table} older than {cutoff.isoformat()}")
+        return removed
+    async def _delete_in_batches(self, sql: str, params: Dict) -> int:
+        total = 0
+        while True:
+            result = await self.db.execute(text(sql), {**params, "batch_size": self.batch_size})
+            await self.db.commit()
+            total += result.rowcount
+            if result.rowcount < self.batch_size:
+                return total
+    async def _platforms(self) -> List[str]:
+        result = await self.db.execute(text("SELECT DISTINCT platform FROM accounts ORDER BY platform"))
+        return [row[0] for row in result.all()]
+    async def _oldest_metric(self, platform: str) -> Optional[datetime]:
+        result = await self.db.execute(
+            text("""
+                SELECT min(m.collected_at) FROM metrics m JOIN accounts a ON a.id = m.account_id
+                WHERE a.platform = :platform
+            """),
+            {"platform": platform}
+        )
+        return result.scalar()
+    async def _get_watermark(self, key: str) -> Optional[datetime]:
+        result = await self.db.execute(
+            select(RetentionWatermark.processed_until).where(RetentionWatermark.key == key)
+        )
+        return result.scalar_one_or_none()
+    async def _set_watermark(self, key: str, processed_until: datetime) -> None:
+        stmt = insert(RetentionWatermark).values(key=key, processed_until=processed_until)
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[RetentionWatermark.key],
+                set_={"processed_until": stmt.excluded.processed_until}
+            )
+        )
@@ -0,0 +1,150 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Type
+from uuid import UUID
+import logging
+from sqlalchemy import and_, case, func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.models.metric_rollup import (
+    ROLLUP_FIELDS,
+    MetricRollupDay,
+    MetricRollupHour,
+    MetricRollupMixin,
+    MetricRollupWeek,
+)
+logger = logging.getLogger(__name__)
+GRANULARITY_MODELS: Dict[str, Type[MetricRollupMixin]] = {
+    "hour": MetricRollupHour,
+    "day": MetricRollupDay,
+    "week": MetricRollupWeek,
+}
+class RollupService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    @staticmethod
+    def bucket_start(collected_at: datetime, granularity: str) -> datetime:
+        if collected_at.tzinfo is None:
+            ts = collected_at.replace(tzinfo=timezone.utc)
+        else:
+            ts = collected_at.astimezone(timezone.utc)
+        ts = ts.replace(minute=0, second=0, microsecond=0)
+        if granularity == "hour":
+            return ts
+        ts = ts.replace(hour=0)
+        if granularity == "day":
+            return ts
+        if granularity == "week":
+            return ts - timedelta(days=ts.weekday())
+        raise ValueError(f"Unsupported rollup granularity: {granularity}")
+    @classmethod
+    def first_full_bucket(cls, value: datetime, granularity: str) -> datetime:
+        start = cls.bucket_start(value, granularity)
+        if start >= value:
+            return start
+        return start + {"hour": timedelta(hours=1), "day": timedelta(days=1), "week": timedelta(weeks=1)}[granularity]
+    @staticmethod
+    def sample_values(values: Dict[str, Any]) -> Dict[str, Any]:
+        row = {}
+        for field in ROLLUP_FIELDS:
+            value = values.get(field)
+            row[f"{field}_last"] = value
+            row[f"{field}_min"] = value
+            row[f"{field}_max"] = value
+            row[f"{field}_sum"] = value
+            row[f"{field}_count"] = 0 if value is None else 1
+        return row
+    async def apply(self, account_id: UUID, collected_at: datetime, values: Dict[str, Any]) -> None:
+        sample = self.sample_values(values)
+        for granularity, model in GRANULARITY_MODELS.items():
+            table = model.__table__
+            stmt = insert(model).values(
+                account_id=account_id,
+                bucket_start=self.bucket_start(collected_at, granularity),
+                samples=1,
+                last_collected_at=collected_at,
+                **sample
+            )
+            excluded = stmt.excluded
+            newer = excluded.last_collected_at >= table.c.last_collected_at
+            set_ = {
+                "samples": table.c.samples + 1,
+                "last_collected_at": func.greatest(table.c.last_collected_at, excluded.last_collected_at),
+            }
+            for field in ROLLUP_FIELDS:
+                last, incoming = table.c[f"{field}_last"], excluded[f"{field}_last"]
+                set_[f"{field}_last"] = case((and_(newer, incoming.isnot(None)), incoming), else_=last)
+                set_[f"{field}_min"] = func.least(table.c[f"{field}_min"], excluded[f"{field}_min"])
+                set_[f"{field}_max"] = func.greatest(table.c[f"{field}_max"], excluded[f"{field}_max"])
+                set_[f"{field}_sum"] = func.coalesce(table.c[f"{field}_sum"], 0) + func.coalesce(excluded[f"{field}_sum"], 0)
+                set_[f"{field}_count"] = table.c[f"{field}_count"] + excluded[f"{field}_count"]
+            await self.db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[table.c.account_id, table.c.bucket_start],
+                    set_=set_
+                )
+            )
+    async def rebuild(
+        self,
+        account_id: Optional[UUID] = None,
+        since: Optional[datetime] = None,
+        not_before: Optional[datetime] = None
+    ) -> Dict[str, int]:
+        rebuilt = {}
+        for granularity, model in GRANULARITY_MODELS.items():
+            params: Dict[str, Any] = {"unit": granularity}
+            filters = []
+            if account_id:
+                filters.append("account_id = :account_id")
+                params["account_id"] = account_id
+            starts = [self.bucket_start(since, granularity)] if since else []
+            if not_before:
+                starts.append(self.first_full_bucket(not_before, granularity))
+            if starts:
+                filters.append("collected_at >= :since")
+                params["since"] = max(starts)
+            result = await self.db.execute(text(self._rebuild_sql(model.__tablename__, filters)), params)
+            rebuilt[granularity] = result.rowcount
+            await self.db.commit()
+            logger.info(f"Rebuilt {result.rowcount} {model.__tablename__} buckets")
+        return rebuilt
+    async def get_series(
+        self,
+        account_ids: List[UUID],
+        granularity: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> List[MetricRollupMixin]:
+        model = GRANULARITY_MODELS[granularity]
+        query = select(model).where(model.account_id.in_(account_ids))
+        if start:
+            query = query.where(model.bucket_start >= self.bucket_start(start, granularity))
+        if end:
+            query = query.where(model.bucket_start <= end)
+        query = query.order_by(model.account_id, model.bucket_start)
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+    @staticmethod
+    def _rebuild_sql(table: str, filters: List[str]) -> str:
+        columns = ["account_id", "bucket_start", "samples", "last_collected_at"]
+        selects = [
+            "account_id",
+            "date_trunc(:unit, collected_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'",
+            "count(*)",
+            "max(collected_at)",
+        ]
+        for field in ROLLUP_FIELDS:
+            columns += [f"{field}_last", f"{field}_min", f"{field}_max", f"{field}_sum", f"{field}_count"]
+            selects += [
+                f"(array_agg({field} ORDER BY collected_at DESC) FILTER (WHERE {field} IS NOT NULL))[1]",
+                f"min({field})",
+                f"max({field})",
+                f"sum({field})",
+                f"count({field})",
+            ]
+        where = f"WHERE {' AND '.join(filters)}" if filters else ""
+        updates = ", ".join(f"{column} = EXCLUDED.{column}" for column in columns[2:])
+        return (
+            f"INSERT INTO {table} ({', '.join(columns)}) "
+            f"SELECT {', '.join(selects)} FROM metrics {where} GROUP BY 1, 2 "
+            f"ON CONFLICT (account_id, bucket_start) DO UPDATE SET {updates}"
+        )
@@ -1,11 +1,15 @@
 import logging
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timedelta
+from uuid import UUID
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.events import EVENT_JOB_ERROR, EVENT_JOB_EXECUTED
 from src.db.database import async_session_factory
-from src.services.collector_service import CollectorService
+from src.services.collector_service import CollectorService, CollectionResult
+from src.services.partition_service import PartitionService
+from src.services.retention_service import RetentionService
 from src.config.settings import get_settings
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -36,6 +40,25 @@ class SchedulerService:
                 max_instances=1,
                 coalesce=True
             )
+            self.scheduler.add_job(
+                self._partition_maintenance_job,
+                trigger=IntervalTrigger(days=1),
+                id='metrics_partition_maintenance',
+                name='Metrics partition maintenance',
+                replace_existing=True,
+                max_instances=1,
+                coalesce=True
+            )
+            if settings.retention_enabled:
+                self.scheduler.add_job(
+                    self._retention_job,
+                    trigger=IntervalTrigger(days=1),
+                    id='metrics_retention',
+                    name='Metrics retention and downsampling',
+                    replace_existing=True,
+                    max_instances=1,
+                    coalesce=True
+                )
             if settings.instagram_stories_collection_enabled:
                 self.scheduler.add_job(
                     self._instagram_stories_collection_job,
@@ -54,6 +77,7 @@ class SchedulerService:
                 f"✅ Scheduler started. Main collection: {settings.collect_interval_hours}h, "
                 f"Stories collection: {stories_status}"
             )
+            await self._partition_maintenance_job()
             await self._collection_job()
         except Exception as e:
             logger.error(f"❌ Failed to start scheduler: {e}", exc_info=True)
@@ -74,8 +98,64 @@ class SchedulerService:
                     f"Processed: {result.accounts_processed}, "
                     f"Failed: {result.accounts_failed}"
                 )
+                self._schedule_retry(result, attempt=1)
             except Exception as e:
                 logger.error(f"❌ Scheduled collection failed: {e}", exc_info=True)
+    async def _partition_maintenance_job(self) -> None:
+        async with async_session_factory() as db:
+            try:
+                service = PartitionService(db)
+                created = await service.ensure_partitions()
+                dropped = await service.drop_expired()
+                logger.info(
+                    f"✅ Partition maintenance completed. "
+                    f"Created: {len(created)}, Dropped: {len(dropped)}"
+                )
+            except Exception as e:
+                logger.error(f"❌ Partition maintenance failed: {e}", exc_info=True)
+    async def _retention_job(self) -> None:
+        logger.info("🧹 Starting retention run...")
+        async with async_session_factory() as db:
+            try:
+                stats = await RetentionService(db).run()
+                logger.info(f"✅ Retention run completed. Rows removed: {sum(stats.values())}")
+            except Exception as e:
+                logger.error(f"❌ Retention run failed: {e}", exc_info=True)
+    async def _retry_failed_job(self, log_id: UUID, attempt: int) -> None:
+        logger.info(f"🔁 Retrying failed accounts of run {log_id} (attempt {attempt})...")
+        async with async_session_factory() as db:
+            try:
+                service = CollectorService(db)
+                result = await service.retry_failed(log_id)
+                logger.info(
+                    f"✅ Retry attempt {attempt} completed. "
+                    f"Recovered: {result.accounts_processed}, "
+                    f"Still failing: {result.accounts_failed + result.accounts_timed_out}"
+                )
+                self._schedule_retry(result, attempt=attempt + 1)
+            except Exception as e:
+                logger.error(f"❌ Retry of run {log_id} failed: {e}", exc_info=True)
+    def _schedule_retry(self, result: CollectionResult, attempt: int) -> None:
+        if not self.scheduler or result.log_id is None:
+            return
+        if result.status not in ("partial", "failed"):
+            return
+        if result.accounts_failed + result.accounts_timed_out == 0:
+            return
+        if attempt > settings.collection_retry_attempts:
+            logger.warning(f"Run {result.log_id} still has failed accounts after {attempt - 1} retries")
+            return
+        delay = timedelta(minutes=settings.collection_retry_backoff_minutes * 2 ** (attempt - 1))
+        self.scheduler.add_job(
+            self._retry_failed_job,
+            trigger=DateTrigger(run_date=datetime.now() + delay),
+            args=[result.log_id, attempt],
+            id=f'retry_failed_{result.log_id}',
+            name=f'Retry failed accounts of run {result.log_id}',
+            replace_existing=True,
+            max_instances=1
+        )
+        logger.info(f"Scheduled retry {attempt} of run {result.log_id} in {delay}")
     async def _instagram_stories_collection_job(self) -> None:
         logger.info("📸 Starting Instagram Stories hourly collection...")
         async with async_session_factory() as db:
@@ -0,0 +1,132 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+import logging
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.models.metric_rollup import ROLLUP_FIELDS
+from src.models.promoted_field import PROMOTED_FIELDS
+from src.services.rollup_service import GRANULARITY_MODELS
+logger = logging.getLogger(__name__)
+BUCKETS = ("hour", "day", "week", "month")
+AGGREGATES = ("last", "avg", "max")
+TIMESERIES_METRICS = (
+    "followers",
+    "posts_count",
+    "total_likes",
+    "total_comments",
+    "total_views",
+    "total_shares",
+    "engagement_rate",
+    *(field.column_name for field in PROMOTED_FIELDS),
+)
+ROLLUP_SOURCES = {
+    "hour": "hour",
+    "day": "day",
+    "week": "week",
+    "month": "day",
+}
+class TimeseriesService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    @staticmethod
+    def validate(metrics: Sequence[str], bucket: str, agg: str) -> None:
+        if not metrics:
+            raise ValueError("At least one metric is required")
+        unknown = sorted(set(metrics) - set(TIMESERIES_METRICS))
+        if unknown:
+            raise ValueError(f"Unknown metrics: {', '.join(unknown)}")
+        if bucket not in BUCKETS:
+            raise ValueError(f"Unsupported bucket: {bucket}")
+        if agg not in AGGREGATES:
+            raise ValueError(f"Unsupported aggregate: {agg}")
+    @staticmethod
+    def split_metrics(metrics: Sequence[str]) -> Tuple[List[str], List[str]]:
+        rollup = [metric for metric in metrics if metric in ROLLUP_FIELDS]
+        raw = [metric for metric in metrics if metric not in ROLLUP_FIELDS]
+        return rollup, raw
+    @staticmethod
+    def rollup_expression(metric: str, agg: str) -> str:
+        if agg == "last":
+            return f"(array_agg({metric}_last ORDER BY bucket_start DESC) FILTER (WHERE {metric}_last IS NOT NULL))[1]"
+        if agg == "max":
+            return f"max({metric}_max)"
+        return f"(sum({metric}_sum) / NULLIF(sum({metric}_count), 0))::double precision"
+    @staticmethod
+    def raw_expression(metric: str, agg: str) -> str:
+        if agg == "last":
+            return f"(array_agg({metric} ORDER BY collected_at DESC) FILTER (WHERE {metric} IS NOT NULL))[1]"
+        if agg == "max":
+            return f"max({metric})"
+        return f"avg({metric})::double precision"
+    @classmethod
+    def build_sql(
+        cls,
+        metrics: Sequence[str],
+        agg: str,
+        source: str,
+        filters: Sequence[str]
+    ) -> str:
+        if source == "raw":
+            table, time_column, samples = "metrics", "collected_at", "count(*)"
+            expressions = [cls.raw_expression(metric, agg) for metric in metrics]
+        else:
+            table, time_column, samples = GRANULARITY_MODELS[source].__tablename__, "bucket_start", "sum(samples)"
+            expressions = [cls.rollup_expression(metric, agg) for metric in metrics]
+        selects = [
+            "account_id",
+            f"date_trunc(:unit, {time_column} AT TIME ZONE 'UTC') AT TIME ZONE 'UTC' AS bucket_start",
+            f"{samples} AS samples",
+            *(f"{expression} AS {metric}" for expression, metric in zip(expressions, metrics)),
+        ]
+        where = " AND ".join(["account_id = ANY(:account_ids)", *(f.format(time=time_column) for f in filters)])
+        return f"SELECT {', '.join(selects)} FROM {table} WHERE {where} GROUP BY 1, 2 ORDER BY 1, 2"
+    async def _fetch(
+        self,
+        metrics: Sequence[str],
+        agg: str,
+        source: str,
+        params: Dict[str, Any],
+        filters: Sequence[str]
+    ) -> List[Any]:
+        result = await self.db.execute(text(self.build_sql(metrics, agg, source, filters)), params)
+        return result.all()
+    async def get_series(
+        self,
+        account_ids: Sequence[UUID],
+        metrics: Sequence[str],
+        bucket: str = "day",
+        agg: str = "last",
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        platform: Optional[str] = None
+    ) -> Dict[UUID, List[Dict[str, Any]]]:
+        self.validate(metrics, bucket, agg)
+        params: Dict[str, Any] = {"unit": bucket, "account_ids": list(account_ids)}
+        filters = []
+        if start:
+            filters.append("{time} >= date_trunc(:unit, CAST(:start AS timestamptz) AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'")
+            params["start"] = start
+        if end:
+            filters.append("{time} <= :end")
+            params["end"] = end
+        if platform:
+            filters.append("account_id IN (SELECT id FROM accounts WHERE platform = :platform)")
+            params["platform"] = platform.lower()
+        rollup_metrics, raw_metrics = self.split_metrics(metrics)
+        points: Dict[Tuple[UUID, datetime], Dict[str, Any]] = {}
+        for source, selected in ((ROLLUP_SOURCES[bucket], rollup_metrics), ("raw", raw_metrics)):
+            if not selected:
+                continue
+            for row in await self._fetch(selected, agg, source, params, filters):
+                point = points.setdefault(
+                    (row.account_id, row.bucket_start),
+                    {"bucket_start": row.bucket_start, "samples": row.samples, "values": {}}
+                )
+                point["samples"] = max(point["samples"], row.samples)
+                point["values"].update({metric: getattr(row, metric) for metric in selected})
+        series: Dict[UUID, List[Dict[str, Any]]] = {account_id: [] for account_id in account_ids}
+        for (account_id, _), point in sorted(points.items(), key=lambda item: (str(item[0][0]), item[0][1])):
+            series.setdefault(account_id, []).append(point)
+        logger.debug(f"Built {len(points)} {bucket} buckets for {len(account_ids)} accounts ({agg} of {', '.join(metrics)})")
+        return series
@@ -1,6 +1,8 @@
 import asyncio
+import os
 from typing import AsyncGenerator, Generator
 import pytest
+os.environ.setdefault("RESPONSE_CACHE_BACKEND", "off")
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import NullPool
 from src.models.base import Base
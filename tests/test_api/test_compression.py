@@ -0,0 +1,77 @@
+import gzip
+import pytest
+from src.api.compression import CompressionMiddleware, GzipCompressor, negotiate_encoding, parse_accept_encoding
+def json_app(body: bytes, chunks: int = 1, headers: list = None):
+    async def app(scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": headers or [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        })
+        size = len(body) // chunks
+        for index in range(chunks):
+            part = body[index * size:] if index == chunks - 1 else body[index * size:(index + 1) * size]
+            await send({"type": "http.response.body", "body": part, "more_body": index < chunks - 1})
+    return app
+async def call(app, accept_encoding: str = "gzip"):
+    messages = []
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [(b"accept-encoding", accept_encoding.encode())]}
+    async def receive():
+        return {"type": "http.request", "body": b""}
+    async def send(message):
+        messages.append(message)
+    await app(scope, receive, send)
+    headers = {key.decode(): value.decode() for key, value in messages[0]["headers"]}
+    return headers, b"".join(message.get("body", b"") for message in messages[1:])
+class TestNegotiation:
+    def test_parses_quality_values(self):
+        assert parse_accept_encoding("gzip;q=0.5, br") == {"gzip": 0.5, "br": 1.0}
+    def test_prefers_brotli_when_available(self):
+        assert negotiate_encoding("gzip, br", brotli=True) == "br"
+        assert negotiate_encoding("gzip, br", brotli=False) == "gzip"
+    def test_respects_weights_and_refusals(self):
+        assert negotiate_encoding("br;q=0.1, gzip;q=0.9", brotli=True) == "gzip"
+        assert negotiate_encoding("gzip;q=0", brotli=False) is None
+        assert negotiate_encoding("identity", brotli=True) is None
+        assert negotiate_encoding(None, brotli=True) is None
+    def test_wildcard(self):
+        assert negotiate_encoding("*", brotli=False) == "gzip"
+class TestGzipCompressor:
+    def test_streamed_chunks_round_trip(self):
+        compressor = GzipCompressor(6)
+        data = compressor.compress(b'{"a":', False) + compressor.compress(b"1}", True)
+        assert gzip.decompress(data) == b'{"a":1}'
+class TestCompressionMiddleware:
+    @pytest.mark.asyncio
+    async def test_compresses_large_json(self):
+        body = b'{"followers": 1}' * 200
+        headers, payload = await call(CompressionMiddleware(json_app(body), minimum_size=100))
+        assert headers["content-encoding"] == "gzip"
+        assert headers["vary"] == "Accept-Encoding"
+        assert int(headers["content-length"]) == len(payload)
+        assert gzip.decompress(payload) == body
+    @pytest.mark.asyncio
+    async def test_skips_small_bodies(self):
+        headers, payload = await call(CompressionMiddleware(json_app(b"{}"), minimum_size=100))
+        assert "content-encoding" not in headers
+        assert payload == b"{}"
+    @pytest.mark.asyncio
+    async def test_skips_parquet(self):
+        body = b"PAR1" * 500
+        app = json_app(body, headers=[(b"content-type", b"application/vnd.apache.parquet")])
+        headers, payload = await call(CompressionMiddleware(app, minimum_size=100))
+        assert "content-encoding" not in headers
+        assert payload == body
+    @pytest.mark.asyncio
+    async def test_streams_chunks(self):
+        body = b'{"id": 1}\n' * 300
+        headers, payload = await call(CompressionMiddleware(json_app(body, chunks=3), minimum_size=100))
+        assert headers["content-encoding"] == "gzip"
+        assert "content-length" not in headers
+        assert gzip.decompress(payload) == body
+    @pytest.mark.asyncio
+    async def test_weakens_etag(self):
+        body = b"[]" * 1000
+        app = json_app(body, headers=[(b"content-type", b"application/json"), (b"etag", b'"abc"')])
+        headers, _ = await call(CompressionMiddleware(app, minimum_size=100))
+        assert headers["etag"] == 'W/"abc"'
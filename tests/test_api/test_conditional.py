@@ -0,0 +1,86 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import Request
+from src.api import conditional
+from src.api.conditional import build_etag, parse_if_none_match, request_account_id
+from src.db.database import get_db
+from src.services import response_cache
+from src.services.response_cache import MemoryCacheBackend, ResponseCache, cached_response
+def make_request(path: str, query: str = "", path_params: dict = None) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": query.encode("utf-8"),
+        "headers": [],
+        "path_params": path_params or {},
+    })
+class TestParseIfNoneMatch:
+    def test_empty(self):
+        assert parse_if_none_match(None) == []
+        assert parse_if_none_match("") == []
+    def test_strips_weak_prefix_and_whitespace(self):
+        assert parse_if_none_match('W/"abc", "def"') == ['"abc"', '"def"']
+class TestRequestAccountId:
+    def test_path_param(self):
+        account_id = uuid4()
+        assert request_account_id(make_request("/x", path_params={"account_id": str(account_id)})) == account_id
+    def test_query_param(self):
+        account_id = uuid4()
+        assert request_account_id(make_request("/x", f"account_id={account_id}")) == account_id
+    def test_multiple_accounts_are_global(self):
+        assert request_account_id(make_request("/x", f"account_id={uuid4()}&account_id={uuid4()}")) is None
+    def test_invalid_uuid(self):
+        assert request_account_id(make_request("/x", "account_id=nope")) is None
+class TestBuildEtag:
+    def test_stable_across_query_order(self):
+        first = build_etag(make_request("/api/v1/metrics", "a=1&b=2"), "global:1")
+        second = build_etag(make_request("/api/v1/metrics", "b=2&a=1"), "global:1")
+        assert first == second
+        assert first.startswith('"') and first.endswith('"')
+    def test_changes_with_version_and_query(self):
+        request = make_request("/api/v1/metrics", "a=1")
+        assert build_etag(request, "global:1") != build_etag(request, "global:2")
+        assert build_etag(request, "global:1") != build_etag(make_request("/api/v1/metrics", "a=2"), "global:1")
+class TestConditionalGetWithResponseCache:
+    @pytest.fixture
+    def state(self):
+        return {"version": "v1", "calls": 0}
+    @pytest.fixture
+    def client(self, monkeypatch, state):
+        cache = ResponseCache(MemoryCacheBackend(max_entries=8, ttl_seconds=900))
+        monkeypatch.setattr(response_cache, "get_response_cache", lambda: cache)
+        monkeypatch.setattr(conditional, "get_response_cache", lambda: cache)
+        async def fake_db():
+            db = MagicMock(spec=AsyncSession)
+            db.info = {}
+            result = MagicMock()
+            result.scalar_one.side_effect = lambda: state["version"]
+            db.execute = AsyncMock(return_value=result)
+            yield db
+        router = APIRouter(dependencies=[Depends(conditional.conditional_get)])
+        @router.get("/overview")
+        @cached_response()
+        async def overview(db: AsyncSession = Depends(get_db)):
+            state["calls"] += 1
+            return {"calls": state["calls"]}
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_db] = fake_db
+        return TestClient(app)
+    def test_recompute_refreshes_cached_body_and_etag(self, client, state):
+        first = client.get("/overview")
+        etag = first.headers["etag"]
+        assert first.json() == {"calls": 1}
+        assert client.get("/overview", headers={"If-None-Match": etag}).status_code == 304
+        state["version"] = "v2"
+        refreshed = client.get("/overview", headers={"If-None-Match": etag})
+        assert refreshed.status_code == 200
+        assert refreshed.json() == {"calls": 2}
+        assert refreshed.headers["etag"] != etag
+        assert client.get("/overview", headers={"If-None-Match": refreshed.headers["etag"]}).status_code == 304
+        assert client.get("/overview").json() == {"calls": 2}
@@ -0,0 +1,40 @@
+import pytest
+from datetime import datetime
+from uuid import uuid4
+from fastapi import HTTPException, Response
+from src.api.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor, paginate, parse_datetime, parse_uuid, reject_offset_with_cursor
+class TestCursor:
+    def test_round_trip(self):
+        collected_at = datetime(2026, 3, 1, 12, 30)
+        row_id = uuid4()
+        cursor = encode_cursor(collected_at, row_id)
+        assert decode_cursor(cursor, parse_datetime, parse_uuid) == [collected_at, row_id]
+    def test_none_sort_value_survives(self):
+        row_id = uuid4()
+        assert decode_cursor(encode_cursor(None, row_id), int, parse_uuid) == [None, row_id]
+    def test_invalid_cursor_is_bad_request(self):
+        with pytest.raises(HTTPException) as exc:
+            decode_cursor("not-a-cursor", parse_datetime, parse_uuid)
+        assert exc.value.status_code == 400
+    def test_wrong_shape_is_bad_request(self):
+        with pytest.raises(HTTPException) as exc:
+            decode_cursor(encode_cursor(1), int, parse_uuid)
+        assert exc.value.status_code == 400
+class TestPaginate:
+    def test_sets_header_when_more_rows(self):
+        response = Response()
+        page = paginate(response, [1, 2, 3], 2, lambda row: (row,))
+        assert page == [1, 2]
+        assert decode_cursor(response.headers[NEXT_CURSOR_HEADER], int) == [2]
+    def test_no_header_on_last_page(self):
+        response = Response()
+        assert paginate(response, [1, 2], 2, lambda row: (row,)) == [1, 2]
+        assert NEXT_CURSOR_HEADER not in response.headers
+class TestRejectOffsetWithCursor:
+    def test_offset_alone_is_allowed(self):
+        reject_offset_with_cursor(None, 20)
+        reject_offset_with_cursor(encode_cursor(1), 0)
+    def test_offset_with_cursor_is_bad_request(self):
+        with pytest.raises(HTTPException) as exc:
+            reject_offset_with_cursor(encode_cursor(1), 20)
+        assert exc.value.status_code == 400
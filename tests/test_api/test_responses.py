@@ -0,0 +1,28 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+from fastapi import Response
+from src.api.responses import dumps, orm_dicts, trusted_json
+from src.models.schemas import ContentItemStatResponse
+class TestDumps:
+    def test_encodes_api_types(self):
+        item_id = uuid4()
+        payload = dumps({"id": item_id, "at": datetime(2026, 1, 2, tzinfo=timezone.utc), "rate": Decimal("1.5")})
+        assert payload == f'{{"id":"{item_id}","at":"2026-01-02T00:00:00Z","rate":1.5}}'.encode()
+class TestTrustedJson:
+    def test_copies_dependency_headers(self):
+        response = Response()
+        response.headers["X-Next-Cursor"] = "abc"
+        fast = trusted_json([{"a": 1}], response)
+        assert fast.body == b'[{"a":1}]'
+        assert fast.headers["x-next-cursor"] == "abc"
+        assert fast.headers["content-length"] == str(len(fast.body))
+    def test_orm_dicts_uses_model_fields(self):
+        row = SimpleNamespace(
+            collected_at=datetime(2026, 1, 1), views=1, likes=2, comments=3, shares=None, saves=None,
+            impressions=None, reach=None, engagement_rate=0.5, extra="ignored"
+        )
+        assert orm_dicts([row], ContentItemStatResponse)[0] == {
+            name: getattr(row, name) for name in ContentItemStatResponse.model_fields
+        }
@@ -0,0 +1,27 @@
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import select
+from src.models.account import Account
+from src.models.account_latest_metric import AccountLatestMetric
+from src.models.metric import Metric
+@pytest.mark.asyncio
+async def test_latest_metric_follows_newest_insert(db_session):
+    account = Account(
+        platform="tiktok",
+        account_id="latest_account",
+        account_url="https://www.tiktok.com/@latest_account",
+        display_name="Latest Account",
+        is_active=True,
+    )
+    db_session.add(account)
+    await db_session.commit()
+    now = datetime.utcnow()
+    db_session.add(Metric(account_id=account.id, collected_at=now, followers=200))
+    await db_session.commit()
+    db_session.add(Metric(account_id=account.id, collected_at=now - timedelta(days=1), followers=100))
+    await db_session.commit()
+    result = await db_session.execute(
+        select(AccountLatestMetric).where(AccountLatestMetric.account_id == account.id)
+    )
+    latest = result.scalar_one()
+    assert latest.followers == 200
@@ -0,0 +1,18 @@
+from src.models.metric import Metric
+from src.models.promoted_field import PROMOTED_FIELDS, PROMOTED_ROOT_KEYS, PromotedField
+def test_promoted_fields_are_mapped_on_metric():
+    for field in PROMOTED_FIELDS:
+        column = Metric.__table__.c[field.column_name]
+        assert column.computed is not None
+        assert column.computed.persisted is True
+def test_expression_only_casts_numbers():
+    field = PromotedField("youtube", "avg_views_30d", ("metrics_30d", "avg_views_per_video"))
+    assert field.expression == (
+        "CASE WHEN jsonb_typeof(extra_data #> '{metrics_30d,avg_views_per_video}') = 'number' "
+        "THEN (extra_data #>> '{metrics_30d,avg_views_per_video}')::double precision END"
+    )
+def test_bigint_fields_round_through_numeric():
+    field = PromotedField("pinterest", "saves_30d", ("saves_30d",), "bigint")
+    assert "::numeric::bigint" in field.expression
+def test_root_keys_stay_inline():
+    assert "metrics_30d" in PROMOTED_ROOT_KEYS
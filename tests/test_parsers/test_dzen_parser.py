@@ -143,6 +143,42 @@ class TestDzenParserMocked:
         assert parser._context is None
         assert parser._browser is None
         assert parser._playwright is None
+class TestDzenParserArchive:
+    @pytest.mark.asyncio
+    async def test_fetch_archives_page_when_enabled(self, parser):
+        mock_page = MagicMock()
+        mock_page.goto = AsyncMock()
+        mock_page.close = AsyncMock()
+        mock_page.content = AsyncMock(return_value="<html>channel</html>")
+        mock_context = MagicMock()
+        mock_context.new_page = AsyncMock(return_value=mock_page)
+        parser._browser = MagicMock()
+        parser._context = mock_context
+        parser.enable_archive()
+        metrics = PlatformMetrics(platform="dzen", account_id=parser.account_id, collected_at=datetime.utcnow())
+        with patch.object(parser, '_parse_page', new_callable=AsyncMock, return_value=metrics), \
+             patch.object(parser, '_human_delay', new_callable=AsyncMock), \
+             patch.object(parser, '_scroll_page', new_callable=AsyncMock):
+            await parser.fetch_metrics()
+        assert parser.archived_payloads["channel_html"] == ("text/html", b"<html>channel</html>")
+    @pytest.mark.asyncio
+    async def test_parse_archived_uses_stored_html(self, parser):
+        mock_page = MagicMock()
+        mock_page.set_content = AsyncMock()
+        mock_page.close = AsyncMock()
+        mock_context = MagicMock()
+        mock_context.new_page = AsyncMock(return_value=mock_page)
+        parser._browser = MagicMock()
+        parser._context = mock_context
+        collected_at = datetime(2026, 10, 1, 12, 0)
+        with patch.object(parser, '_extract_channel_name', new_callable=AsyncMock, return_value="Channel"), \
+             patch.object(parser, '_extract_followers', new_callable=AsyncMock, return_value=1000), \
+             patch.object(parser, '_extract_posts', new_callable=AsyncMock, return_value=[{"views": 50, "likes": 5}]):
+            metrics = await parser.parse_archived({"channel_html": b"<html>channel</html>"}, collected_at)
+        mock_page.set_content.assert_awaited_once()
+        assert metrics.collected_at == collected_at
+        assert metrics.followers == 1000
+        assert metrics.total_views == 50
 class TestDzenParserSelectors:
     def test_follower_selectors_defined(self, parser):
         assert len(parser.FOLLOWER_SELECTORS) > 0
@@ -190,6 +190,31 @@ async def test_fetch_ads_metrics_success(parser, mock_db, mock_account):
         assert "audience_insights" in ads_data
         assert ads_data["ads_metrics"]["30d"]["total_spend"] == 500.0
 @pytest.mark.asyncio
+async def test_fetch_ads_metrics_skips_cached_audience(parser, mock_db, mock_account):
+    mock_account.advertiser_id = "1234567890"
+    parser.set_profile_context({"audience"})
+    with patch('src.parsers.tiktok_parser.TokenManager') as MockTokenManager,         patch('src.parsers.tiktok_parser.BaseRepository') as MockRepo,         patch('src.parsers.tiktok_parser.TikTokMarketingClient') as MockMarketingClient:
+        mock_token_manager = MockTokenManager.return_value
+        mock_token_manager.get_valid_token = AsyncMock(return_value="valid_token")
+        mock_repo = MockRepo.return_value
+        mock_repo.get = AsyncMock(return_value=mock_account)
+        mock_marketing = MockMarketingClient.return_value
+        mock_marketing.get_campaigns = AsyncMock(return_value=[])
+        mock_marketing.get_ad_report = AsyncMock(return_value={
+            "total_spend": 0.0,
+            "total_impressions": 0,
+            "total_clicks": 0,
+            "total_conversions": 0,
+            "avg_ctr": 0.0,
+            "avg_cpm": 0.0,
+            "avg_conversion_rate": 0.0
+        })
+        mock_marketing.get_audience_report = AsyncMock()
+        ads_data = await parser.fetch_ads_metrics()
+        assert "ads_metrics" in ads_data
+        assert "audience_insights" not in ads_data
+        mock_marketing.get_audience_report.assert_not_called()
+@pytest.mark.asyncio
 async def test_fetch_ads_metrics_graceful_degradation(parser, mock_db, mock_account):
     mock_account.advertiser_id = None
     with patch('src.parsers.tiktok_parser.TokenManager') as MockTokenManager,         patch('src.parsers.tiktok_parser.BaseRepository') as MockRepo:
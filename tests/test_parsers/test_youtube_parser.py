@@ -0,0 +1,27 @@
+import asyncio
+import threading
+import pytest
+from unittest.mock import MagicMock
+from src.parsers.youtube_parser import YouTubeParser
+@pytest.fixture
+def parser():
+    return YouTubeParser(
+        account_id="UC_x5XG1OV2P6uZZ5FSM9Ttw",
+        account_url="https://www.youtube.com/channel/UC_x5XG1OV2P6uZZ5FSM9Ttw"
+    )
+class TestYouTubeParserBlockingCalls:
+    @pytest.mark.asyncio
+    async def test_hung_api_call_does_not_block_time_budget(self, parser):
+        release = threading.Event()
+        parser.youtube = MagicMock()
+        parser.youtube.channels.return_value.list.return_value.execute.side_effect = lambda: release.wait(5)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(parser.fetch_metrics(), timeout=0.1)
+        release.set()
+        assert loop.time() - started < 1
+    def test_client_has_socket_timeout(self, parser, monkeypatch):
+        monkeypatch.setattr("src.parsers.youtube_parser.settings.youtube_api_key", "key")
+        parser._init_client()
+        assert parser.youtube._http.timeout is not None
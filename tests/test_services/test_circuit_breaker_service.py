@@ -0,0 +1,35 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+from uuid import uuid4
+from src.services.circuit_breaker_service import CircuitBreakerService, CLOSED, OPEN, HALF_OPEN
+class TestCircuitBreakerService:
+    def test_closed_circuit_allows(self):
+        assert CircuitBreakerService.can_attempt(CLOSED, None, timedelta(minutes=30)) == (True, CLOSED)
+    def test_open_circuit_blocks_during_cooldown(self):
+        now = datetime(2026, 10, 19, 12, 0)
+        opened_at = now - timedelta(minutes=10)
+        assert CircuitBreakerService.can_attempt(OPEN, opened_at, timedelta(minutes=30), now) == (False, OPEN)
+    def test_open_circuit_half_opens_after_cooldown(self):
+        now = datetime(2026, 10, 19, 12, 0)
+        opened_at = now - timedelta(minutes=31)
+        assert CircuitBreakerService.can_attempt(OPEN, opened_at, timedelta(minutes=30), now) == (True, HALF_OPEN)
+    def test_half_open_blocks_concurrent_trial(self):
+        now = datetime(2026, 10, 19, 12, 0)
+        assert CircuitBreakerService.can_attempt(HALF_OPEN, now, timedelta(minutes=30), now) == (False, HALF_OPEN)
+    def test_failures_open_at_threshold(self):
+        assert CircuitBreakerService.after_failure(CLOSED, 0, 3) == (CLOSED, 1)
+        assert CircuitBreakerService.after_failure(CLOSED, 2, 3) == (OPEN, 3)
+    def test_failed_trial_reopens(self):
+        assert CircuitBreakerService.after_failure(HALF_OPEN, 0, 3) == (OPEN, 1)
+    def test_credential_key(self):
+        account = SimpleNamespace(id=uuid4(), platform="tiktok")
+        assert CircuitBreakerService.credential_key(account, SimpleNamespace(requires_oauth=False)) == "default"
+        assert CircuitBreakerService.credential_key(account, SimpleNamespace(requires_oauth=True)) == str(account.id)
+    def test_credential_key_instagram_system_user(self):
+        account = SimpleNamespace(id=uuid4(), platform="instagram")
+        with patch("src.services.circuit_breaker_service.settings") as mock_settings:
+            mock_settings.instagram_system_user_token = "token"
+            key = CircuitBreakerService.credential_key(account, SimpleNamespace(requires_oauth=True))
+        assert key == "system_user"
+        assert CircuitBreakerService.make_key("Instagram", key) == "instagram:system_user"
@@ -0,0 +1,171 @@
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+from sqlalchemy.dialects import postgresql
+from src.services.circuit_breaker_service import CLOSED, CircuitBreakerService
+from src.services.collector_service import CollectorService, CollectionResult, CollectionTimedOut
+def make_account(platform: str = "dzen") -> SimpleNamespace:
+    return SimpleNamespace(id=uuid4(), platform=platform, account_id="channel", account_url="https://dzen.ru/channel")
+class TestCollectorTimeouts:
+    def test_account_timeout_uses_platform_override(self):
+        with patch("src.services.collector_service.settings") as mock_settings:
+            mock_settings.collect_account_timeout_seconds = 300
+            mock_settings.collect_account_timeout_overrides = {"dzen": 600}
+            assert CollectorService.account_timeout("Dzen") == 600
+            assert CollectorService.account_timeout("vk") == 300
+    def test_timed_out_accounts_make_run_partial(self):
+        result = CollectionResult()
+        result.accounts_processed = 2
+        result.accounts_timed_out = 1
+        assert result.status == "partial"
+        result.accounts_processed = 0
+        assert result.status == "failed"
+    @pytest.mark.asyncio
+    async def test_hung_fetch_is_cancelled_and_parser_closed(self):
+        service = CollectorService(MagicMock())
+        service.circuit_breaker = MagicMock()
+        service.circuit_breaker.allow = AsyncMock(return_value=True)
+        service.circuit_breaker.record_failure = AsyncMock()
+        service.profile_cache = MagicMock()
+        service.profile_cache.get_fresh_groups = AsyncMock(return_value=set())
+        cancelled = asyncio.Event()
+        async def hang():
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        parser = MagicMock()
+        parser.SLOW_FIELDS = {}
+        parser.requires_oauth = False
+        parser.is_available = AsyncMock(return_value=True)
+        parser.fetch_metrics = hang
+        parser.close = AsyncMock()
+        account = make_account()
+        with patch("src.services.collector_service.ParserFactory.create", return_value=parser), \
+             patch("src.services.collector_service.platform_health") as mock_health, \
+             patch.object(CollectorService, "account_timeout", return_value=0.05):
+            mock_health.ensure_available = AsyncMock(return_value=True)
+            with pytest.raises(CollectionTimedOut):
+                await service._collect_account(account, CollectionResult())
+        assert cancelled.is_set()
+        parser.close.assert_awaited_once()
+        service.circuit_breaker.record_failure.assert_awaited_once()
+        mock_health.record_failure.assert_called_once()
+    @pytest.mark.asyncio
+    async def test_account_errors_do_not_count_toward_platform_health(self):
+        service = CollectorService(MagicMock())
+        service.circuit_breaker = MagicMock()
+        service.circuit_breaker.allow = AsyncMock(return_value=True)
+        service.circuit_breaker.record_failure = AsyncMock()
+        service.profile_cache = MagicMock()
+        service.profile_cache.get_fresh_groups = AsyncMock(return_value=set())
+        parser = MagicMock()
+        parser.SLOW_FIELDS = {}
+        parser.fetch_metrics = AsyncMock(side_effect=ValueError("Channel is private"))
+        parser.close = AsyncMock()
+        with patch("src.services.collector_service.ParserFactory.create", return_value=parser), \
+             patch("src.services.collector_service.platform_health") as mock_health:
+            mock_health.ensure_available = AsyncMock(return_value=True)
+            with pytest.raises(ValueError):
+                await service._collect_account(make_account(), CollectionResult())
+        service.circuit_breaker.record_failure.assert_not_awaited()
+        mock_health.record_failure.assert_not_called()
+    @pytest.mark.asyncio
+    async def test_account_errors_do_not_open_shared_circuit(self):
+        db = MagicMock()
+        db.rollback = AsyncMock()
+        service = CollectorService(db)
+        breaker = {"state": CLOSED, "failures": 0}
+        async def record_failure(platform, credential, error=None):
+            breaker["state"], breaker["failures"] = CircuitBreakerService.after_failure(breaker["state"], breaker["failures"], 3)
+        service.circuit_breaker = MagicMock()
+        service.circuit_breaker.allow = AsyncMock(side_effect=lambda platform, credential: breaker["state"] == CLOSED)
+        service.circuit_breaker.record_failure = AsyncMock(side_effect=record_failure)
+        service.circuit_breaker.record_success = AsyncMock()
+        service.profile_cache = MagicMock()
+        service.profile_cache.get_fresh_groups = AsyncMock(return_value=set())
+        service.profile_cache.store = AsyncMock()
+        service.raw_payloads = MagicMock(should_archive=MagicMock(return_value=False))
+        def make_parser(error=None):
+            parser = MagicMock()
+            parser.SLOW_FIELDS = {}
+            parser.requires_oauth = False
+            parser.fetch_metrics = AsyncMock(side_effect=error, return_value=MagicMock(extra_data={}))
+            parser.close = AsyncMock()
+            return parser
+        parsers = [make_parser(ValueError("Channel is private")) for _ in range(3)] + [make_parser()]
+        result = CollectionResult()
+        with patch("src.services.collector_service.ParserFactory.create", side_effect=parsers), \
+             patch("src.services.collector_service.platform_health") as mock_health, \
+             patch.object(service, "_save_metrics", AsyncMock()), \
+             patch.object(service, "_record_outcome", AsyncMock()):
+            mock_health.ensure_available = AsyncMock(return_value=True)
+            await service._run_accounts(uuid4(), [make_account() for _ in parsers], result)
+        assert breaker == {"state": CLOSED, "failures": 0}
+        assert (result.accounts_failed, result.accounts_skipped, result.accounts_processed) == (3, 0, 1)
+class TestCollectorRetry:
+    @pytest.mark.asyncio
+    async def test_retry_unknown_run_raises(self):
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=None)))
+        db.rollback = AsyncMock()
+        service = CollectorService(db)
+        service.log_repo = MagicMock()
+        service.log_repo.get = AsyncMock(return_value=None)
+        with pytest.raises(ValueError):
+            await service.retry_failed(uuid4())
+    @pytest.mark.asyncio
+    async def test_retry_of_claimed_run_conflicts(self):
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=None)))
+        db.rollback = AsyncMock()
+        service = CollectorService(db)
+        log_id = uuid4()
+        service.log_repo = MagicMock()
+        service.log_repo.get = AsyncMock(return_value=SimpleNamespace(id=log_id, status="running"))
+        with patch.object(service, "_run_accounts", AsyncMock()) as mock_run:
+            with pytest.raises(RuntimeError):
+                await service.retry_failed(log_id)
+        mock_run.assert_not_awaited()
+        claim = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "UPDATE collection_logs SET status=" in claim
+        assert "collection_logs.status IN" in claim
+        assert "RETURNING collection_logs.id" in claim
+    @pytest.mark.asyncio
+    async def test_retry_only_collects_failed_accounts(self):
+        db = MagicMock()
+        db.commit = AsyncMock()
+        service = CollectorService(db)
+        log_id = uuid4()
+        db.execute = AsyncMock(return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=log_id)))
+        service.log_repo = MagicMock()
+        service.log_repo.update = AsyncMock()
+        failed = make_account()
+        with patch.object(service, "_get_retry_accounts", AsyncMock(return_value=[failed])), \
+             patch.object(service, "_collect_account", AsyncMock()) as mock_collect, \
+             patch.object(service, "_record_outcome", AsyncMock()) as mock_record, \
+             patch.object(service, "_finish_log", AsyncMock(return_value="success")):
+            result = await service.retry_failed(log_id)
+        mock_collect.assert_awaited_once()
+        assert mock_collect.await_args.args[0] is failed
+        assert mock_record.await_args.args[:3] == (log_id, failed.id, "success")
+        assert result.log_id == log_id
+    @pytest.mark.asyncio
+    async def test_failed_account_rolls_back_before_recording(self):
+        db = MagicMock()
+        db.rollback = AsyncMock()
+        service = CollectorService(db)
+        broken, healthy = make_account(), make_account()
+        calls = []
+        async def collect(account, result, log_id):
+            if account is broken:
+                raise RuntimeError("no partition of relation metrics found for row")
+        async def record(log_id, account_id, status, error, started_at):
+            calls.append((db.rollback.await_count, account_id, status))
+        with patch.object(service, "_collect_account", side_effect=collect), \
+             patch.object(service, "_record_outcome", side_effect=record):
+            await service._run_accounts(uuid4(), [broken, healthy], CollectionResult())
+        assert calls == [(1, broken.id, "failed"), (1, healthy.id, "success")]
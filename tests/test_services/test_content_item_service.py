@@ -0,0 +1,44 @@
+from datetime import datetime, timezone
+from src.services.content_item_service import ContentItemService
+class TestContentItemExtraction:
+    def test_youtube_videos_are_normalized(self):
+        extra_data = {
+            "recent_videos": [
+                {"video_id": "abc", "title": "Look", "views": 200, "likes": 8, "comments": 2, "published_at": "2026-10-01T10:00:00Z"}
+            ]
+        }
+        items = ContentItemService.extract_items("youtube", extra_data)
+        assert len(items) == 1
+        item = items[0]
+        assert item["external_id"] == "abc"
+        assert item["content_type"] == "video"
+        assert item["published_at"] == datetime(2026, 10, 1, 10, 0, tzinfo=timezone.utc)
+        assert item["engagement_rate"] == 5.0
+        assert item["url"] == "https://www.youtube.com/watch?v=abc"
+    def test_instagram_media_uses_graph_fields(self):
+        extra_data = {
+            "recent_media": [
+                {"id": "17890", "media_type": "CAROUSEL_ALBUM", "like_count": 4, "comments_count": 1, "timestamp": "2026-10-01T10:00:00+0000"}
+            ]
+        }
+        item = ContentItemService.extract_items("instagram", extra_data)[0]
+        assert item["external_id"] == "17890"
+        assert item["content_type"] == "carousel_album"
+        assert item["likes"] == 4
+        assert item["comments"] == 1
+        assert item["published_at"] is not None
+    def test_telegram_posts_map_reactions_and_forwards(self):
+        extra_data = {"top_posts_by_views": [{"id": 42, "text": "hi", "views": 900, "forwards": 3, "reactions": 12, "date": "2026-10-01T10:00:00+00:00"}]}
+        item = ContentItemService.extract_items("telegram", extra_data)[0]
+        assert item["external_id"] == "42"
+        assert item["likes"] == 12
+        assert item["shares"] == 3
+    def test_items_without_id_or_unknown_platform_are_ignored(self):
+        assert ContentItemService.extract_items("dzen", {"recent_posts": [{"title": "x", "views": 1}]}) == []
+        assert ContentItemService.extract_items("youtube", {"recent_videos": [{"title": "no id"}]}) == []
+        assert ContentItemService.extract_items("youtube", None) == []
+    def test_duplicate_ids_are_collapsed(self):
+        extra_data = {"recent_videos": [{"video_id": "v1", "views": 1}, {"video_id": "v1", "views": 5}]}
+        items = ContentItemService.extract_items("tiktok", extra_data)
+        assert len(items) == 1
+        assert items[0]["views"] == 5
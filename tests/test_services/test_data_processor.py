@@ -75,3 +75,18 @@ class TestAdaptiveResampling:
         })
         result = MetricsProcessor.prepare_time_series(df, 'followers')
         assert result.empty
+class TestFromArrow:
+    def test_flat_extra_columns_without_normalize(self):
+        pytest.importorskip("pyarrow")
+        from src.services.metric_stream_service import ARROW_END_OF_STREAM, arrow_schema, encode_arrow_batch
+        extra_keys = ["metrics_30d.total_views", "recent_videos", "avg_views"]
+        items = [
+            {"collected_at": datetime(2025, 12, 2), "followers": 110, "extra_data": {"metrics_30d.total_views": 900, "recent_videos": [{"id": "b"}]}},
+            {"collected_at": datetime(2025, 12, 1), "followers": 100, "extra_data": {"metrics_30d.total_views": 800}},
+        ]
+        schema = arrow_schema(["collected_at", "followers"], extra_keys, items)
+        payload = schema.serialize().to_pybytes() + encode_arrow_batch(schema, items, extra_keys) + ARROW_END_OF_STREAM
+        df = MetricsProcessor.from_arrow(payload)
+        assert list(df.columns) == ["collected_at", "followers", "metrics_30d.total_views", "recent_videos"]
+        assert df["metrics_30d.total_views"].tolist() == [800.0, 900.0]
+        assert df["recent_videos"].tolist() == [None, [{"id": "b"}]]
@@ -0,0 +1,23 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+from sqlalchemy.dialects import postgresql
+from src.services.data_version_service import ACCOUNT_VERSION_SQL, GLOBAL_VERSION_SQL, DataVersionService
+class TestDataVersionService:
+    def test_scope_for(self):
+        account_id = uuid4()
+        assert DataVersionService.scope_for(account_id) == str(account_id)
+        assert DataVersionService.scope_for(None) == "*"
+    def test_versions_track_in_place_rewrites(self):
+        assert "l.updated_at" in ACCOUNT_VERSION_SQL
+        assert "data_versions" in ACCOUNT_VERSION_SQL
+        assert "FROM account_latest_metrics)" in GLOBAL_VERSION_SQL
+        assert "FROM data_versions" in GLOBAL_VERSION_SQL
+    @pytest.mark.asyncio
+    async def test_bump_upserts_scope(self):
+        db = MagicMock()
+        db.execute = AsyncMock()
+        await DataVersionService(db).bump()
+        sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (scope) DO UPDATE" in sql
+        assert "data_versions.version + " in sql
@@ -0,0 +1,29 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.models.extra_data_blob import decode_extra_data, encode_extra_data
+from src.services.extra_data_service import ExtraDataService
+class TestExtraDataService:
+    def test_large_sub_documents_become_refs(self):
+        extra_data = {"avg_views": 120, "top_posts": [{"id": i, "views": i * 10} for i in range(50)], "tags": ["a"]}
+        encoded, blobs = encode_extra_data(extra_data, min_bytes=256)
+        assert encoded["avg_views"] == 120
+        assert encoded["tags"] == ["a"]
+        assert list(encoded["top_posts"]) == ["$blob"]
+        assert len(blobs) == 1
+    def test_identical_sub_documents_share_one_hash(self):
+        posts = [{"id": i, "views": i} for i in range(50)]
+        first, _ = encode_extra_data({"top_posts": posts}, min_bytes=64)
+        second, _ = encode_extra_data({"top_posts": [dict(post) for post in posts]}, min_bytes=64)
+        assert first == second
+    def test_decode_round_trips(self):
+        extra_data = {"metrics_30d": {"avg_likes_per_video": 1.5, "series": list(range(200))}, "sample_size": 30}
+        encoded, blobs = encode_extra_data(extra_data, min_bytes=64)
+        values = {digest: blob["value"] for digest, blob in blobs.items()}
+        assert decode_extra_data(encoded, values) == extra_data
+    @pytest.mark.asyncio
+    async def test_resolve_many_skips_lookup_without_refs(self):
+        db = MagicMock()
+        db.execute = AsyncMock()
+        documents = [{"avg_views": 1}, None]
+        assert await ExtraDataService(db).resolve_many(documents) == documents
+        db.execute.assert_not_called()
@@ -0,0 +1,37 @@
+import pytest
+from uuid import uuid4
+from src.services.growth_service import GROWTH_COUNTERS, GrowthService, change
+class TestGrowthService:
+    def test_change_with_baseline(self):
+        assert change(120, 100) == {"current": 120, "baseline": 100, "change": 20, "change_pct": 20.0}
+    def test_change_without_baseline(self):
+        assert change(120, None)["change"] is None
+        assert change(120, 0)["change_pct"] is None
+    def test_previous_period_uses_lag(self):
+        sql = GrowthService.build_sql("previous", "followers", False)
+        assert "LAG(followers_end) OVER account_periods AS followers_previous" in sql
+        assert "followers_previous AS followers_baseline" in sql
+        assert ":platform" not in sql
+    def test_start_comparison_and_platform_filter(self):
+        sql = GrowthService.build_sql("start", "total_views", True)
+        assert "total_views_start AS total_views_baseline" in sql
+        assert "AND a.platform = :platform" in sql
+    def test_rejects_unknown_rank_counter(self):
+        with pytest.raises(ValueError):
+            GrowthService.build_sql("previous", "engagement_rate", False)
+    def test_platform_totals_skip_incomparable_accounts(self):
+        def account(platform, current, baseline):
+            return {
+                "account_id": uuid4(),
+                "platform": platform,
+                "counters": {counter: change(current, baseline) for counter in GROWTH_COUNTERS},
+            }
+        platforms = GrowthService.platform_growth([
+            account("youtube", 150, 100),
+            account("youtube", 80, None),
+            account("telegram", 50, 40),
+        ])
+        youtube = next(p for p in platforms if p["platform"] == "youtube")
+        assert youtube["accounts"] == 2
+        assert youtube["counters"]["followers"]["change"] == 50
+        assert youtube["counters"]["followers"]["change_pct"] == 50.0
@@ -0,0 +1,26 @@
+import pytest
+from src.services.metric_formulas import evaluate, get_formula
+class TestMetricFormulas:
+    def test_latest_version_is_default(self):
+        assert get_formula("youtube").version == 1
+        assert get_formula("youtube", 99) is None
+    def test_unknown_platform_has_no_formula(self):
+        assert get_formula("vk") is None
+        assert evaluate("vk", {"followers": 10}) is None
+    def test_youtube_uses_30_day_views_from_extra_data(self):
+        rows = [
+            {"total_likes": 80, "total_comments": 20, "extra_data": {"metrics_30d": {"total_views": 1000}}},
+            {"total_likes": 5, "total_comments": 0, "extra_data": None},
+        ]
+        assert get_formula("youtube").apply(rows) == [10.0, 0.0]
+    def test_telegram_divides_average_views_by_subscribers(self):
+        rate, version = evaluate("telegram", {"followers": 2000, "posts_count": 10, "total_views": 5000})
+        assert rate == 25.0
+        assert version == 1
+    @pytest.mark.parametrize("row", [
+        {"followers": 0, "posts_count": 5, "total_views": 100, "total_likes": 10},
+        {"followers": 100, "posts_count": 0, "total_views": 100, "total_likes": 10},
+        {"followers": None, "posts_count": None, "total_views": None, "total_likes": None},
+    ])
+    def test_dzen_handles_empty_denominators(self, row):
+        assert get_formula("dzen").apply([row]) == [0.0]
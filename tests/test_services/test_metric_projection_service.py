@@ -0,0 +1,39 @@
+import pytest
+from datetime import datetime
+from uuid import uuid4
+from sqlalchemy.dialects import postgresql
+from src.services.metric_projection_service import KEY_FIELDS, METRIC_FIELDS, MetricProjectionService
+class TestMetricProjection:
+    def test_parse_list_strips_and_dedupes(self):
+        assert MetricProjectionService.parse_list(" followers, engagement_rate,,followers ") == ["followers", "engagement_rate"]
+        assert MetricProjectionService.parse_list(None) is None
+    def test_default_selects_every_column(self):
+        assert MetricProjectionService.select_fields(None, None) == list(METRIC_FIELDS)
+    def test_fields_keep_model_order(self):
+        selected = MetricProjectionService.select_fields(["engagement_rate", "followers", "id"], None)
+        assert selected == ["followers", "engagement_rate"]
+    def test_unknown_field_is_rejected(self):
+        with pytest.raises(ValueError, match="password"):
+            MetricProjectionService.select_fields(["followers", "password"], None)
+    def test_extra_keys_replace_full_document(self):
+        assert "extra_data" not in MetricProjectionService.select_fields(None, ["avg_reactions"])
+    def test_columns_project_extra_keys_in_sql(self):
+        columns = MetricProjectionService.columns(["followers"], ["avg_reactions"])
+        assert len(columns) == len(KEY_FIELDS) + 2
+        compiled = columns[-1].compile(dialect=postgresql.dialect())
+        assert "extra_data" in str(compiled)
+        assert "avg_reactions" in compiled.params.values()
+    def test_to_item_drops_missing_extra_keys(self):
+        row = (uuid4(), uuid4(), datetime(2026, 10, 1), 120, 4.5, None)
+        item = MetricProjectionService.to_item(row, ["followers"], ["avg_reactions", "sample_size"])
+        assert item["followers"] == 120
+        assert item["extra_data"] == {"avg_reactions": 4.5}
+        assert "engagement_rate" not in item
+    def test_dotted_extra_keys_select_heads_and_flatten(self):
+        assert MetricProjectionService.extra_heads(["metrics_7d.total_views", "metrics_7d.engagement_rate", "avg_views"]) == ["metrics_7d", "avg_views"]
+        document = {"metrics_7d": {"total_views": 10}, "avg_views": 3}
+        projected = MetricProjectionService.project_extra(document, ["metrics_7d.total_views", "metrics_7d.engagement_rate", "avg_views"])
+        assert projected == {"metrics_7d.total_views": 10, "avg_views": 3}
+    def test_extra_keys_cannot_shadow_metric_fields(self):
+        with pytest.raises(ValueError, match="followers"):
+            MetricProjectionService.select_fields(None, ["followers"])
@@ -0,0 +1,48 @@
+import json
+import pytest
+from datetime import datetime, timezone
+from uuid import uuid4
+from src.services.metric_stream_service import (
+    ARROW_END_OF_STREAM,
+    arrow_schema,
+    encode_arrow_batch,
+    encode_ndjson,
+)
+class TestMetricStreamEncoding:
+    def test_ndjson_emits_one_line_per_item(self):
+        metric_id = uuid4()
+        collected_at = datetime(2026, 10, 1, 12, 0, tzinfo=timezone.utc)
+        payload = encode_ndjson([
+            {"id": metric_id, "collected_at": collected_at, "followers": 10},
+            {"id": metric_id, "collected_at": collected_at, "followers": 11},
+        ])
+        lines = payload.decode("utf-8").splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[0]) == {"id": str(metric_id), "collected_at": collected_at.isoformat(), "followers": 10}
+    def test_arrow_schema_types_extra_keys_from_sample(self):
+        pa = pytest.importorskip("pyarrow")
+        sample = [{"extra_data": {"avg_views": 10, "recent_videos": [{"id": "a"}]}}, {"extra_data": {"avg_views": 2.5}}]
+        schema = arrow_schema(["id", "followers"], ["avg_views", "recent_videos", "missing"], sample)
+        assert schema.names == ["id", "followers", "avg_views", "recent_videos", "missing"]
+        assert schema.field("avg_views").type == pa.float64()
+        assert schema.field("recent_videos").metadata == {b"encoding": b"json"}
+        assert schema.field("missing").type == pa.string()
+    def test_arrow_stream_round_trip(self):
+        pa = pytest.importorskip("pyarrow")
+        items = [{
+            "id": uuid4(),
+            "account_id": uuid4(),
+            "collected_at": datetime(2026, 10, 1, tzinfo=timezone.utc),
+            "followers": 120,
+            "engagement_rate": 3.5,
+            "extra_data": {"avg_reactions": 4, "metrics_30d.total_views": 900, "recent_videos": [{"id": "a"}]},
+        }]
+        extra_keys = ["avg_reactions", "metrics_30d.total_views", "recent_videos"]
+        schema = arrow_schema(["id", "account_id", "collected_at", "followers", "engagement_rate"], extra_keys, items)
+        payload = schema.serialize().to_pybytes() + encode_arrow_batch(schema, items, extra_keys) + ARROW_END_OF_STREAM
+        table = pa.ipc.open_stream(payload).read_all()
+        assert table.num_rows == 1
+        assert table.column("followers").to_pylist() == [120]
+        assert table.column("avg_reactions").to_pylist() == [4.0]
+        assert table.column("metrics_30d.total_views").to_pylist() == [900.0]
+        assert json.loads(table.column("recent_videos")[0].as_py()) == [{"id": "a"}]
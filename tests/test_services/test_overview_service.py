@@ -0,0 +1,22 @@
+from src.services.overview_service import LATEST_IN_RANGE_SQL, LATEST_SQL, PLATFORM_TOTALS_SQL, OverviewService
+class TestOverviewService:
+    def test_summary_averages_platforms_with_engagement(self):
+        platforms = [
+            {"accounts": 3, "active_accounts": 2, "followers": 1000, "posts": 10, "avg_engagement_rate": 4.0},
+            {"accounts": 1, "active_accounts": 1, "followers": 500, "posts": 5, "avg_engagement_rate": 2.0},
+            {"accounts": 2, "active_accounts": 0, "followers": 0, "posts": 0, "avg_engagement_rate": None},
+        ]
+        summary = OverviewService.summarize(platforms)
+        assert summary["total_accounts"] == 6
+        assert summary["active_accounts"] == 3
+        assert summary["total_followers"] == 1500
+        assert summary["total_posts"] == 15
+        assert summary["avg_engagement_rate"] == 3.0
+    def test_summary_of_no_platforms(self):
+        assert OverviewService.summarize([])["avg_engagement_rate"] == 0.0
+    def test_current_state_reads_latest_table(self):
+        assert "FROM account_latest_metrics" in PLATFORM_TOTALS_SQL.format(latest=LATEST_SQL)
+    def test_period_picks_last_daily_bucket_per_account(self):
+        sql = PLATFORM_TOTALS_SQL.format(latest=LATEST_IN_RANGE_SQL)
+        assert "row_number() OVER (PARTITION BY account_id ORDER BY bucket_start DESC)" in sql
+        assert "WHERE position = 1" in sql
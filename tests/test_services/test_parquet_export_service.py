@@ -0,0 +1,45 @@
+import pytest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+from src.services.parquet_export_service import (
+    EXTRA_PREFIX,
+    ExportFilters,
+    ParquetExportService,
+    coerce_value,
+    extra_column_type,
+    flatten_extra_data,
+    parquet_schema,
+)
+class TestParquetExportHelpers:
+    def test_flatten_nested_scalars_and_skip_lists(self):
+        document = {"avg_views": 10.5, "metrics_30d": {"engagement_rate": 2.0}, "recent_videos": [{"id": 1}]}
+        assert dict(flatten_extra_data(document)) == {"avg_views": 10.5, "metrics_30d.engagement_rate": 2.0}
+    def test_column_types(self):
+        assert extra_column_type(["number"], True) == "int64"
+        assert extra_column_type(["number"], False) == "float64"
+        assert extra_column_type(["boolean"], True) == "bool"
+        assert extra_column_type(["number", "string"], True) == "string"
+    def test_coerce_value(self):
+        assert coerce_value("int64", 3.0) == 3
+        assert coerce_value("int64", "3") is None
+        assert coerce_value("string", 5) == "5"
+        assert coerce_value("bool", 1) is None
+    def test_filters_lowercase_platform(self):
+        assert ExportFilters(platform="YouTube").params()["platform"] == "youtube"
+    def test_query_is_ordered_by_collection_time(self):
+        query = ParquetExportService.build_query(ExportFilters(platform="telegram"))
+        assert "ORDER BY metrics.collected_at, metrics.id" in str(query)
+    def test_table_has_typed_flattened_columns(self):
+        pytest.importorskip("pyarrow")
+        extra_columns = [("avg_views", "float64"), ("auth_mode", "string")]
+        schema = parquet_schema(extra_columns)
+        row = SimpleNamespace(
+            id=uuid4(), account_id=uuid4(), platform="telegram",
+            collected_at=datetime(2026, 10, 1, tzinfo=timezone.utc), followers=100, posts_count=5,
+            total_likes=None, total_comments=None, total_views=900, total_shares=None,
+            engagement_rate=1.5, formula_version=1,
+        )
+        table = ParquetExportService.to_table(schema, [row], [{"avg_views": 12, "auth_mode": "bot"}], extra_columns)
+        assert table.column(f"{EXTRA_PREFIX}avg_views").to_pylist() == [12.0]
+        assert table.column(f"{EXTRA_PREFIX}auth_mode").to_pylist() == ["bot"]
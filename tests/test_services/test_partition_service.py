@@ -0,0 +1,60 @@
+import pytest
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+from src.services import partition_service, retention_service
+from src.services.partition_service import PartitionService
+class TestPartitionService:
+    def test_partition_name_round_trip(self):
+        name = PartitionService.partition_name(date(2026, 3, 1))
+        assert name == "metrics_y2026m03"
+        assert PartitionService.parse_partition_name(name) == date(2026, 3, 1)
+        assert PartitionService.parse_partition_name("metrics_default") is None
+    def test_months_to_create_crosses_year(self):
+        months = PartitionService.months_to_create(date(2026, 11, 19), 3)
+        assert months == [date(2026, 11, 1), date(2026, 12, 1), date(2027, 1, 1), date(2027, 2, 1)]
+    @pytest.mark.asyncio
+    async def test_new_month_pulls_rows_out_of_default_partition(self):
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[
+            MagicMock(all=MagicMock(return_value=[("metrics_default",), ("metrics_y2026m10",)])),
+            MagicMock(scalar_one=MagicMock(return_value="id, account_id, collected_at")),
+            MagicMock(),
+            MagicMock(rowcount=2),
+            MagicMock(),
+            MagicMock(),
+        ])
+        db.commit = AsyncMock()
+        created = await PartitionService(db).ensure_partitions(months_ahead=1, today=date(2026, 10, 19))
+        assert created == ["metrics_y2026m11"]
+        statements = [str(call.args[0]) for call in db.execute.await_args_list]
+        assert statements[3].startswith("WITH moved AS (DELETE FROM metrics_default")
+        assert "PARTITION OF metrics" in statements[4]
+        assert statements[5].startswith("INSERT INTO metrics (id, account_id, collected_at)")
+    def test_bounds_are_utc_month_edges(self):
+        assert PartitionService._bounds(date(2026, 12, 1)) == ("2026-12-01 00:00:00+00", "2027-01-01 00:00:00+00")
+    def test_expired_partitions_are_entirely_older_than_cutoff(self):
+        partitions = ["metrics_default", "metrics_y2025m09", "metrics_y2025m10", "metrics_y2025m11"]
+        assert PartitionService.expired_partitions(partitions, date(2025, 10, 31)) == ["metrics_y2025m09"]
+        assert PartitionService.expired_partitions(partitions, date(2025, 11, 1)) == ["metrics_y2025m09", "metrics_y2025m10"]
+    @pytest.mark.asyncio
+    async def test_drop_expired_uses_longest_daily_policy(self, monkeypatch):
+        monkeypatch.setattr(partition_service.settings, "retention_enabled", True)
+        monkeypatch.setattr(retention_service.settings, "retention_daily_days", 365)
+        monkeypatch.setattr(retention_service.settings, "retention_platform_overrides", {"telegram": {"daily_days": 400}})
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=MagicMock(
+            all=MagicMock(return_value=[("metrics_y2025m08",), ("metrics_y2025m09",), ("metrics_y2025m10",)])
+        ))
+        db.commit = AsyncMock()
+        dropped = await PartitionService(db).drop_expired(now=datetime(2026, 10, 19, tzinfo=timezone.utc))
+        assert dropped == ["metrics_y2025m08"]
+        statements = [str(call.args[0]) for call in db.execute.await_args_list]
+        assert "ALTER TABLE metrics DETACH PARTITION metrics_y2025m08" in statements
+        assert "DROP TABLE metrics_y2025m08" in statements
+    @pytest.mark.asyncio
+    async def test_drop_expired_is_off_without_retention(self, monkeypatch):
+        monkeypatch.setattr(partition_service.settings, "retention_enabled", False)
+        db = MagicMock()
+        db.execute = AsyncMock()
+        assert await PartitionService(db).drop_expired() == []
+        db.execute.assert_not_awaited()
@@ -0,0 +1,62 @@
+import httpx
+import pytest
+import requests
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from src.services.platform_health_service import PlatformHealthService, is_transport_error
+def make_parser(available: bool = True) -> MagicMock:
+    parser = MagicMock()
+    parser.is_available = AsyncMock(return_value=available)
+    return parser
+class TestPlatformHealthService:
+    @pytest.mark.asyncio
+    async def test_probe_is_cached_within_ttl(self):
+        service = PlatformHealthService(ttl_seconds=600, failure_threshold=3)
+        first = make_parser()
+        second = make_parser()
+        assert await service.ensure_available("youtube", first) is True
+        assert await service.ensure_available("youtube", second) is True
+        first.is_available.assert_awaited_once()
+        second.is_available.assert_not_called()
+    @pytest.mark.asyncio
+    async def test_probe_repeats_after_ttl(self):
+        service = PlatformHealthService(ttl_seconds=600, failure_threshold=3)
+        await service.ensure_available("vk", make_parser())
+        service.get_state("vk").checked_at = datetime.utcnow() - timedelta(seconds=601)
+        parser = make_parser(available=False)
+        assert await service.ensure_available("vk", parser) is False
+        parser.is_available.assert_awaited_once()
+    @pytest.mark.asyncio
+    async def test_failures_mark_platform_unavailable(self):
+        service = PlatformHealthService(ttl_seconds=600, failure_threshold=2)
+        await service.ensure_available("wibes", make_parser())
+        service.record_failure("wibes", "498 bot page")
+        assert service.get_state("wibes").available is True
+        service.record_failure("wibes", "498 bot page")
+        state = service.get_state("wibes")
+        assert state.available is False
+        assert state.last_error == "498 bot page"
+        parser = make_parser()
+        assert await service.ensure_available("wibes", parser) is False
+        parser.is_available.assert_not_called()
+    @pytest.mark.asyncio
+    async def test_success_resets_failures(self):
+        service = PlatformHealthService(ttl_seconds=600, failure_threshold=2)
+        service.record_failure("dzen")
+        service.record_success("dzen")
+        state = service.get_state("dzen")
+        assert state.available is True
+        assert state.consecutive_failures == 0
+    def test_reset_clears_state(self):
+        service = PlatformHealthService(ttl_seconds=600, failure_threshold=2)
+        service.record_success("telegram")
+        service.reset("telegram")
+        assert service.get_state("telegram") is None
+class TestTransportErrors:
+    def test_network_errors_count_toward_platform_health(self):
+        assert is_transport_error(ConnectionResetError())
+        assert is_transport_error(httpx.ConnectTimeout("timed out"))
+        assert is_transport_error(requests.ReadTimeout("timed out"))
+    def test_account_errors_do_not(self):
+        assert not is_transport_error(ValueError("Channel is private"))
+        assert not is_transport_error(httpx.HTTPStatusError("404", request=MagicMock(), response=MagicMock()))
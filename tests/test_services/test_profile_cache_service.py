@@ -0,0 +1,48 @@
+from datetime import datetime, timedelta
+from src.services.profile_cache_service import ProfileCacheService
+SLOW_FIELDS = {
+    "bio_description": "profile",
+    "avatar_url": "profile",
+    "audience_insights": "audience",
+}
+class TestProfileCacheService:
+    def test_empty_cache_has_no_fresh_groups(self):
+        assert ProfileCacheService.compute_fresh_groups(SLOW_FIELDS, []) == set()
+    def test_recently_refreshed_group_is_fresh(self):
+        now = datetime(2026, 1, 10, 12, 0)
+        cached = [
+            ("bio_description", now - timedelta(hours=2)),
+            ("avatar_url", now - timedelta(hours=2)),
+            ("audience_insights", now - timedelta(days=2)),
+        ]
+        fresh = ProfileCacheService.compute_fresh_groups(SLOW_FIELDS, cached, now=now)
+        assert fresh == {"profile", "audience"}
+    def test_expired_group_is_stale(self):
+        now = datetime(2026, 1, 10, 12, 0)
+        cached = [
+            ("bio_description", now - timedelta(days=2)),
+            ("avatar_url", now - timedelta(hours=1)),
+            ("audience_insights", now - timedelta(days=8)),
+        ]
+        fresh = ProfileCacheService.compute_fresh_groups(SLOW_FIELDS, cached, now=now)
+        assert fresh == set()
+    def test_partially_cached_group_is_stale(self):
+        now = datetime(2026, 1, 10, 12, 0)
+        cached = [("bio_description", now - timedelta(hours=1))]
+        fresh = ProfileCacheService.compute_fresh_groups(SLOW_FIELDS, cached, now=now)
+        assert "profile" not in fresh
+    def test_split_removes_slow_fields_from_extra_data(self):
+        extra_data = {
+            "display_name": "NIGIN Art",
+            "bio_description": "Official channel",
+            "avatar_url": "https://example.com/a.jpg",
+            "audience_insights": {"age_distribution": {}},
+        }
+        refreshed = ProfileCacheService.split_slow_fields(SLOW_FIELDS, extra_data, {"audience"})
+        assert extra_data == {"display_name": "NIGIN Art"}
+        assert refreshed == {
+            "bio_description": "Official channel",
+            "avatar_url": "https://example.com/a.jpg",
+        }
+    def test_split_handles_missing_extra_data(self):
+        assert ProfileCacheService.split_slow_fields(SLOW_FIELDS, None, set()) == {}
@@ -0,0 +1,21 @@
+from unittest.mock import MagicMock, patch
+from src.services.raw_payload_service import RawPayloadService
+class TestRawPayloadService:
+    def test_compression_round_trips(self):
+        content = ("<div class='post'>views 1 234</div>" * 200).encode("utf-8")
+        compressed = RawPayloadService.compress(content)
+        assert len(compressed) < len(content)
+        assert RawPayloadService.decompress(compressed) == content
+    def test_archives_only_enabled_platforms_with_archive_support(self):
+        parser = MagicMock()
+        parser.ARCHIVE_KINDS = ("channel_html",)
+        with patch("src.services.raw_payload_service.settings") as mock_settings:
+            mock_settings.raw_archive_enabled = True
+            mock_settings.raw_archive_platforms = ["dzen"]
+            assert RawPayloadService.should_archive("Dzen", parser)
+            assert not RawPayloadService.should_archive("wibes", parser)
+            parser.ARCHIVE_KINDS = ()
+            assert not RawPayloadService.should_archive("dzen", parser)
+            mock_settings.raw_archive_enabled = False
+            parser.ARCHIVE_KINDS = ("channel_html",)
+            assert not RawPayloadService.should_archive("dzen", parser)
@@ -0,0 +1,27 @@
+from datetime import datetime
+from uuid import uuid4
+from src.services.reparse_service import ReparseService
+def make_row(**values) -> dict:
+    row = {
+        "metric_id": uuid4(),
+        "collected_at": datetime(2026, 10, 1),
+        "followers": 2000,
+        "posts_count": 10,
+        "total_likes": None,
+        "total_comments": None,
+        "total_views": 5000,
+        "total_shares": None,
+        "engagement_rate": 3.0,
+        "extra_data": {},
+    }
+    row.update(values)
+    return row
+class TestReparseFormulas:
+    def test_registered_formula_replaces_parser_rate(self):
+        values = ReparseService.apply_formula("telegram", make_row())
+        assert values["engagement_rate"] == 25.0
+        assert values["formula_version"] == 1
+    def test_unregistered_platform_keeps_parser_rate_without_version(self):
+        values = ReparseService.apply_formula("vk", make_row())
+        assert values["engagement_rate"] == 3.0
+        assert values["formula_version"] is None
@@ -0,0 +1,75 @@
+import pytest
+from uuid import uuid4
+from src.services import response_cache
+from src.services.response_cache import MemoryCacheBackend, ResponseCache, cached_response
+@pytest.fixture
+def cache(monkeypatch) -> ResponseCache:
+    cache = ResponseCache(MemoryCacheBackend(max_entries=2, ttl_seconds=60))
+    monkeypatch.setattr(response_cache, "get_response_cache", lambda: cache)
+    return cache
+class TestMemoryCacheBackend:
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        backend = MemoryCacheBackend(max_entries=2, ttl_seconds=60)
+        await backend.set("a", 1)
+        await backend.set("b", 2)
+        await backend.get("a")
+        await backend.set("c", 3)
+        assert await backend.get("a") == 1
+        assert await backend.get("b") is None
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_dropped(self):
+        backend = MemoryCacheBackend(max_entries=2, ttl_seconds=-1)
+        await backend.set("a", 1)
+        assert await backend.get("a") is None
+class TestCachedResponse:
+    @pytest.mark.asyncio
+    async def test_serves_cached_until_account_version_bumps(self, cache):
+        calls = []
+        @cached_response()
+        async def endpoint(account_id, limit=10):
+            calls.append(account_id)
+            return {"account_id": account_id, "count": len(calls)}
+        account_id = uuid4()
+        first = await endpoint(account_id=account_id, limit=10)
+        second = await endpoint(account_id=account_id, limit=10)
+        assert len(calls) == 1
+        assert second == {"account_id": str(account_id), "count": 1}
+        assert first["count"] == 1
+        await cache.bump(uuid4())
+        await endpoint(account_id=account_id, limit=10)
+        assert len(calls) == 1
+        await cache.bump(account_id)
+        third = await endpoint(account_id=account_id, limit=10)
+        assert third["count"] == 2
+    @pytest.mark.asyncio
+    async def test_params_are_part_of_the_key(self, cache):
+        calls = []
+        @cached_response()
+        async def endpoint(account_id, limit=10):
+            calls.append(limit)
+            return calls[:]
+        account_id = uuid4()
+        await endpoint(account_id=account_id, limit=5)
+        await endpoint(account_id=account_id, limit=6)
+        assert calls == [5, 6]
+    @pytest.mark.asyncio
+    async def test_invalidate_all_clears_every_scope(self, cache):
+        calls = []
+        @cached_response()
+        async def endpoint(account_id=None):
+            calls.append(1)
+            return len(calls)
+        await endpoint(account_id=None)
+        await cache.invalidate_all()
+        assert await endpoint(account_id=None) == 2
+    @pytest.mark.asyncio
+    async def test_disabled_cache_calls_through(self, monkeypatch):
+        monkeypatch.setattr(response_cache, "get_response_cache", lambda: ResponseCache(None))
+        calls = []
+        @cached_response()
+        async def endpoint(account_id):
+            calls.append(1)
+            return len(calls)
+        await endpoint(account_id="a")
+        assert await endpoint(account_id="a") == 2
@@ -0,0 +1,33 @@
+from datetime import datetime, timezone
+from unittest.mock import patch
+from src.services.retention_service import RetentionService
+class TestRetentionService:
+    def test_policy_uses_platform_override(self):
+        with patch("src.services.retention_service.settings") as mock_settings:
+            mock_settings.retention_raw_days = 30
+            mock_settings.retention_daily_days = 365
+            mock_settings.retention_platform_overrides = {"telegram": {"raw_days": 60}}
+            telegram = RetentionService.policy_for("Telegram")
+            youtube = RetentionService.policy_for("youtube")
+        assert (telegram.raw_days, telegram.daily_days) == (60, 365)
+        assert (youtube.raw_days, youtube.daily_days) == (30, 365)
+    def test_day_windows_stop_before_partial_day(self):
+        start = datetime(2026, 9, 1, 15, 30, tzinfo=timezone.utc)
+        end = datetime(2026, 9, 4, 6, 0, tzinfo=timezone.utc)
+        windows = list(RetentionService.day_windows(start, end))
+        assert windows[0] == (datetime(2026, 9, 1, tzinfo=timezone.utc), datetime(2026, 9, 2, tzinfo=timezone.utc))
+        assert windows[-1][1] == datetime(2026, 9, 4, tzinfo=timezone.utc)
+        assert len(windows) == 3
+    def test_day_windows_empty_when_inside_raw_window(self):
+        start = datetime(2026, 9, 10, tzinfo=timezone.utc)
+        assert list(RetentionService.day_windows(start, datetime(2026, 9, 10, 12, tzinfo=timezone.utc))) == []
+    def test_raw_cutoff_is_start_of_first_intact_day(self):
+        with patch("src.services.retention_service.settings") as mock_settings:
+            mock_settings.retention_enabled = True
+            mock_settings.retention_raw_days = 30
+            mock_settings.retention_platform_overrides = {}
+            cutoff = RetentionService.raw_cutoff("youtube", datetime(2026, 10, 19, 15, 30, tzinfo=timezone.utc))
+            mock_settings.retention_enabled = False
+            disabled = RetentionService.raw_cutoff("youtube")
+        assert cutoff == datetime(2026, 9, 19, tzinfo=timezone.utc)
+        assert disabled is None
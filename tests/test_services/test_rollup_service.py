@@ -0,0 +1,41 @@
+import pytest
+from datetime import datetime, timezone, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from src.services.rollup_service import RollupService
+class TestRollupService:
+    def test_bucket_start_truncates_in_utc(self):
+        collected_at = datetime(2026, 10, 22, 1, 45, 12, tzinfo=timezone(timedelta(hours=3)))
+        assert RollupService.bucket_start(collected_at, "hour") == datetime(2026, 10, 21, 22, 0, tzinfo=timezone.utc)
+        assert RollupService.bucket_start(collected_at, "day") == datetime(2026, 10, 21, tzinfo=timezone.utc)
+        assert RollupService.bucket_start(collected_at, "week") == datetime(2026, 10, 19, tzinfo=timezone.utc)
+    def test_naive_timestamps_are_treated_as_utc(self):
+        assert RollupService.bucket_start(datetime(2026, 10, 19, 7, 30), "hour") == datetime(2026, 10, 19, 7, 0, tzinfo=timezone.utc)
+    def test_unknown_granularity_rejected(self):
+        with pytest.raises(ValueError):
+            RollupService.bucket_start(datetime(2026, 10, 19), "month")
+    def test_sample_values_count_only_present_fields(self):
+        row = RollupService.sample_values({"followers": 120, "engagement_rate": None})
+        assert row["followers_last"] == 120
+        assert row["followers_sum"] == 120
+        assert row["followers_count"] == 1
+        assert row["engagement_rate_count"] == 0
+        assert row["total_views_min"] is None
+    def test_first_full_bucket_rounds_up_partial_buckets(self):
+        cutoff = datetime(2026, 9, 16, tzinfo=timezone.utc)
+        assert RollupService.first_full_bucket(cutoff, "day") == cutoff
+        assert RollupService.first_full_bucket(cutoff, "week") == datetime(2026, 9, 21, tzinfo=timezone.utc)
+    @pytest.mark.asyncio
+    async def test_rebuild_never_reaches_below_raw_cutoff(self):
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=MagicMock(rowcount=0))
+        db.commit = AsyncMock()
+        await RollupService(db).rebuild(
+            since=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            not_before=datetime(2026, 9, 16, tzinfo=timezone.utc)
+        )
+        since = {call.args[1]["unit"]: call.args[1]["since"] for call in db.execute.await_args_list}
+        assert since == {
+            "hour": datetime(2026, 9, 16, tzinfo=timezone.utc),
+            "day": datetime(2026, 9, 16, tzinfo=timezone.utc),
+            "week": datetime(2026, 9, 21, tzinfo=timezone.utc),
+        }
@@ -9,7 +9,8 @@ class TestSchedulerService:
         with patch('src.services.scheduler_service.AsyncIOScheduler') as mock_scheduler_class:
             mock_scheduler_instance = MagicMock()
             mock_scheduler_class.return_value = mock_scheduler_instance
-            with patch.object(scheduler, '_collection_job', new_callable=AsyncMock):
+            with patch.object(scheduler, '_collection_job', new_callable=AsyncMock), \
+                 patch.object(scheduler, '_partition_maintenance_job', new_callable=AsyncMock):
                 await scheduler.start()
                 assert scheduler._running is True
                 mock_scheduler_instance.start.assert_called_once()
@@ -39,7 +40,8 @@ class TestSchedulerService:
         scheduler = SchedulerService()
         with patch('src.services.scheduler_service.AsyncIOScheduler') as mock_scheduler_class:
             mock_scheduler_class.side_effect = Exception("Scheduler initialization failed")
-            with patch.object(scheduler, '_collection_job', new_callable=AsyncMock):
+            with patch.object(scheduler, '_collection_job', new_callable=AsyncMock), \
+                 patch.object(scheduler, '_partition_maintenance_job', new_callable=AsyncMock):
                 await scheduler.start()
                 assert scheduler._running is False
     @pytest.mark.asyncio
@@ -50,7 +52,8 @@ class TestSchedulerService:
             mock_scheduler_class.return_value = mock_scheduler_instance
             with patch('src.services.scheduler_service.settings') as mock_settings:
                 mock_settings.collect_interval_hours = 12
-                with patch.object(scheduler, '_collection_job', new_callable=AsyncMock):
+                with patch.object(scheduler, '_collection_job', new_callable=AsyncMock), \
+                     patch.object(scheduler, '_partition_maintenance_job', new_callable=AsyncMock):
                     await scheduler.start()
                     call_kwargs = mock_scheduler_instance.add_job.call_args[1]
                     trigger = call_kwargs['trigger']
@@ -73,3 +76,18 @@ class TestSchedulerService:
             with patch('src.services.scheduler_service.CollectorService') as mock_collector:
                 mock_collector.side_effect = Exception("Collection failed")
                 await scheduler._collection_job()
+    def test_failed_accounts_schedule_retry_with_backoff(self):
+        scheduler = SchedulerService()
+        scheduler.scheduler = MagicMock()
+        result = MagicMock()
+        result.status = 'partial'
+        result.accounts_failed = 1
+        result.accounts_timed_out = 0
+        with patch('src.services.scheduler_service.settings') as mock_settings:
+            mock_settings.collection_retry_attempts = 2
+            mock_settings.collection_retry_backoff_minutes = 10
+            scheduler._schedule_retry(result, attempt=2)
+            assert scheduler.scheduler.add_job.call_args.kwargs['args'] == [result.log_id, 2]
+            scheduler.scheduler.add_job.reset_mock()
+            scheduler._schedule_retry(result, attempt=3)
+            scheduler.scheduler.add_job.assert_not_called()
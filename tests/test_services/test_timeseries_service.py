@@ -0,0 +1,27 @@
+import pytest
+from src.services.timeseries_service import TimeseriesService
+class TestTimeseriesService:
+    def test_rejects_unknown_metric(self):
+        with pytest.raises(ValueError, match="password"):
+            TimeseriesService.validate(["followers", "password"], "day", "last")
+    def test_rejects_empty_metrics(self):
+        with pytest.raises(ValueError):
+            TimeseriesService.validate([], "day", "last")
+    def test_split_prefers_rollups(self):
+        rollup, raw = TimeseriesService.split_metrics(["followers", "total_shares", "youtube_avg_likes_30d"])
+        assert rollup == ["followers"]
+        assert raw == ["total_shares", "youtube_avg_likes_30d"]
+    def test_month_buckets_read_daily_rollups(self):
+        sql = TimeseriesService.build_sql(["followers"], "last", "day", [])
+        assert "FROM metrics_rollup_day" in sql
+        assert "date_trunc(:unit, bucket_start AT TIME ZONE 'UTC')" in sql
+        assert "followers_last" in sql
+    def test_rollup_average_uses_sums_and_counts(self):
+        assert TimeseriesService.rollup_expression("engagement_rate", "avg") == (
+            "(sum(engagement_rate_sum) / NULLIF(sum(engagement_rate_count), 0))::double precision"
+        )
+    def test_raw_filters_use_collected_at(self):
+        sql = TimeseriesService.build_sql(["total_shares"], "max", "raw", ["{time} <= :end"])
+        assert "FROM metrics" in sql
+        assert "collected_at <= :end" in sql
+        assert "max(total_shares) AS total_shares" in sql